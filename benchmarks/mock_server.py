@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the SharePoint REST API used by the benchmarks
+
+Emulates the _api endpoints SharePointClient relies on, with in-memory
+state: lists and list items (with __next paging and simple ID filters),
+item change logs (GetChanges), RenderListDataAsStream, $batch, file upload
+(Files/add and upload sessions) and download ($value with Range support),
+and search. A fraction of requests can be rejected with 429 to exercise the
+retry path, and chosen calls can be failed on demand (MockSharePoint.fail).
+
+Run standalone with:
+    python -m benchmarks.mock_server --port 8000 --items 20000
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+SITE_PATH = "/sites/bench"
+
+# List titles are OData string literals, in which an apostrophe is written twice
+_ITEMS = re.compile(r"^web/lists/getbytitle\('((?:[^']|'')*)'\)/items(?:\((\d+)\))?$")
+_LIST = re.compile(r"^web/lists/getbytitle\('((?:[^']|'')*)'\)$")
+_LIST_CALL = re.compile(r"^web/lists/getbytitle\('((?:[^']|'')*)'\)/(GetChanges|RenderListDataAsStream)$")
+_FILE_ADD = re.compile(r"^web/GetFolderByServerRelativeUrl\('([^']*)'\)/Files/add\(url='([^']*)',overwrite=true\)$")
+_UPLOAD = re.compile(
+    r"^web/GetFolderByServerRelativeUrl\('([^']*)'\)/Files\('([^']*)'\)/"
+    r"(StartUpload|ContinueUpload|FinishUpload)\(uploadId=guid'([^']*)'(?:,fileOffset=(\d+))?\)$"
+)
+_FILE = re.compile(r"^web/GetFileByServerRelativeUrl\('([^']*)'\)(/\$value)?$")
+_ID_FILTER = re.compile(r"ID (ge|gt|lt|le|eq) (\d+)")
+_ROW_LIMIT = re.compile(r"<RowLimit[^>]*>(\d+)</RowLimit>")
+_VIEW_FIELD = re.compile(r"<FieldRef Name=\"([^\"]+)\"/>")
+_BATCH_OPERATION = re.compile(r"^(GET|POST|PUT|PATCH|MERGE|DELETE) (\S+) HTTP/1\.1$")
+
+_STATUS_REASONS = {200: "OK", 201: "Created", 204: "No Content", 304: "Not Modified", 400: "Bad Request",
+                   404: "Not Found", 503: "Service Unavailable"}
+
+# SP.ChangeType values recorded in item change logs
+_CHANGE_ADD, _CHANGE_UPDATE, _CHANGE_DELETE = 1, 2, 3
+
+
+class MockSharePoint:
+    """In-memory SharePoint site state shared by the request handlers"""
+
+    def __init__(self, item_count: int = 0, throttle_rate: float = 0.0, seed: int = 0):
+        """
+        Initialize site
+
+        Args:
+            item_count: Number of items pre-populated in the "Bench" list
+            throttle_rate: Fraction of requests rejected with 429 and Retry-After: 0
+            seed: Seed of the throttling decisions, for reproducible runs
+        """
+        self.lock = threading.Lock()
+        self.lists: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, bytearray] = {}
+        self.uploads: Dict[str, bytearray] = {}
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.throttled = 0
+        self.failures: List[List[Any]] = []
+        self.create_list("Bench", item_count)
+
+    def create_list(self, title: str, item_count: int = 0) -> None:
+        """Create (or replace) a list populated with generated items"""
+        with self.lock:
+            self.lists[title.lower()] = {
+                "Id": str(uuid.uuid4()),
+                "Title": title,
+                "EntityType": f"SP.Data.{title.replace(' ', '_x0020_')}ListItem",
+                "NextId": item_count + 1,
+                "Items": {
+                    item_id: {"Id": item_id, "ID": item_id, "Title": f"Item {item_id}", "Status": "Open"}
+                    for item_id in range(1, item_count + 1)
+                },
+                "Changes": []
+            }
+
+    def record_change(self, data: Dict[str, Any], change_type: int, item_id: int) -> None:
+        """Append an item change to a list's change log; call with the lock held"""
+        data["Changes"].append({
+            "ChangeType": change_type,
+            "ItemId": item_id,
+            "ChangeToken": {"StringValue": change_token(data, len(data["Changes"]) + 1)}
+        })
+
+    def fail(self, endpoint: str, status: int = 503, times: int = 1) -> None:
+        """
+        Answer the next calls to an endpoint with an error
+
+        Args:
+            endpoint: Substring of the request path (after _api/) to match
+            status: HTTP status of the error responses
+            times: Number of calls to fail
+        """
+        with self.lock:
+            self.failures.append([endpoint, status, times])
+
+    def injected_failure(self, endpoint: str) -> Optional[int]:
+        """Status to fail a call with, if a failure was injected for it"""
+        with self.lock:
+            for failure in self.failures:
+                if failure[0] in endpoint and failure[2] > 0:
+                    failure[2] -= 1
+                    return failure[1]
+            return None
+
+    def should_throttle(self) -> bool:
+        with self.lock:
+            self.requests += 1
+            if self.throttle_rate and self.random.random() < self.throttle_rate:
+                self.throttled += 1
+                return True
+            return False
+
+
+def change_token(data: Dict[str, Any], position: int) -> str:
+    """Change token of a list after its position-th change"""
+    return f"1;3;{data['Id']};{position}"
+
+
+def _collection(items: List[Dict[str, Any]], verbose: bool, next_link: Optional[str] = None) -> Dict[str, Any]:
+    if verbose:
+        body: Dict[str, Any] = {"results": items}
+        if next_link:
+            body["__next"] = next_link
+        return {"d": body}
+    body = {"value": items}
+    if next_link:
+        body["odata.nextLink"] = next_link
+    return body
+
+
+def _entity(item: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
+    return {"d": item} if verbose else item
+
+
+def _http_part(status: int, content: str) -> List[str]:
+    """Lines of an embedded HTTP response in a $batch response"""
+    return [
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        f"HTTP/1.1 {status} {_STATUS_REASONS.get(status, 'Error')}",
+        "CONTENT-TYPE: application/json;odata=minimalmetadata",
+        "",
+        content
+    ]
+
+
+class MockSharePointHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching _api calls to the shared MockSharePoint state"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs add ~40 ms per call
+    disable_nagle_algorithm = True
+    site: MockSharePoint
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep benchmark output readable
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if self.site.should_throttle():
+            self._respond(429, b"", headers={"Retry-After": "0"})
+            return
+
+        parts = urlsplit(self.path)
+        prefix = f"{SITE_PATH}/_api/"
+        if not parts.path.startswith(prefix):
+            self._respond(404, b"")
+            return
+
+        method = self.headers.get("X-HTTP-Method") or method
+        endpoint = unquote(parts.path[len(prefix):])
+
+        status = self.site.injected_failure(endpoint)
+        if status is not None:
+            self._respond(status, {"error": {"message": {"value": "Injected failure"}}})
+            return
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        verbose = "odata=verbose" in (self.headers.get("Accept") or "")
+
+        if endpoint == "$batch":
+            self._handle_batch(body, verbose)
+            return
+
+        status, payload, headers = self.route(method, endpoint, query, body, verbose)
+        self._respond(status, payload, headers)
+
+    def route(self, method: str, endpoint: str, query: Dict[str, str], body: bytes,
+              verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Handle one REST call
+
+        Returns:
+            Tuple of (status, payload, headers); dict payloads are sent as JSON, bytes as-is
+        """
+        site = self.site
+
+        if endpoint == "web" and method == "GET":
+            return 200, _entity({"Id": "bench-web", "Title": "Bench", "Url": SITE_PATH}, verbose), {}
+
+        if endpoint == "web/lists" and method == "GET":
+            with site.lock:
+                lists = [{"Id": data["Id"], "Title": data["Title"], "ItemCount": len(data["Items"])}
+                         for data in site.lists.values()]
+            etag = f'"{zlib.crc32(json.dumps(lists).encode("utf-8"))}"'
+            if self.headers.get("If-None-Match") == etag:
+                return 304, b"", {"ETag": etag}
+            return 200, _collection(lists, verbose), {"ETag": etag}
+
+        if endpoint == "web/lists" and method == "POST":
+            title = json.loads(body or b"{}").get("Title") or "Untitled"
+            site.create_list(title)
+            data = site.lists[title.lower()]
+            return 201, _entity({"Id": data["Id"], "Title": title, "ItemCount": 0}, verbose), {}
+
+        match = _LIST.match(endpoint)
+        if match and method == "GET":
+            data = site.lists.get(match.group(1).replace("''", "'").lower())
+            if data is None:
+                return 404, {"error": {"message": {"value": "List does not exist"}}}, {}
+            return 200, _entity({
+                "Id": data["Id"],
+                "ItemCount": len(data["Items"]),
+                "ListItemEntityTypeFullName": data["EntityType"],
+                "CurrentChangeToken": {"StringValue": change_token(data, len(data["Changes"]))}
+            }, verbose), {}
+
+        match = _LIST_CALL.match(endpoint)
+        if match and method == "POST":
+            data = site.lists.get(match.group(1).replace("''", "'").lower())
+            if data is None:
+                return 404, {"error": {"message": {"value": "List does not exist"}}}, {}
+            if match.group(2) == "GetChanges":
+                return self._handle_changes(data, body, verbose)
+            return self._handle_render_list_data(data, query, body, verbose)
+
+        match = _ITEMS.match(endpoint)
+        if match:
+            data = site.lists.get(match.group(1).replace("''", "'").lower())
+            if data is None:
+                return 404, {"error": {"message": {"value": "List does not exist"}}}, {}
+            item_id = int(match.group(2)) if match.group(2) else None
+            return self._handle_items(data, method, item_id, query, body, verbose)
+
+        match = _FILE_ADD.match(endpoint)
+        if match and method == "POST":
+            path = f"{match.group(1).rstrip('/')}/{match.group(2)}"
+            with site.lock:
+                site.files[path] = bytearray(body)
+            return 200, _entity({"Name": match.group(2), "ServerRelativeUrl": path, "Length": str(len(body))},
+                                verbose), {}
+
+        match = _UPLOAD.match(endpoint)
+        if match and method == "POST":
+            return self._handle_upload_session(match, body, verbose)
+
+        match = _FILE.match(endpoint)
+        if match and method == "GET":
+            content = site.files.get(match.group(1))
+            if content is None:
+                return 404, {"error": {"message": {"value": "File Not Found"}}}, {}
+            if not match.group(2):
+                return 200, _entity({"Name": match.group(1).rsplit("/", 1)[-1],
+                                     "ServerRelativeUrl": match.group(1),
+                                     "Length": str(len(content))}, verbose), {}
+            return self._handle_download(content)
+
+        if endpoint == "search/query" and method == "GET":
+            return self._handle_search(query, verbose)
+
+        return 404, {"error": {"message": {"value": f"Unsupported endpoint: {method} {endpoint}"}}}, {}
+
+    def _handle_items(self, data: Dict[str, Any], method: str, item_id: Optional[int], query: Dict[str, str],
+                      body: bytes, verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        site = self.site
+
+        if method == "POST" and item_id is None:
+            fields = {key: value for key, value in json.loads(body or b"{}").items() if key != "__metadata"}
+            with site.lock:
+                new_id = data["NextId"]
+                data["NextId"] += 1
+                item = {**fields, "Id": new_id, "ID": new_id}
+                data["Items"][new_id] = item
+                site.record_change(data, _CHANGE_ADD, new_id)
+            return 201, _entity(item, verbose), {}
+
+        if method in ("MERGE", "PATCH", "PUT") and item_id is not None:
+            fields = {key: value for key, value in json.loads(body or b"{}").items() if key != "__metadata"}
+            with site.lock:
+                if item_id not in data["Items"]:
+                    return 404, {"error": {"message": {"value": "Item does not exist"}}}, {}
+                data["Items"][item_id].update(fields)
+                site.record_change(data, _CHANGE_UPDATE, item_id)
+            return 204, b"", {}
+
+        if method == "DELETE" and item_id is not None:
+            with site.lock:
+                if data["Items"].pop(item_id, None) is None:
+                    return 404, {"error": {"message": {"value": "Item does not exist"}}}, {}
+                site.record_change(data, _CHANGE_DELETE, item_id)
+            return 200, b"", {}
+
+        if method != "GET":
+            return 400, {"error": {"message": {"value": "Unsupported item operation"}}}, {}
+
+        if item_id is not None:
+            item = data["Items"].get(item_id)
+            if item is None:
+                return 404, {"error": {"message": {"value": "Item does not exist"}}}, {}
+            return 200, _entity(item, verbose), {}
+
+        # Apply the ID comparisons of the filter: "eq" terms are alternatives ("ID eq 1 or ID eq 2"),
+        # range terms all apply; other clauses are accepted and ignored
+        with site.lock:
+            ids = sorted(data["Items"])
+        comparisons = [(operator, int(value)) for operator, value in _ID_FILTER.findall(query.get("$filter", ""))]
+        equal = {value for operator, value in comparisons if operator == "eq"}
+        if equal:
+            ids = [i for i in ids if i in equal]
+        for operator, value in comparisons:
+            if operator != "eq":
+                ids = [i for i in ids if {"ge": i >= value, "gt": i > value,
+                                          "lt": i < value, "le": i <= value}[operator]]
+        if query.get("$orderby", "").lower().endswith("desc"):
+            ids.reverse()
+
+        after = int(query.get("p_ID", 0))
+        if after:
+            ids = [i for i in ids if i > after] if not query.get("$orderby", "").lower().endswith("desc") \
+                else [i for i in ids if i < after]
+        top = int(query.get("$top", 100))
+        page_ids = ids[:top]
+
+        select = query.get("$select")
+        items = []
+        for page_id in page_ids:
+            item = data["Items"].get(page_id)
+            if item is None:
+                continue
+            if select:
+                item = {field: item.get(field) for field in select.split(",")}
+            items.append(item)
+
+        next_link = None
+        if len(ids) > top:
+            next_query = urlencode({**query, "p_ID": page_ids[-1]})
+            next_link = f"http://{self.headers.get('Host')}{self.path.split('?', 1)[0]}?{next_query}"
+        return 200, _collection(items, verbose, next_link), {}
+
+    def _handle_changes(self, data: Dict[str, Any], body: bytes, verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        """Changes after the query's start token, up to its FetchLimit"""
+        change_query = json.loads(body or b"{}").get("query", {})
+        start = change_query.get("ChangeTokenStart", {}).get("StringValue", "")
+        position = int(start.rsplit(";", 1)[-1]) if start else 0
+        limit = int(change_query.get("FetchLimit") or 1000)
+        with self.site.lock:
+            changes = data["Changes"][position:position + limit]
+        return 200, _collection(changes, verbose), {}
+
+    def _handle_render_list_data(self, data: Dict[str, Any], query: Dict[str, str], body: bytes,
+                                 verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Rows of a RenderListDataAsStream call, in ID order with p_ID paging
+
+        Values are rendered as strings and empty fields are left out of the
+        row; the CAML <Where> is accepted and ignored.
+        """
+        view_xml = json.loads(body or b"{}").get("parameters", {}).get("ViewXml", "")
+        match = _ROW_LIMIT.search(view_xml)
+        row_limit = int(match.group(1)) if match else 30
+        view_fields = _VIEW_FIELD.findall(view_xml.partition("<ViewFields>")[2])
+
+        after = int(query.get("p_ID", 0))
+        with self.site.lock:
+            ids = [item_id for item_id in sorted(data["Items"]) if item_id > after]
+            items = [data["Items"][item_id] for item_id in ids[:row_limit]]
+
+        rows = []
+        for item in items:
+            names = ["ID"] + [name for name in (view_fields or item) if name not in ("ID", "Id")]
+            rows.append({name: str(item[name]) for name in names if item.get(name) is not None})
+
+        result: Dict[str, Any] = {"Row": rows, "FirstRow": 1, "LastRow": len(rows)}
+        if len(ids) > row_limit:
+            result["NextHref"] = f"?Paged=TRUE&p_ID={items[-1]['ID']}&PageFirstRow={row_limit + 1}"
+        return 200, _entity(result, verbose), {}
+
+    def _handle_upload_session(self, match: "re.Match", body: bytes, verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        site = self.site
+        path = f"{match.group(1).rstrip('/')}/{match.group(2)}"
+        operation, upload_id = match.group(3), match.group(4)
+        offset = int(match.group(5) or 0)
+
+        with site.lock:
+            if operation == "StartUpload":
+                site.uploads[upload_id] = bytearray(body)
+                return 200, _entity({operation: str(len(body))}, verbose), {}
+
+            buffer = site.uploads.get(upload_id)
+            if buffer is None or len(buffer) != offset:
+                return 400, {"error": {"message": {"value": "Invalid upload session or offset"}}}, {}
+            buffer.extend(body)
+
+            if operation == "ContinueUpload":
+                return 200, _entity({operation: str(len(buffer))}, verbose), {}
+
+            site.files[path] = site.uploads.pop(upload_id)
+            return 200, _entity({"Name": match.group(2), "ServerRelativeUrl": path,
+                                 "Length": str(len(site.files[path]))}, verbose), {}
+
+    def _handle_download(self, content: bytearray) -> Tuple[int, Any, Dict[str, str]]:
+        range_header = self.headers.get("Range")
+        if range_header:
+            start, _, end = range_header.replace("bytes=", "").partition("-")
+            start, end = int(start), min(int(end or len(content) - 1), len(content) - 1)
+            return 206, bytes(content[start:end + 1]), {
+                "Content-Range": f"bytes {start}-{end}/{len(content)}",
+                "Content-Type": "application/octet-stream"
+            }
+        return 200, bytes(content), {"Content-Type": "application/octet-stream"}
+
+    def _handle_search(self, query: Dict[str, str], verbose: bool) -> Tuple[int, Any, Dict[str, str]]:
+        total = len(self.site.lists["bench"]["Items"])
+        start = int(query.get("startrow", 0))
+        limit = min(int(query.get("rowlimit", 10)), 500)
+
+        rows = []
+        for position in range(start, min(start + limit, total)):
+            cells = [
+                {"Key": "DocId", "Value": str(position + 1), "ValueType": "Edm.Int64"},
+                {"Key": "Title", "Value": f"Document {position + 1}", "ValueType": "Edm.String"},
+                {"Key": "Path", "Value": f"{SITE_PATH}/Shared Documents/doc{position + 1}.docx",
+                 "ValueType": "Edm.String"}
+            ]
+            rows.append({"Cells": {"results": cells} if verbose else cells})
+
+        relevant = {
+            "TotalRows": total,
+            "RowCount": len(rows),
+            "Table": {"Rows": {"results": rows} if verbose else rows}
+        }
+        result = {"PrimaryQueryResult": {"RelevantResults": relevant}}
+        return 200, {"d": {"query": result}} if verbose else result, {}
+
+    def _handle_batch(self, body: bytes, verbose: bool) -> None:
+        """
+        Run the operations of a $batch request and answer with a multipart response
+
+        Reads are answered with a part each. A changeset is answered with a
+        nested multipart of its responses, or, as SharePoint does when one of
+        its operations fails, with that single error response in its place.
+        """
+        lines = body.decode("utf-8").split("\r\n")
+        # Top-level parts: whether each is a changeset, and its operations
+        groups: List[Tuple[bool, List[Tuple[str, str, bytes]]]] = []
+        changeset = None
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            index += 1
+            if line.startswith("--changeset_"):
+                opened = None if line.endswith("--") else line
+                if opened != changeset:
+                    changeset = opened
+                    if changeset is not None:
+                        groups.append((True, []))
+                continue
+            match = _BATCH_OPERATION.match(line)
+            if not match:
+                continue
+            headers = {}
+            while index < len(lines) and lines[index]:
+                name, _, value = lines[index].partition(":")
+                headers[name.strip()] = value.strip()
+                index += 1
+            index += 1
+            operation_body = b""
+            if index < len(lines) and lines[index] and not lines[index].startswith("--"):
+                operation_body = lines[index].encode("utf-8")
+            operation = (headers.get("X-HTTP-Method") or match.group(1), match.group(2), operation_body)
+            if changeset is None:
+                groups.append((False, [operation]))
+            else:
+                groups[-1][1].append(operation)
+
+        boundary = f"batchresponse_{uuid.uuid4()}"
+        out = []
+        for is_changeset, operations in groups:
+            responses = [self._batch_operation(*operation, verbose=verbose) for operation in operations]
+            out.append(f"--{boundary}")
+            failed = [response for response in responses if response[0] >= 400]
+            if not is_changeset:
+                out.extend(_http_part(*responses[0]))
+            elif failed:
+                out.extend(_http_part(*failed[0]))
+            else:
+                changeset_boundary = f"changesetresponse_{uuid.uuid4()}"
+                out.extend([f"Content-Type: multipart/mixed; boundary={changeset_boundary}", ""])
+                for response in responses:
+                    out.append(f"--{changeset_boundary}")
+                    out.extend(_http_part(*response))
+                out.append(f"--{changeset_boundary}--")
+        out.append(f"--{boundary}--")
+        out.append("")
+        self._respond(200, "\r\n".join(out).encode("utf-8"),
+                      {"Content-Type": f"multipart/mixed; boundary={boundary}"})
+
+    def _batch_operation(self, method: str, url: str, operation_body: bytes, verbose: bool) -> Tuple[int, str]:
+        parts = urlsplit(url)
+        endpoint = unquote(parts.path.split("/_api/", 1)[1])
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        status, payload, _ = self.route(method, endpoint, query, operation_body, verbose)
+        return status, json.dumps(payload) if isinstance(payload, dict) else ""
+
+    def _respond(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        if isinstance(payload, dict):
+            content = json.dumps(payload).encode("utf-8")
+            content_type = "application/json;odata=minimalmetadata"
+        else:
+            content = payload
+            content_type = "application/octet-stream"
+        if status == 304:
+            content = b""
+
+        self.send_response(status)
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class MockSharePointServer:
+    """
+    Threaded mock server, usable as a context manager
+
+    Example:
+        with MockSharePointServer(item_count=10000) as server:
+            client = SharePointClient(server.site_url, "token")
+    """
+
+    def __init__(self, item_count: int = 0, throttle_rate: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.site = MockSharePoint(item_count=item_count, throttle_rate=throttle_rate)
+        handler = type("BoundHandler", (MockSharePointHandler,), {"site": self.site})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def site_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{SITE_PATH}"
+
+    def start(self) -> "MockSharePointServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockSharePointServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the mock SharePoint REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--items", type=int, default=10000, help="Items pre-populated in the Bench list")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    args = parser.parse_args()
+
+    server = MockSharePointServer(item_count=args.items, throttle_rate=args.throttle_rate,
+                                  host=args.host, port=args.port)
+    print(f"Mock SharePoint site at {server.site_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Result file helpers shared by the benchmark scripts
+"""
+
+import json
+import os
+import platform
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def plugin_version() -> str:
+    """Read the plugin version from manifest.yaml"""
+    with open(os.path.join(ROOT, "manifest.yaml"), encoding="utf-8") as manifest:
+        match = re.search(r"^version:\s*(\S+)", manifest.read(), re.MULTILINE)
+    return match.group(1) if match else "unknown"
+
+
+def new_report(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Start a result report describing the plugin version and environment"""
+    return {
+        "version": plugin_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": {}
+    }
+
+
+def write_report(report: Dict[str, Any], output: Optional[str] = None, suffix: str = "") -> str:
+    """
+    Write a report to a JSON file
+
+    Args:
+        report: Report built with new_report
+        output: Result file (default: benchmarks/results/<version><suffix>-<timestamp>.json)
+        suffix: Suffix appended to the version in the default file name
+
+    Returns:
+        Path of the written file
+    """
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = os.path.join(RESULTS_DIR, f"{report['version']}{suffix}-{stamp}.json")
+    with open(output, "w", encoding="utf-8") as result_file:
+        json.dump(report, result_file, indent=2)
+    return output
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], path: str = "") -> List[str]:
+    """List the relative change of every numeric rate between two result files"""
+    lines = []
+    for key, value in current.items():
+        other = previous.get(key) if isinstance(previous, dict) else None
+        name = f"{path}.{key}" if path else key
+        if isinstance(value, dict):
+            lines.extend(compare(value, other or {}, name))
+        elif key.endswith(("_per_second", "_ms")) and isinstance(other, (int, float)) and other:
+            lines.append(f"{name}: {other:.2f} -> {value:.2f} ({(value - other) / other:+.1%})")
+    return lines
+
+
+def print_comparison(results: Dict[str, Any], previous_path: str) -> None:
+    """Print the comparison of results with a previous result file"""
+    with open(previous_path, encoding="utf-8") as previous_file:
+        previous = json.load(previous_file)
+    print(f"Compared with {previous.get('version')} ({previous.get('timestamp')}):")
+    for line in compare(results, previous.get("results", {})):
+        print(f"  {line}")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for SharePointClient and the plugin tools
+
+Every benchmark runs against the local mock server (benchmarks/mock_server.py),
+so results are reproducible and comparable across versions of the plugin.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --items 50000 --file-mb 64 --output results.json
+    python -m benchmarks.run --compare benchmarks/results/previous.json
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# dify_plugin monkey-patches the standard library on import, so, as in main.py,
+# it has to be imported before any socket or thread is created
+try:
+    from tools.get_list_items import GetListItemsTool  # noqa: E402
+    from tools.get_lists import GetListsTool  # noqa: E402
+except Exception as e:
+    GetListItemsTool = GetListsTool = None
+    TOOLS_IMPORT_ERROR: Optional[str] = f"{type(e).__name__}: {e}"
+else:
+    TOOLS_IMPORT_ERROR = None
+
+from benchmarks.mock_server import SITE_PATH, MockSharePointServer  # noqa: E402
+from benchmarks.report import new_report, print_comparison, write_report  # noqa: E402
+from utils.sharepoint_client import SharePointClient  # noqa: E402
+
+FOLDER = f"{SITE_PATH}/Shared Documents"
+
+MB = 1024 * 1024
+
+
+def timed(func: Callable[[], Any]) -> Dict[str, Any]:
+    """Run a callable once and return its result and elapsed wall time"""
+    started = time.perf_counter()
+    result = func()
+    return {"result": result, "seconds": time.perf_counter() - started}
+
+
+def bench_latency(client: SharePointClient, calls: int) -> Dict[str, Any]:
+    """Per-call latency of a small GET"""
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        client.get_site_info()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": calls,
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "max_ms": samples[-1]
+    }
+
+
+def bench_list_scan(client: SharePointClient, page_size: int, workers: int) -> Dict[str, Any]:
+    """Throughput of a full list scan: serial, parsed incrementally, and ID-partitioned"""
+    results = {}
+
+    run = timed(lambda: sum(len(page) for page in client.iter_list_item_pages("Bench", page_size=page_size)))
+    results["serial"] = {"items": run["result"], "seconds": run["seconds"],
+                         "items_per_second": run["result"] / run["seconds"]}
+
+    run = timed(lambda: sum(1 for _ in client.iter_list_items("Bench", page_size=page_size, streaming=True)))
+    results["streaming"] = {"items": run["result"], "seconds": run["seconds"],
+                            "items_per_second": run["result"] / run["seconds"]}
+
+    run = timed(lambda: sum(len(page) for page in client.iter_list_item_pages_parallel(
+        "Bench", page_size=page_size, max_workers=workers)))
+    results["parallel"] = {"items": run["result"], "seconds": run["seconds"], "workers": workers,
+                           "items_per_second": run["result"] / run["seconds"]}
+    return results
+
+
+def bench_bulk_write(client: SharePointClient, count: int, workers: int) -> Dict[str, Any]:
+    """Rate of batched item creation, sequential and concurrent batches"""
+    results = {}
+    for label, max_workers in (("sequential", 1), ("parallel", workers)):
+        items = [{"Title": f"Bulk {index}"} for index in range(count)]
+        run = timed(lambda: client.bulk_create_list_items("Bench", items, max_workers=max_workers))
+        succeeded = sum(1 for result in run["result"] if result["success"])
+        results[label] = {"items": succeeded, "seconds": run["seconds"], "workers": max_workers,
+                          "items_per_second": succeeded / run["seconds"]}
+    return results
+
+
+def bench_transfer(client: SharePointClient, size_mb: int, segments: int) -> Dict[str, Any]:
+    """Upload and download throughput of a large file"""
+    content = os.urandom(size_mb * MB)
+    results = {}
+
+    run = timed(lambda: client.upload_file_chunked(FOLDER, "bench.bin", io.BytesIO(content), chunk_size=4 * MB))
+    results["upload_chunked"] = {"megabytes": size_mb, "seconds": run["seconds"],
+                                 "mb_per_second": size_mb / run["seconds"]}
+
+    for label, parallel_segments in (("download_stream", 1), ("download_segmented", segments)):
+        buffer = io.BytesIO()
+        run = timed(lambda: client.download_file_to(f"{FOLDER}/bench.bin", buffer,
+                                                    parallel_segments=parallel_segments))
+        if buffer.getvalue() != content:
+            raise RuntimeError(f"{label} returned corrupted content")
+        results[label] = {"megabytes": size_mb, "seconds": run["seconds"], "segments": parallel_segments,
+                          "mb_per_second": size_mb / run["seconds"]}
+    return results
+
+
+def bench_search(client: SharePointClient, max_results: int) -> Dict[str, Any]:
+    """Rate of auto-paged search harvesting"""
+    run = timed(lambda: client.search_all("bench", max_results=max_results))
+    count = len(run["result"]["results"])
+    return {"results": count, "seconds": run["seconds"], "results_per_second": count / run["seconds"]}
+
+
+def bench_throttled_scan(items: int, page_size: int, throttle_rate: float) -> Dict[str, Any]:
+    """List scan throughput while the server throttles a fraction of requests"""
+    with MockSharePointServer(item_count=items, throttle_rate=throttle_rate) as server:
+        client = SharePointClient(server.site_url, "benchmark-throttled")
+        run = timed(lambda: sum(len(page) for page in client.iter_list_item_pages("Bench", page_size=page_size)))
+        stats = client.stats.snapshot()
+    return {"items": run["result"], "seconds": run["seconds"], "throttle_rate": throttle_rate,
+            "items_per_second": run["result"] / run["seconds"],
+            "requests": stats["requests"], "throttled": stats["throttled"]}
+
+
+def bench_tools(site_url: str, page_size: int) -> Dict[str, Any]:
+    """End-to-end cost of tool invocations, including message construction"""
+    if TOOLS_IMPORT_ERROR:
+        return {"skipped": f"dify_plugin is not importable here: {TOOLS_IMPORT_ERROR}"}
+
+    credentials = {"site_url": site_url, "access_token": "benchmark-tools"}
+    results = {}
+
+    tool = GetListItemsTool.from_credentials(credentials)
+    run = timed(lambda: list(tool.invoke({"list_title": "Bench", "page_size": page_size})))
+    results["get_list_items"] = {"messages": len(run["result"]), "seconds": run["seconds"]}
+
+    tool = GetListsTool.from_credentials(credentials)
+    run = timed(lambda: list(tool.invoke({})))
+    results["get_lists"] = {"messages": len(run["result"]), "seconds": run["seconds"]}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the offline SharePoint plugin benchmarks")
+    parser.add_argument("--items", type=int, default=20000, help="Items in the scanned list")
+    parser.add_argument("--page-size", type=int, default=1000, help="Page size of list scans")
+    parser.add_argument("--bulk-items", type=int, default=2000, help="Items created by the bulk write benchmark")
+    parser.add_argument("--file-mb", type=int, default=32, help="Size of the transferred file in MB")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrency of the parallel variants")
+    parser.add_argument("--latency-calls", type=int, default=200, help="Calls measured for per-call latency")
+    parser.add_argument("--search-results", type=int, default=5000, help="Results harvested by search")
+    parser.add_argument("--throttle-rate", type=float, default=0.1, help="429 rate of the throttled scan")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<version>-<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    args = parser.parse_args()
+
+    report = new_report(vars(args))
+    results = report["results"]
+
+    with MockSharePointServer(item_count=args.items) as server:
+        client = SharePointClient(server.site_url, "benchmark")
+
+        benchmarks = [
+            ("latency", lambda: bench_latency(client, args.latency_calls)),
+            ("list_scan", lambda: bench_list_scan(client, args.page_size, args.workers)),
+            ("bulk_write", lambda: bench_bulk_write(client, args.bulk_items, args.workers)),
+            ("transfer", lambda: bench_transfer(client, args.file_mb, args.workers)),
+            ("search", lambda: bench_search(client, args.search_results)),
+            ("throttled_scan", lambda: bench_throttled_scan(args.items, args.page_size, args.throttle_rate)),
+            ("tools", lambda: bench_tools(server.site_url, args.page_size))
+        ]
+        for name, bench in benchmarks:
+            print(f"Running {name}...", flush=True)
+            results[name] = bench()
+
+        report["client_stats"] = client.stats.snapshot()
+
+    output = write_report(report, args.output)
+
+    print(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
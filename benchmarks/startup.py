@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark of the plugin
+
+The plugin runtime imports every tool module when it boots, then serves the
+first invocation. Every measurement runs in a fresh interpreter so nothing is
+cached in sys.modules:
+
+- imports: time to import each tool module, the provider and the client modules,
+  and which heavy packages each import pulled in
+- first_invocation: import of a tool plus its first invocation against the
+  local mock server (benchmarks/mock_server.py), up to the first message and
+  to the last one
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 10 --compare benchmarks/results/previous-startup.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Packages whose import dominates start-up when loaded eagerly
+HEAVY_MODULES = ("requests", "urllib3", "asyncio", "ijson")
+
+# Modules imported outside the tools
+BASE_MODULES = ("dify_plugin", "provider.sharepoint", "utils.sharepoint_client")
+
+# Tools measured on their first invocation: module, class and parameters
+INVOCATION_TARGETS = {
+    "get_lists": ("tools.get_lists", "GetListsTool", {}),
+    "get_list_items": ("tools.get_list_items", "GetListItemsTool", {"list_title": "Bench", "page_size": 100})
+}
+
+# Items in the mock server's list for invocation probes
+PROBE_ITEMS = 1000
+
+
+def tool_modules() -> List[str]:
+    """List the tool modules registered in provider/sharepoint.yaml"""
+    with open(os.path.join(ROOT, "provider", "sharepoint.yaml"), encoding="utf-8") as provider:
+        return [
+            line.strip()[2:].strip()[:-len(".yaml")].replace("/", ".")
+            for line in provider
+            if line.strip().startswith("- tools/") and line.strip().endswith(".yaml")
+        ]
+
+
+def probe_import(module: str) -> Dict[str, Any]:
+    """Import a module in this (fresh) interpreter and time it"""
+    started = time.perf_counter()
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    return {
+        "seconds": time.perf_counter() - started,
+        "heavy_modules": [name for name in HEAVY_MODULES if name in sys.modules]
+    }
+
+
+def probe_invocation(target: str) -> Dict[str, Any]:
+    """Import a tool and invoke it once against the mock server in this (fresh) interpreter"""
+    module, class_name, parameters = INVOCATION_TARGETS[target]
+
+    # The tool is imported first: dify_plugin monkey-patches the standard library on import
+    started = time.perf_counter()
+    try:
+        tool_class = getattr(importlib.import_module(module), class_name)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    imported = time.perf_counter()
+
+    from benchmarks.mock_server import MockSharePointServer
+
+    with MockSharePointServer(item_count=PROBE_ITEMS) as server:
+        tool = tool_class.from_credentials({"site_url": server.site_url, "access_token": "benchmark-startup"})
+        invoked = time.perf_counter()
+        messages = iter(tool.invoke(parameters))
+        next(messages)
+        first_message = time.perf_counter()
+        count = 1 + sum(1 for _ in messages)
+        finished = time.perf_counter()
+
+    return {
+        "import_seconds": imported - started,
+        "first_message_seconds": first_message - invoked,
+        "total_seconds": finished - invoked,
+        "messages": count
+    }
+
+
+def probe_client() -> Dict[str, Any]:
+    """Import the client and make its first call against the mock server in this (fresh) interpreter"""
+    started = time.perf_counter()
+    from utils.sharepoint_client import SharePointClient
+    imported = time.perf_counter()
+
+    from benchmarks.mock_server import MockSharePointServer
+
+    with MockSharePointServer(item_count=PROBE_ITEMS) as server:
+        called = time.perf_counter()
+        SharePointClient(server.site_url, "benchmark-startup").get_lists()
+        finished = time.perf_counter()
+
+    return {"import_seconds": imported - started, "first_call_seconds": finished - called}
+
+
+def run_probe(*args: str) -> Dict[str, Any]:
+    """Run a probe in a fresh interpreter and return its result"""
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--probe", *args],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode or not lines:
+        return {"error": (completed.stderr.strip().splitlines() or ["probe failed"])[-1]}
+    return json.loads(lines[-1])
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce repeated probe results to medians in milliseconds"""
+    if any("error" in sample for sample in samples):
+        return {"error": next(sample["error"] for sample in samples if "error" in sample)}
+
+    summary: Dict[str, Any] = {}
+    for key, value in samples[0].items():
+        if key.endswith("_seconds") or key == "seconds":
+            name = "import_ms" if key == "seconds" else f"{key[:-len('_seconds')]}_ms"
+            summary[name] = statistics.median(sample[key] for sample in samples) * 1000
+        else:
+            summary[key] = value
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the plugin's cold start time")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<version>-startup-<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    parser.add_argument("--probe", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        kind, *names = args.probe
+        if kind == "import":
+            result = probe_import(names[0])
+        elif kind == "invoke":
+            result = probe_invocation(names[0])
+        else:
+            result = probe_client()
+        print(json.dumps(result))
+        return
+
+    from benchmarks.report import new_report, print_comparison, write_report
+
+    report = new_report({"repeat": args.repeat})
+    results = report["results"]
+
+    print("Measuring imports...", flush=True)
+    results["imports"] = {
+        module: summarize([run_probe("import", module) for _ in range(args.repeat)])
+        for module in list(BASE_MODULES) + tool_modules()
+    }
+
+    print("Measuring first invocations...", flush=True)
+    results["first_invocation"] = {
+        target: summarize([run_probe("invoke", target) for _ in range(args.repeat)])
+        for target in INVOCATION_TARGETS
+    }
+    results["first_invocation"]["client"] = summarize([run_probe("client") for _ in range(args.repeat)])
+
+    output = write_report(report, args.output, suffix="-startup")
+
+    print(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
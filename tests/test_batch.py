@@ -0,0 +1,200 @@
+"""
+Round trips of $batch requests through the builder, the parser and the mock server
+
+Run with: python -m pytest tests
+"""
+
+import re
+from urllib.parse import unquote
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.batch import build_batch_body, match_batch_results, parse_batch_groups, parse_batch_response
+from utils.sharepoint_client import SharePointClient, escape_literal
+
+BASE_API_URL = "https://contoso.sharepoint.com/sites/team/_api"
+
+# A space breaks unencoded request lines; an apostrophe must be escaped in the literal
+LIST_TITLE = "Bob's Project Tasks"
+
+_REQUEST_LINE = re.compile(r"^(GET|POST|PUT|PATCH|MERGE|DELETE) (\S+) HTTP/1\.1$")
+
+
+@pytest.fixture
+def server():
+    with MockSharePointServer(item_count=0) as mock:
+        mock.site.create_list(LIST_TITLE, item_count=3)
+        yield mock
+
+
+def items_url(item_id=None):
+    suffix = f"({item_id})" if item_id is not None else ""
+    return f"web/lists/getbytitle('{escape_literal(LIST_TITLE)}')/items{suffix}"
+
+
+def test_request_lines_are_encoded():
+    operations = [
+        {"method": "GET", "url": items_url() + "?$filter=Title eq 'Item 1'"},
+        {"method": "MERGE", "url": items_url(1), "data": {"Title": "Renamed"}},
+        {"method": "DELETE", "url": items_url(2)}
+    ]
+    _, body = build_batch_body(operations, BASE_API_URL, "application/json")
+
+    lines = [line for line in body.split("\r\n") if line.endswith(" HTTP/1.1")]
+    assert len(lines) == len(operations)
+    for line, operation in zip(lines, operations):
+        match = _REQUEST_LINE.match(line)
+        assert match, line
+        assert match.group(1) == operation["method"]
+        assert unquote(match.group(2)) == f"{BASE_API_URL}/{operation['url']}"
+
+
+def test_reserved_characters_in_values_are_encoded():
+    _, body = build_batch_body([
+        {"method": "GET", "url": "web/lists/getbytitle('100% Done')/items"},
+        {"method": "GET", "url": "web/getusereffectivepermissions(@user)?@user='i:0#.f|membership|50%=off@x.com'"}
+    ], BASE_API_URL, "application/json")
+    lines = [line for line in body.split("\r\n") if line.endswith(" HTTP/1.1")]
+
+    assert "getbytitle('100%25%20Done')" in lines[0]
+    assert "@user='i:0%23.f%7Cmembership%7C50%25%3Doff@x.com'" in lines[1]
+
+
+def test_parse_response_parts():
+    text = "\r\n".join([
+        "--batchresponse_1",
+        "Content-Type: application/http",
+        "",
+        "HTTP/1.1 200 OK",
+        "CONTENT-TYPE: application/json",
+        "",
+        '{"Id": 1, "Title": "Bob\'s item"}',
+        "--batchresponse_1",
+        "Content-Type: application/http",
+        "",
+        "HTTP/1.1 404 Not Found",
+        "CONTENT-TYPE: application/json",
+        "",
+        '{"error": {"message": {"value": "List does not exist"}}}',
+        "--batchresponse_1--",
+        ""
+    ])
+    parts = parse_batch_response(text)
+    assert [part["status"] for part in parts] == [200, 404]
+    assert parts[0]["body"] == {"Id": 1, "Title": "Bob's item"}
+    assert parts[1]["body"]["error"]["message"]["value"] == "List does not exist"
+
+
+def test_batch_round_trip(server):
+    client = SharePointClient(server.site_url, "test-token")
+    results = client.execute_batch([
+        {"method": "GET", "url": items_url(1)},
+        {"method": "MERGE", "url": items_url(1), "data": {"Title": "Renamed"}},
+        {"method": "DELETE", "url": items_url(2)},
+        {"method": "GET", "url": "web/lists/getbytitle('Missing List')/items(1)"}
+    ])["results"]
+
+    assert results[0]["Title"] == "Item 1"
+    assert "error" not in results[1] and "error" not in results[2]
+    assert results[3]["status"] == 404
+    assert "List does not exist" in results[3]["error"]
+
+    items = server.site.lists[LIST_TITLE.lower()]["Items"]
+    assert items[1]["Title"] == "Renamed"
+    assert 2 not in items
+
+
+def test_bulk_operations_on_title_with_space(server):
+    client = SharePointClient(server.site_url, "test-token")
+
+    created = client.bulk_create_list_items(LIST_TITLE, [{"Title": "New 1"}, {"Title": "New 2"}])
+    assert [entry["success"] for entry in created] == [True, True]
+    assert all(entry.get("id") for entry in created)
+
+    updated = client.bulk_update_list_items(LIST_TITLE, [{"Id": 1, "Title": "Renamed"}, {"Title": "No ID"}])
+    assert updated[0]["success"] and updated[0]["id"] == 1
+    assert updated[1] == {"index": 1, "success": False, "error": "Item ID is required"}
+
+    deleted = client.bulk_delete_list_items(LIST_TITLE, [2, None, 3])
+    assert [entry["success"] for entry in deleted] == [True, False, True]
+
+    items = server.site.lists[LIST_TITLE.lower()]["Items"]
+    assert items[1]["Title"] == "Renamed"
+    assert 2 not in items and 3 not in items
+    assert len(items) == 3
+
+
+@pytest.mark.parametrize("odata_metadata", ["verbose", "minimalmetadata", "nometadata"])
+def test_batch_results_are_normalized(server, odata_metadata):
+    client = SharePointClient(server.site_url, "test-token", odata_metadata=odata_metadata)
+    results = client.execute_batch([
+        {"method": "GET", "url": items_url(1)},
+        {"method": "GET", "url": items_url() + "?$top=2"}
+    ])["results"]
+
+    assert results[0] == {"Id": 1, "ID": 1, "Title": "Item 1", "Status": "Open"}
+    assert [item["Id"] for item in results[1]["results"]] == [1, 2]
+
+
+def test_bulk_invalid_item_ids_are_never_sent(server):
+    client = SharePointClient(server.site_url, "test-token")
+    client.get_list_metadata(LIST_TITLE)
+    requests_before = server.site.requests
+
+    updated = client.bulk_update_list_items(LIST_TITLE, [{"Id": "1", "Title": "x"}, {"ID": True}, {"Id": 0}])
+    deleted = client.bulk_delete_list_items(LIST_TITLE, [False, -1, 2.0])
+
+    assert not any(entry["success"] for entry in updated + deleted)
+    assert all("positive integer" in entry["error"] for entry in updated + deleted)
+    assert server.site.requests == requests_before
+    assert len(server.site.lists[LIST_TITLE.lower()]["Items"]) == 3
+
+
+def test_failed_changeset_does_not_shift_later_results(server):
+    client = SharePointClient(server.site_url, "test-token")
+    results = client.execute_batch([
+        {"method": "MERGE", "url": items_url(1), "data": {"Title": "Renamed"}},
+        {"method": "MERGE", "url": "web/lists/getbytitle('Missing List')/items(1)", "data": {"Title": "x"}},
+        {"method": "GET", "url": items_url(3)},
+        {"method": "DELETE", "url": items_url(2)}
+    ])["results"]
+
+    # The changeset is answered with a single error, reported for both of its operations
+    assert [result.get("status") for result in results[:2]] == [404, 404]
+    assert all("List does not exist" in result["error"] for result in results[:2])
+    assert results[2]["Title"] == "Item 3"
+    assert "error" not in results[3]
+
+
+def test_match_results_per_top_level_part():
+    text = "\r\n".join([
+        "--batchresponse_1",
+        "Content-Type: application/http",
+        "",
+        "HTTP/1.1 400 Bad Request",
+        "CONTENT-TYPE: application/json",
+        "",
+        '{"error": {"message": {"value": "Changeset failed"}}}',
+        "--batchresponse_1",
+        "Content-Type: application/http",
+        "",
+        "HTTP/1.1 200 OK",
+        "CONTENT-TYPE: application/json",
+        "",
+        '{"Id": 7}',
+        "--batchresponse_1--",
+        ""
+    ])
+    results = match_batch_results([3, 1, 1], parse_batch_groups(text), 200, text)
+
+    assert [result.get("status") for result in results[:3]] == [400, 400, 400]
+    assert results[3] == {"Id": 7}
+    assert results[4]["status"] == 200 and "No response returned" in results[4]["error"]
+
+
+def test_batch_round_trip_with_percent_in_title(server):
+    server.site.create_list("100% Done", item_count=1)
+    client = SharePointClient(server.site_url, "test-token")
+    results = client.execute_batch([{"method": "GET", "url": "web/lists/getbytitle('100% Done')/items(1)"}])["results"]
+    assert results[0]["Title"] == "Item 1"
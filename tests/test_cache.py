@@ -0,0 +1,84 @@
+"""
+Response cache of mostly-static endpoints, against the mock server
+
+Run with: python -m pytest tests
+"""
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.sharepoint_client import CACHEABLE_ENDPOINTS, SharePointClient, response_cache
+
+
+@pytest.fixture
+def server():
+    response_cache.clear()
+    with MockSharePointServer(item_count=0) as mock:
+        yield mock
+    response_cache.clear()
+
+
+def list_titles(client):
+    return sorted(entry["Title"] for entry in client.get_lists())
+
+
+def test_fresh_entries_are_served_without_a_request(server):
+    client = SharePointClient(server.site_url, "test-token", cache_responses=True)
+    list_titles(client)
+
+    requests_before = server.site.requests
+    assert list_titles(client) == ["Bench"]
+    assert list_titles(SharePointClient(server.site_url, "test-token", cache_responses=True)) == ["Bench"]
+    assert server.site.requests == requests_before
+    assert response_cache.stats()["hits"] == 2
+
+
+def test_uncached_clients_always_call_the_server(server):
+    client = SharePointClient(server.site_url, "test-token")
+    list_titles(client)
+
+    requests_before = server.site.requests
+    list_titles(client)
+    assert server.site.requests == requests_before + 1
+    assert response_cache.stats()["entries"] == 0
+
+
+def test_expired_entries_are_revalidated(server, monkeypatch):
+    # Entries expire as soon as they are stored
+    monkeypatch.setitem(CACHEABLE_ENDPOINTS, "web/lists", 0)
+    client = SharePointClient(server.site_url, "test-token", cache_responses=True)
+    list_titles(client)
+
+    requests_before = server.site.requests
+    assert list_titles(client) == ["Bench"]
+    assert server.site.requests == requests_before + 1
+    assert response_cache.stats()["revalidations"] == 1
+
+    # A change on the server fails the ETag check, and the new body replaces the entry
+    server.site.create_list("Archive")
+    assert list_titles(client) == ["Archive", "Bench"]
+    assert response_cache.stats()["misses"] == 2
+
+
+def test_create_list_invalidates_cached_lists(server):
+    client = SharePointClient(server.site_url, "test-token", cache_responses=True)
+    assert list_titles(client) == ["Bench"]
+
+    client.create_list("Project Tasks")
+
+    requests_before = server.site.requests
+    assert list_titles(client) == ["Bench", "Project Tasks"]
+    assert server.site.requests == requests_before + 1
+
+
+def test_invalidation_is_scoped_to_the_identity(server):
+    writer = SharePointClient(server.site_url, "writer-token", cache_responses=True)
+    reader = SharePointClient(server.site_url, "reader-token", cache_responses=True)
+    list_titles(writer)
+    list_titles(reader)
+
+    writer.create_list("Project Tasks")
+
+    # The reader's entry stays until it expires; the writer sees its own change at once
+    assert list_titles(reader) == ["Bench"]
+    assert list_titles(writer) == ["Bench", "Project Tasks"]
@@ -0,0 +1,63 @@
+"""
+Delta queries on list change logs, against the mock server
+
+Run with: python -m pytest tests
+"""
+
+import pytest
+
+import utils.sharepoint_client
+from benchmarks.mock_server import MockSharePointServer
+from utils.sharepoint_client import SharePointClient
+
+
+@pytest.fixture
+def server():
+    with MockSharePointServer(item_count=5) as mock:
+        yield mock
+
+
+def test_changes_collapse_to_the_net_effect_per_item(server, monkeypatch):
+    # Small change pages make the log span several GetChanges calls
+    monkeypatch.setattr(utils.sharepoint_client, "CHANGE_FETCH_LIMIT", 2)
+    client = SharePointClient(server.site_url, "test-token")
+    token = client.get_list_change_token("Bench")
+
+    created = client.create_list_item("Bench", {"Title": "Draft"})["ID"]
+    client.update_list_item("Bench", created, {"Title": "Final"})
+    client.update_list_item("Bench", 1, {"Status": "Done"})
+    client.update_list_item("Bench", 1, {"Status": "Closed"})
+    scratch = client.create_list_item("Bench", {"Title": "Scratch"})["ID"]
+    client.delete_list_item("Bench", scratch)
+    client.delete_list_item("Bench", 2)
+
+    delta = client.get_list_item_delta("Bench", token)
+
+    # An item added then updated is still new; updates are fetched once, at their latest version
+    assert [item["Title"] for item in delta["added"]] == ["Final"]
+    assert [(item["ID"], item["Status"]) for item in delta["updated"]] == [(1, "Closed")]
+    assert sorted(delta["deleted"]) == [2, scratch]
+    assert delta["change_token"] == client.get_list_change_token("Bench")
+
+
+def test_delta_from_the_latest_token_is_empty(server):
+    client = SharePointClient(server.site_url, "test-token")
+    client.update_list_item("Bench", 3, {"Title": "Renamed"})
+    token = client.get_list_change_token("Bench")
+
+    delta = client.get_list_item_delta("Bench", token)
+
+    assert delta == {"added": [], "updated": [], "deleted": [], "change_token": token}
+
+
+def test_delta_fetches_only_changed_items(server):
+    client = SharePointClient(server.site_url, "test-token")
+    token = client.get_list_change_token("Bench")
+    client.update_list_item("Bench", 4, {"Title": "Changed"})
+
+    requests_before = server.site.requests
+    delta = client.get_list_item_delta("Bench", token, select_fields="Title")
+
+    assert delta["updated"] == [{"ID": 4, "Title": "Changed"}]
+    # One GetChanges call and one item query
+    assert server.site.requests == requests_before + 2
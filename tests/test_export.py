@@ -0,0 +1,88 @@
+"""
+List export writer: CSV columns and NDJSON records
+
+Run with: python -m pytest tests
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.export import ListExportWriter
+from utils.sharepoint_client import SharePointClient
+
+FIELDS = [
+    {"InternalName": "Title", "TypeAsString": "Text"},
+    {"InternalName": "Status", "TypeAsString": "Choice"},
+    {"InternalName": "Owner", "TypeAsString": "User"}
+]
+
+
+def export(export_format, pages, rendered_rows=False):
+    stream = io.StringIO(newline="")
+    writer = ListExportWriter(stream, export_format, FIELDS, rendered_rows=rendered_rows)
+    for items in pages:
+        writer.write_page(items)
+    writer.close()
+    return writer, stream.getvalue()
+
+
+def test_csv_columns_cover_fields_missing_from_the_first_item():
+    # Rendered rows omit empty fields, so Status first shows up on the second page
+    writer, text = export("csv", [
+        [{"ID": "1", "Title": "First", "Owner": "Ann"}],
+        [{"ID": "2", "Title": "Second", "Status": "Open", "Owner": "Bob"}]
+    ], rendered_rows=True)
+
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == ["Title", "Status", "Owner", "ID"]
+    assert rows[2] == ["Second", "Open", "Bob", "2"]
+    assert writer.dropped_columns == []
+
+
+def test_csv_reports_properties_without_a_column():
+    writer, text = export("csv", [
+        [{"ID": 1, "Title": "First", "Status": "Open", "OwnerId": 7}],
+        [{"ID": 2, "Title": "Second", "Status": "Done", "OwnerId": 8, "Modified": "2026-01-01"}]
+    ])
+
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == ["Title", "Status", "OwnerId", "ID"]
+    assert len(rows) == 3
+    assert writer.dropped_columns == ["Modified"]
+
+
+def test_empty_csv_export_writes_header():
+    _, text = export("csv", [])
+    assert text.splitlines() == ["Title,Status,OwnerId"]
+
+
+def test_ndjson_keeps_every_property():
+    writer, text = export("ndjson", [
+        [{"ID": 1, "Title": "First", "Status": "Open", "OwnerId": 7, "Tags": ["a", "b"]}],
+        [{"ID": 2, "Title": "Second", "Status": None, "OwnerId": 8, "Modified": "2026-01-01"}]
+    ])
+
+    records = [json.loads(line) for line in text.splitlines()]
+    assert list(records[0]) == ["Title", "Status", "OwnerId", "ID", "Tags"]
+    assert records[1]["Modified"] == "2026-01-01"
+    assert writer.rows == 2 and writer.dropped_columns == []
+
+
+@pytest.mark.parametrize("scan_mode", ["standard", "threshold_safe", "parallel"])
+def test_export_scanned_pages_to_csv(scan_mode):
+    with MockSharePointServer(item_count=120) as server:
+        client = SharePointClient(server.site_url, "test-token")
+        client.update_list_item("Bench", 60, {"Status": None})
+        pages = client.scan_list_item_pages("Bench", scan_mode=scan_mode, select_fields="ID,Title,Status",
+                                            page_size=50, streaming=True)
+        writer, text = export("csv", pages, rendered_rows=scan_mode == "threshold_safe")
+
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert writer.rows == 120 and len(rows) == 120
+    assert [row["ID"] for row in rows] == [str(item_id) for item_id in range(1, 121)]
+    assert rows[59]["Status"] == "" and rows[60]["Status"] == "Open"
+    assert writer.dropped_columns == []
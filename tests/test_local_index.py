@@ -0,0 +1,72 @@
+"""
+Local full-text index: list and folder sync
+
+Run with: python -m pytest tests
+"""
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.local_index import LocalIndex
+from utils.sharepoint_client import SharePointClient
+
+
+class FolderClient:
+    """Stand-in for the crawl and download calls of SharePointClient, counting downloads"""
+
+    def __init__(self, files):
+        self.files = files
+        self.downloads = 0
+
+    def crawl_folder(self, folder_path, max_depth=None):
+        for path, content in self.files.items():
+            if path.startswith(f"{folder_path}/"):
+                yield {"type": "file", "path": path, "name": path.rsplit("/", 1)[-1],
+                       "size": len(content), "modified": "2026-01-01T00:00:00Z"}
+
+    def download_file_to(self, path, destination, max_bytes=None):
+        self.downloads += 1
+        destination.write(self.files[path])
+        return len(self.files[path])
+
+
+@pytest.fixture
+def index(tmp_path):
+    return LocalIndex("https://contoso.sharepoint.com/sites/team", "test-token", str(tmp_path))
+
+
+def test_overlapping_folders_keep_their_own_documents(index):
+    client = FolderClient({
+        "/Docs/budget.txt": b"quarterly budget review",
+        "/Docs/Plans/roadmap.txt": b"roadmap planning kickoff"
+    })
+    index.sync_folder(client, "/Docs")
+    index.sync_folder(client, "/Docs/Plans")
+    assert client.downloads == 3
+
+    # Neither source takes over the other's rows, so nothing is deleted or downloaded again
+    for folder in ("/Docs", "/Docs/Plans"):
+        result = index.sync_folder(client, folder)
+        assert result["indexed"] == 0 and result["deleted"] == 0
+    assert client.downloads == 3
+    assert [hit["title"] for hit in index.search("budget")] == ["budget.txt"]
+
+
+def test_full_list_scan_commits_each_page(index):
+    with MockSharePointServer(item_count=2500) as server:
+        client = SharePointClient(server.site_url, "test-token")
+        pages = client.iter_list_item_pages
+        visible = []
+
+        def iter_pages(*args, **kwargs):
+            for page in pages(*args, **kwargs):
+                visible.append(index.status()["documents"])
+                yield page
+
+        client.iter_list_item_pages = iter_pages
+        result = index.sync_list(client, "Bench")
+
+    assert result == {"source": "list:Bench", "mode": "full", "indexed": 2500, "deleted": 0}
+    # Rows written for earlier pages are already visible to other connections
+    assert visible == [0, 1000, 2000]
+    assert index.search("Item 2499")[0]["item_id"] == 2499
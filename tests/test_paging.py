@@ -0,0 +1,96 @@
+"""
+List paging and scan strategies, against the mock server
+
+Run with: python -m pytest tests
+"""
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.odata import ODATA_METADATA_MODES
+from utils.sharepoint_client import SharePointClient
+from utils.streaming import streaming_available
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockSharePointServer(item_count=250) as mock:
+        yield mock
+
+
+def item_ids(pages):
+    return [int(item["ID"]) for page in pages for item in page]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("odata_metadata", ODATA_METADATA_MODES)
+def test_pages_follow_next_links_in_every_metadata_mode(server, odata_metadata, streaming):
+    if streaming and not streaming_available():
+        pytest.skip("ijson is not installed")
+    client = SharePointClient(server.site_url, "test-token", odata_metadata=odata_metadata)
+
+    pages = list(client.iter_list_item_pages("Bench", page_size=100, streaming=streaming))
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert item_ids(pages) == list(range(1, 251))
+    # Every mode is normalized to plain field dictionaries
+    assert pages[0][0] == {"Id": 1, "ID": 1, "Title": "Item 1", "Status": "Open"}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_max_items_stops_paging(server, streaming):
+    client = SharePointClient(server.site_url, "test-token")
+
+    items = list(client.iter_list_items("Bench", page_size=40, max_items=90, streaming=streaming))
+
+    assert [item["ID"] for item in items] == list(range(1, 91))
+
+
+def test_parallel_scan_yields_every_item_once_in_id_order(server):
+    client = SharePointClient(server.site_url, "test-token")
+
+    pages = list(client.iter_list_item_pages_parallel("Bench", page_size=30, max_workers=4, partition_size=40))
+
+    assert item_ids(pages) == list(range(1, 251))
+    assert max(len(page) for page in pages) <= 30
+
+
+def test_parallel_scan_skips_id_gaps_and_honours_max_items():
+    with MockSharePointServer(item_count=120) as server:
+        client = SharePointClient(server.site_url, "test-token")
+        for item_id in range(30, 80):
+            client.delete_list_item("Bench", item_id)
+
+        scanned = item_ids(client.scan_list_item_pages("Bench", scan_mode="parallel", page_size=25,
+                                                       max_workers=3))
+        limited = item_ids(client.iter_list_item_pages_parallel("Bench", max_items=35, partition_size=20))
+
+    assert scanned == list(range(1, 30)) + list(range(80, 121))
+    assert limited == list(range(1, 30)) + list(range(80, 86))
+
+
+def test_threshold_safe_scan_pages_with_row_limit(server):
+    client = SharePointClient(server.site_url, "test-token")
+
+    pages = list(client.scan_list_item_pages("Bench", scan_mode="threshold_safe", select_fields="Title",
+                                             page_size=100))
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert item_ids(pages) == list(range(1, 251))
+    # Rows are keyed by internal name, with the values rendered as text
+    assert pages[2][-1] == {"ID": "250", "Title": "Item 250"}
+
+
+def test_threshold_safe_scan_honours_max_items(server):
+    client = SharePointClient(server.site_url, "test-token")
+
+    pages = list(client.iter_list_data_pages("Bench", page_size=100, max_items=130))
+
+    assert [len(page) for page in pages] == [100, 30]
+
+
+def test_unknown_scan_mode_is_rejected(server):
+    client = SharePointClient(server.site_url, "test-token")
+
+    with pytest.raises(ValueError):
+        client.scan_list_item_pages("Bench", scan_mode="sideways")
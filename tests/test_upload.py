@@ -0,0 +1,84 @@
+"""
+Chunked uploads and their resumption, against the mock server
+
+Run with: python -m pytest tests
+"""
+
+import io
+
+import pytest
+
+from benchmarks.mock_server import MockSharePointServer
+from utils.retry import RetryPolicy
+from utils.sharepoint_client import ChunkedUploadError, SharePointClient
+
+CHUNK_SIZE = 1024
+
+CONTENT = bytes(range(256)) * 14
+
+
+@pytest.fixture
+def server():
+    with MockSharePointServer() as mock:
+        yield mock
+
+
+def upload_client(server):
+    # No retries, so that an injected failure reaches the caller
+    return SharePointClient(server.site_url, "test-token", retry_policy=RetryPolicy(max_retries=0))
+
+
+def test_chunked_upload(server):
+    client = upload_client(server)
+
+    info = client.upload_file_chunked("/Shared Documents", "data.bin", io.BytesIO(CONTENT), chunk_size=CHUNK_SIZE)
+
+    assert info["Length"] == str(len(CONTENT))
+    assert client.download_file("/Shared Documents/data.bin") == CONTENT
+
+
+def test_failed_chunk_reports_the_resume_point(server):
+    client = upload_client(server)
+    server.site.fail("ContinueUpload", times=1)
+
+    with pytest.raises(ChunkedUploadError) as raised:
+        client.upload_file_chunked("/Shared Documents", "data.bin", io.BytesIO(CONTENT), chunk_size=CHUNK_SIZE)
+
+    assert raised.value.offset == CHUNK_SIZE
+    assert raised.value.status_code == 503
+
+
+def test_upload_resumes_after_chunked_upload_error(server):
+    client = upload_client(server)
+    server.site.fail("ContinueUpload", times=2)
+
+    source = io.BytesIO(CONTENT)
+    upload_id, offset = None, 0
+    for _ in range(3):
+        source.seek(offset)
+        try:
+            info = client.upload_file_chunked("/Shared Documents", "data.bin", source, chunk_size=CHUNK_SIZE,
+                                              upload_id=upload_id, offset=offset)
+            break
+        except ChunkedUploadError as e:
+            upload_id, offset = e.upload_id, e.offset
+    else:
+        pytest.fail("upload did not complete")
+
+    assert info["Length"] == str(len(CONTENT))
+    assert client.download_file("/Shared Documents/data.bin") == CONTENT
+
+
+def test_failed_finish_can_be_resumed(server):
+    client = upload_client(server)
+    server.site.fail("FinishUpload", times=1)
+
+    source = io.BytesIO(CONTENT)
+    with pytest.raises(ChunkedUploadError) as raised:
+        client.upload_file_chunked("/Shared Documents", "data.bin", source, chunk_size=CHUNK_SIZE)
+
+    source.seek(raised.value.offset)
+    client.upload_file_chunked("/Shared Documents", "data.bin", source, chunk_size=CHUNK_SIZE,
+                               upload_id=raised.value.upload_id, offset=raised.value.offset)
+
+    assert client.download_file("/Shared Documents/data.bin") == CONTENT
@@ -0,0 +1,55 @@
+from collections.abc import Generator
+from typing import Any
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.batch import MAX_BATCH_SIZE
+from utils.bulk import bulk_summary, is_item_id, parse_bulk_entries
+from utils.sharepoint_client import SharePointClient
+
+
+class BulkDeleteListItemsTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get required parameters
+            list_title = tool_parameters.get("list_title", "")
+            batch_size = int(tool_parameters.get("batch_size") or MAX_BATCH_SIZE)
+            parallelism = int(tool_parameters.get("parallelism") or 1)
+            
+            # Validate required parameters
+            if not list_title:
+                yield self.create_text_message("Error: List title is required.")
+                return
+            item_ids, error = parse_bulk_entries(tool_parameters.get("item_ids", ""), "Item IDs", is_item_id,
+                                                 "a JSON array of positive integers")
+            if error:
+                yield self.create_text_message(f"Error: {error}")
+                return
+            
+            # Get optional parameters
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client
+            client = SharePointClient(site_url, access_token)
+            
+            # Delete the list items
+            results = client.bulk_delete_list_items(list_title, item_ids, batch_size=batch_size,
+                                                    max_workers=max(1, parallelism))
+            
+            # Return results
+            output = bulk_summary(results)
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(
+                f"Deleted {output['succeeded']} of {len(results)} items in list '{list_title}'"
+            )
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error deleting list items: {str(e)}")
+            yield self.create_json_message({"success": False, "error": str(e)})
@@ -0,0 +1,70 @@
+from collections.abc import Generator
+from typing import Any
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.sharepoint_client import CRAWL_WORKERS, SharePointClient
+
+# Number of listing entries emitted per message
+ENTRIES_PER_MESSAGE = 500
+
+
+class CrawlFoldersTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get required parameters
+            folder_path = tool_parameters.get("folder_path", "")
+            
+            # Validate required parameters
+            if not folder_path:
+                yield self.create_text_message("Error: Folder path is required.")
+                return
+            
+            # Get optional parameters
+            max_depth = tool_parameters.get("max_depth")
+            max_items = tool_parameters.get("max_items")
+            include_files = tool_parameters.get("include_files", True) is not False
+            parallelism = tool_parameters.get("parallelism") or CRAWL_WORKERS
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client
+            client = SharePointClient(site_url, access_token)
+            
+            # Emit the listing in chunks so the whole tree is never held in memory
+            entries = client.crawl_folder(
+                folder_path,
+                max_depth=int(max_depth) if max_depth else None,
+                max_items=int(max_items) if max_items else None,
+                include_files=include_files,
+                max_workers=int(parallelism)
+            )
+            
+            counts = {"folder": 0, "file": 0, "error": 0}
+            chunk = []
+            page_number = 0
+            for entry in entries:
+                counts[entry["type"]] += 1
+                chunk.append(entry)
+                if len(chunk) >= ENTRIES_PER_MESSAGE:
+                    page_number += 1
+                    yield self.create_json_message({"entries": chunk, "count": len(chunk), "page": page_number})
+                    chunk = []
+            
+            if chunk or page_number == 0:
+                yield self.create_json_message({"entries": chunk, "count": len(chunk), "page": page_number + 1})
+            
+            # Return results
+            if include_stats:
+                yield self.create_json_message({"_stats": client.stats.snapshot()})
+            summary = f"Found {counts['folder']} folders and {counts['file']} files under '{folder_path}'"
+            if counts["error"]:
+                summary += f" ({counts['error']} folders could not be read)"
+            yield self.create_text_message(summary)
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error crawling folders: {str(e)}")
@@ -19,6 +19,9 @@ class CreateListTool(Tool):
                 yield self.create_text_message("Error: List title is required.")
                 return
             
+            # Get optional parameters
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
             access_token = self.runtime.credentials["access_token"]
@@ -30,10 +33,13 @@ class CreateListTool(Tool):
             result = client.create_list(title, description)
             
             # Return results
-            yield self.create_json_message({
+            output = {
                 "success": True,
                 "list_info": result
-            })
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
             yield self.create_text_message(f"Successfully created list '{title}'")
             
         except Exception as e:
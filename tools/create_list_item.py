@@ -30,6 +30,9 @@ class CreateListItemTool(Tool):
                 yield self.create_text_message("Error: Item data must be valid JSON.")
                 return
             
+            # Get optional parameters
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
             access_token = self.runtime.credentials["access_token"]
@@ -41,10 +44,13 @@ class CreateListItemTool(Tool):
             result = client.create_list_item(list_title, item_data)
             
             # Return results
-            yield self.create_json_message({
+            output = {
                 "success": True,
                 "item_info": result
-            })
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
             yield self.create_text_message(f"Successfully created item in list '{list_title}'")
             
         except Exception as e:
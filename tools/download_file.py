@@ -1,27 +1,36 @@
 from collections.abc import Generator
 from typing import Any
+import mimetypes
+import posixpath
+import tempfile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
+from utils.blob_messages import blob_chunk_messages
 from utils.sharepoint_client import SharePointClient
 
+# Downloads are spooled in memory up to this size, then moved to a temp file
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
 
-class GetListItemsTool(Tool):
+# Largest file the tool will hand back as a blob message
+MAX_DOWNLOAD_BYTES = 128 * 1024 * 1024
+
+
+class DownloadFileTool(Tool):
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
         try:
             # Get required parameters
-            list_title = tool_parameters.get("list_title", "")
+            file_path = tool_parameters.get("file_path", "")
             
             # Validate required parameters
-            if not list_title:
-                yield self.create_text_message("Error: List title is required.")
+            if not file_path:
+                yield self.create_text_message("Error: File path is required.")
                 return
             
             # Get optional parameters
-            select_fields = tool_parameters.get("select_fields")
-            filter_query = tool_parameters.get("filter_query")
-            top = tool_parameters.get("top")
+            parallel_segments = int(tool_parameters.get("parallel_segments") or 1)
+            include_stats = bool(tool_parameters.get("include_stats"))
             
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
@@ -30,20 +39,35 @@ class GetListItemsTool(Tool):
             # Create SharePoint client
             client = SharePointClient(site_url, access_token)
             
-            # Get list items
-            items = client.get_list_items(
-                list_title=list_title,
-                select_fields=select_fields,
-                filter_query=filter_query,
-                top=top
-            )
-            
-            # Return results
-            yield self.create_json_message({
-                "items": items,
-                "count": len(items)
-            })
-            yield self.create_text_message(f"Retrieved {len(items)} items from list '{list_title}'")
+            file_name = posixpath.basename(file_path.rstrip("/"))
+            mime_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+            
+            # Stream the file into a spooled temp file instead of buffering the response
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as buffer:
+                size = client.download_file_to(
+                    file_path,
+                    buffer,
+                    max_bytes=MAX_DOWNLOAD_BYTES,
+                    parallel_segments=parallel_segments
+                )
+                buffer.seek(0)
+                
+                # Return results; the file is sent back chunk by chunk, never read into memory whole
+                yield from blob_chunk_messages(buffer, size, {
+                    "mime_type": mime_type,
+                    "filename": file_name
+                })
+            
+            output = {
+                "file_name": file_name,
+                "file_path": file_path,
+                "size": size,
+                "mime_type": mime_type
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(f"Downloaded '{file_name}' ({size} bytes)")
             
         except Exception as e:
-            yield self.create_text_message(f"Error retrieving list items: {str(e)}")
+            yield self.create_text_message(f"Error downloading file: {str(e)}")
@@ -0,0 +1,110 @@
+from collections.abc import Generator
+from typing import Any
+import io
+import re
+import tempfile
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.blob_messages import blob_chunk_messages
+from utils.export import EXPORT_FORMATS, ListExportWriter
+from utils.sharepoint_client import SCAN_MODES, SCAN_WORKERS, SharePointClient
+
+# Exports read large pages, as only one page is held in memory at a time
+EXPORT_PAGE_SIZE = 1000
+
+
+class ExportListItemsTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get required parameters
+            list_title = tool_parameters.get("list_title", "")
+            
+            # Validate required parameters
+            if not list_title:
+                yield self.create_text_message("Error: List title is required.")
+                return
+            
+            # Get optional parameters
+            export_format = tool_parameters.get("export_format") or "ndjson"
+            select_fields = tool_parameters.get("select_fields")
+            filter_query = tool_parameters.get("filter_query")
+            page_size = tool_parameters.get("page_size") or EXPORT_PAGE_SIZE
+            scan_mode = tool_parameters.get("scan_mode") or "standard"
+            caml_filter = tool_parameters.get("caml_filter")
+            parallelism = tool_parameters.get("parallelism") or SCAN_WORKERS
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            if export_format not in EXPORT_FORMATS:
+                yield self.create_text_message(f"Error: Unsupported export format '{export_format}'.")
+                return
+            if scan_mode not in SCAN_MODES:
+                yield self.create_text_message(f"Error: Unsupported scan mode '{scan_mode}'.")
+                return
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client
+            client = SharePointClient(site_url, access_token)
+            
+            # Columns follow the list's field order, restricted to the selected fields
+            fields = client.get_list_fields(list_title)
+            if select_fields:
+                selected = {name.split("/")[0].strip() for name in select_fields.split(",")}
+                fields = [field for field in fields if field["InternalName"] in selected]
+            pages = client.scan_list_item_pages(
+                list_title=list_title,
+                scan_mode=scan_mode,
+                select_fields=select_fields,
+                filter_query=filter_query,
+                caml_where=caml_filter,
+                page_size=int(page_size),
+                max_workers=int(parallelism),
+                streaming=True
+            )
+            
+            mime_type, extension = EXPORT_FORMATS[export_format]
+            file_name = f"{re.sub(r'[^A-Za-z0-9._-]+', '_', list_title).strip('_') or 'list'}.{extension}"
+            
+            # Pages are written to a temp file as they arrive, so memory use does not grow with the list
+            with tempfile.TemporaryFile() as export_file:
+                stream = io.TextIOWrapper(export_file, encoding="utf-8", newline="")
+                writer = ListExportWriter(stream, export_format, fields, rendered_rows=scan_mode == "threshold_safe")
+                for items in pages:
+                    writer.write_page(items)
+                writer.close()
+                stream.detach()
+                
+                size = export_file.tell()
+                export_file.seek(0)
+                
+                # Return results
+                yield from blob_chunk_messages(export_file, size, {
+                    "mime_type": mime_type,
+                    "filename": file_name
+                })
+            
+            output = {
+                "file_name": file_name,
+                "export_format": export_format,
+                "count": writer.rows,
+                "columns": writer.columns or [],
+                "size": size
+            }
+            if writer.dropped_columns:
+                output["dropped_columns"] = writer.dropped_columns
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(f"Exported {writer.rows} items from list '{list_title}' to '{file_name}'")
+            if writer.dropped_columns:
+                yield self.create_text_message(
+                    f"Warning: properties missing from the CSV header were left out: {', '.join(writer.dropped_columns)}. "
+                    "Select them with select_fields, or export as NDJSON, to include them."
+                )
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error exporting list items: {str(e)}")
@@ -4,24 +4,33 @@ from typing import Any
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
+from utils.projections import DEFAULT_PROJECTION
 from utils.sharepoint_client import SharePointClient
 
 
 class GetContentTypesTool(Tool):
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
         try:
+            # Get optional parameters
+            projection = tool_parameters.get("projection") or DEFAULT_PROJECTION
+            select_fields = tool_parameters.get("select_fields")
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
             access_token = self.runtime.credentials["access_token"]
             
-            # Create SharePoint client
-            client = SharePointClient(site_url, access_token)
+            # Create SharePoint client; this endpoint rarely changes, so serve it from the response cache
+            client = SharePointClient(site_url, access_token, cache_responses=True)
             
             # Get all content types
-            content_types = client.get_content_types()
+            content_types = client.get_content_types(projection=projection, select=select_fields)
             
             # Return results
-            yield self.create_json_message({"content_types": content_types})
+            output = {"content_types": content_types}
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
             yield self.create_text_message(f"Found {len(content_types)} content types in SharePoint site")
             
         except Exception as e:
@@ -1,10 +1,12 @@
 from collections.abc import Generator
 from typing import Any
+import hashlib
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from utils.sharepoint_client import SharePointClient
+from utils.retry import SharePointAPIError
+from utils.sharepoint_client import DEFAULT_PAGE_SIZE, SCAN_MODES, SCAN_WORKERS, SharePointClient
 
 
 class GetListItemsTool(Tool):
@@ -22,6 +24,16 @@ class GetListItemsTool(Tool):
             select_fields = tool_parameters.get("select_fields")
             filter_query = tool_parameters.get("filter_query")
             top = tool_parameters.get("top")
+            page_size = tool_parameters.get("page_size") or DEFAULT_PAGE_SIZE
+            delta = bool(tool_parameters.get("delta"))
+            scan_mode = tool_parameters.get("scan_mode") or "standard"
+            caml_filter = tool_parameters.get("caml_filter")
+            parallelism = tool_parameters.get("parallelism") or SCAN_WORKERS
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            if scan_mode not in SCAN_MODES:
+                yield self.create_text_message(f"Error: Unsupported scan mode '{scan_mode}'.")
+                return
             
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
@@ -30,20 +42,90 @@ class GetListItemsTool(Tool):
             # Create SharePoint client
             client = SharePointClient(site_url, access_token)
             
-            # Get list items
-            items = client.get_list_items(
+            # In delta mode only changes since the stored change token are returned
+            change_token = None
+            token_key = self._change_token_key(site_url, list_title)
+            if delta:
+                change_token = self._load_change_token(token_key)
+                if change_token:
+                    try:
+                        result = client.get_list_item_delta(
+                            list_title,
+                            change_token,
+                            select_fields=select_fields,
+                            filter_query=filter_query
+                        )
+                    except SharePointAPIError as e:
+                        # Expired or invalid tokens are rejected with 400; fall back to a full sync
+                        if e.status_code != 400:
+                            raise
+                    else:
+                        output = {
+                            "mode": "delta",
+                            "added": result["added"],
+                            "updated": result["updated"],
+                            "deleted": result["deleted"]
+                        }
+                        if include_stats:
+                            output["_stats"] = client.stats.snapshot()
+                        yield self.create_json_message(output)
+                        self.session.storage.set(token_key, result["change_token"].encode("utf-8"))
+                        yield self.create_text_message(
+                            f"List '{list_title}' changes: {len(result['added'])} added, "
+                            f"{len(result['updated'])} updated, {len(result['deleted'])} deleted"
+                        )
+                        return
+                
+                # Take the token before scanning so changes made during the scan are not missed
+                change_token = client.get_list_change_token(list_title)
+            
+            # Emit list items page by page so the full list is never held in memory
+            total = 0
+            # A delta baseline must cover the whole list, so top is ignored in delta mode
+            max_items = int(top) if top and not delta else None
+            # threshold_safe uses CAML paging in ID order, which works on lists above the
+            # 5000 item view threshold; parallel fetches ID ranges concurrently in ID order
+            pages = client.scan_list_item_pages(
                 list_title=list_title,
+                scan_mode=scan_mode,
                 select_fields=select_fields,
                 filter_query=filter_query,
-                top=top
+                caml_where=caml_filter,
+                page_size=int(page_size),
+                max_items=max_items,
+                max_workers=int(parallelism),
+                streaming=True
             )
+            for page_number, items in enumerate(pages, start=1):
+                total += len(items)
+                yield self.create_json_message({
+                    "items": items,
+                    "count": len(items),
+                    "page": page_number
+                })
             
-            # Return results
-            yield self.create_json_message({
-                "items": items,
-                "count": len(items)
-            })
-            yield self.create_text_message(f"Retrieved {len(items)} items from list '{list_title}'")
+            if total == 0:
+                yield self.create_json_message({"items": [], "count": 0, "page": 1})
+            if delta:
+                self.session.storage.set(token_key, change_token.encode("utf-8"))
+            if include_stats:
+                # Pages are streamed as they arrive, so the totals follow as a message of their own
+                yield self.create_json_message({"_stats": client.stats.snapshot()})
+            yield self.create_text_message(f"Retrieved {total} items from list '{list_title}'")
             
         except Exception as e:
             yield self.create_text_message(f"Error retrieving list items: {str(e)}")
+    
+    @staticmethod
+    def _change_token_key(site_url: str, list_title: str) -> str:
+        """Build the plugin storage key holding a list's delta change token"""
+        digest = hashlib.sha256(f"{site_url.rstrip('/').lower()}|{list_title.lower()}".encode("utf-8"))
+        return f"change_token_{digest.hexdigest()}"
+    
+    def _load_change_token(self, key: str) -> str | None:
+        """Load a stored change token, or None if the list has not been synced yet"""
+        try:
+            token = self.session.storage.get(key)
+        except Exception:
+            return None
+        return token.decode("utf-8") if token else None
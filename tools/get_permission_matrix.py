@@ -0,0 +1,65 @@
+from collections.abc import Generator
+from typing import Any
+import json
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.sharepoint_client import SharePointClient
+
+
+class GetPermissionMatrixTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get required parameters
+            user_emails_str = tool_parameters.get("user_emails", "")
+            
+            # Validate required parameters
+            if not user_emails_str:
+                yield self.create_text_message("Error: User emails are required.")
+                return
+            
+            # Accept either a JSON array or a comma-separated list
+            try:
+                user_emails = json.loads(user_emails_str)
+            except json.JSONDecodeError:
+                user_emails = user_emails_str.split(",")
+            if not isinstance(user_emails, list):
+                yield self.create_text_message("Error: User emails must be a JSON array or a comma-separated list.")
+                return
+            user_emails = [str(email).strip() for email in user_emails if str(email).strip()]
+            
+            # Get optional parameters
+            list_titles_str = tool_parameters.get("list_titles")
+            list_titles = [title.strip() for title in list_titles_str.split(",") if title.strip()] \
+                if list_titles_str else []
+            parallelism = int(tool_parameters.get("parallelism") or 4)
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client; role definitions rarely change, so serve them from the response cache
+            client = SharePointClient(site_url, access_token, cache_responses=True)
+            
+            # Resolve the users and read their permissions in batches
+            matrix = client.get_permission_matrix(user_emails, list_titles, max_workers=max(1, parallelism))
+            failed = sum(1 for entry in matrix["users"] if "error" in entry)
+            
+            # Return results
+            output = {
+                "users": matrix["users"],
+                "permission_levels": matrix["permission_levels"],
+                "count": len(matrix["users"]),
+                "failed": failed
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(
+                f"Retrieved permissions for {len(user_emails) - failed} of {len(user_emails)} users"
+            )
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error retrieving permission matrix: {str(e)}")
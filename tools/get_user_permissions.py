@@ -4,6 +4,7 @@ from typing import Any
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
+from utils.permissions import decode_permissions
 from utils.sharepoint_client import SharePointClient
 
 
@@ -18,6 +19,9 @@ class GetUserPermissionsTool(Tool):
                 yield self.create_text_message("Error: User email is required.")
                 return
             
+            # Get optional parameters
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
             access_token = self.runtime.credentials["access_token"]
@@ -25,7 +29,7 @@ class GetUserPermissionsTool(Tool):
             # Create SharePoint client
             client = SharePointClient(site_url, access_token)
             
-            # Get user information first
+            # Get user information first; effective permissions are looked up by login name
             try:
                 user_info = client.get_user_by_email(user_email)
             except Exception as e:
@@ -33,13 +37,17 @@ class GetUserPermissionsTool(Tool):
                 return
             
             # Get user permissions
-            permissions = client.get_user_effective_permissions(user_email)
+            permissions = client.get_user_effective_permissions(user_info.get("LoginName") or user_email)
             
             # Return results
-            yield self.create_json_message({
+            output = {
                 "permissions": permissions,
+                "rights": decode_permissions(permissions),
                 "user_info": user_info
-            })
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
             yield self.create_text_message(f"Retrieved permissions for user '{user_email}'")
             
         except Exception as e:
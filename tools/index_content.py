@@ -0,0 +1,73 @@
+from collections.abc import Generator
+from typing import Any
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.local_index import INDEX_WORKERS, LocalIndex
+from utils.sharepoint_client import SharePointClient
+
+
+class IndexContentTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get optional parameters
+            list_titles_str = tool_parameters.get("list_titles")
+            folder_paths_str = tool_parameters.get("folder_paths")
+            max_depth = tool_parameters.get("max_depth")
+            parallelism = tool_parameters.get("parallelism") or INDEX_WORKERS
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            list_titles = [title.strip() for title in (list_titles_str or "").split(",") if title.strip()]
+            folder_paths = [path.strip() for path in (folder_paths_str or "").split(",") if path.strip()]
+            
+            # Validate parameters
+            if not list_titles and not folder_paths:
+                yield self.create_text_message("Error: At least one list title or folder path is required.")
+                return
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client
+            client = SharePointClient(site_url, access_token)
+            index = LocalIndex(site_url, access_token)
+            
+            # Sources are synced one by one; a failing source does not stop the others
+            sources = []
+            for list_title in list_titles:
+                try:
+                    sources.append(index.sync_list(client, list_title))
+                except Exception as e:
+                    sources.append({"source": f"list:{list_title}", "error": str(e)})
+            for folder_path in folder_paths:
+                try:
+                    sources.append(index.sync_folder(
+                        client,
+                        folder_path,
+                        max_depth=int(max_depth) if max_depth else None,
+                        max_workers=int(parallelism)
+                    ))
+                except Exception as e:
+                    sources.append({"source": f"folder:{folder_path}", "error": str(e)})
+            
+            status = index.status()
+            failed = sum(1 for source in sources if "error" in source)
+            
+            # Return results
+            output = {
+                "sources": sources,
+                "documents": status["documents"],
+                "failed": failed
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(
+                f"Indexed {len(sources) - failed} of {len(sources)} sources; "
+                f"the local index holds {status['documents']} documents"
+            )
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error indexing content: {str(e)}")
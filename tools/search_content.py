@@ -21,6 +21,9 @@ class SearchContentTool(Tool):
             # Get optional parameters
             select_properties = tool_parameters.get("select_properties")
             row_limit = tool_parameters.get("row_limit", 10)
+            auto_page = bool(tool_parameters.get("auto_page"))
+            max_results = tool_parameters.get("max_results") or 1000
+            include_stats = bool(tool_parameters.get("include_stats"))
             
             # Parse select_properties if provided
             select_props_list = None
@@ -34,6 +37,26 @@ class SearchContentTool(Tool):
             # Create SharePoint client
             client = SharePointClient(site_url, access_token)
             
+            # In auto-paging mode every page up to max_results is collected
+            if auto_page:
+                search_results = client.search_all(
+                    query=query,
+                    select_properties=select_props_list,
+                    max_results=int(max_results)
+                )
+                rows = search_results["results"]
+                total_rows = search_results["total_rows"]
+                
+                output = {
+                    "results": rows,
+                    "total_rows": total_rows
+                }
+                if include_stats:
+                    output["_stats"] = client.stats.snapshot()
+                yield self.create_json_message(output)
+                yield self.create_text_message(f"Found {len(rows)} results for query '{query}' (total: {total_rows})")
+                return
+            
             # Perform search
             search_results = client.search(
                 query=query,
@@ -47,10 +70,13 @@ class SearchContentTool(Tool):
             total_rows = results.get("TotalRows", 0)
             
             # Return results
-            yield self.create_json_message({
+            output = {
                 "results": rows,
                 "total_rows": total_rows
-            })
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
             yield self.create_text_message(f"Found {len(rows)} results for query '{query}' (total: {total_rows})")
             
         except Exception as e:
@@ -0,0 +1,85 @@
+from collections.abc import Generator
+from typing import Any
+import time
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from utils.local_index import LocalIndex
+from utils.sharepoint_client import SharePointClient
+
+# Default age, in minutes, after which the local index is considered stale
+DEFAULT_MAX_AGE_MINUTES = 60
+
+
+class SearchLocalIndexTool(Tool):
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        try:
+            # Get required parameters
+            query = tool_parameters.get("query", "")
+            
+            # Validate required parameters
+            if not query:
+                yield self.create_text_message("Error: Search query is required.")
+                return
+            
+            # Get optional parameters
+            max_results = int(tool_parameters.get("max_results") or 20)
+            max_age_minutes = tool_parameters.get("max_age_minutes")
+            max_age_minutes = DEFAULT_MAX_AGE_MINUTES if max_age_minutes is None else float(max_age_minutes)
+            fallback = tool_parameters.get("fallback", True)
+            include_stats = bool(tool_parameters.get("include_stats"))
+            
+            # Get credentials from runtime
+            site_url = self.runtime.credentials["site_url"]
+            access_token = self.runtime.credentials["access_token"]
+            
+            # Create SharePoint client; it only sends requests when falling back to search
+            client = SharePointClient(site_url, access_token)
+            
+            # Query the local index while it is fresh
+            index = LocalIndex(site_url, access_token)
+            started = time.perf_counter()
+            status = index.status()
+            fresh = status["age"] is not None and status["age"] <= max_age_minutes * 60
+            if fresh:
+                results = index.search(query, limit=max_results)
+                output = {
+                    "results": results,
+                    "count": len(results),
+                    "source": "local_index",
+                    "index_age_seconds": round(status["age"], 1),
+                    "query_ms": round((time.perf_counter() - started) * 1000, 2)
+                }
+                if include_stats:
+                    output["_stats"] = client.stats.snapshot()
+                yield self.create_json_message(output)
+                yield self.create_text_message(f"Found {len(results)} results for query '{query}' in the local index")
+                return
+            
+            if not fallback:
+                state = "empty" if status["age"] is None else f"{int(status['age'] // 60)} minutes old"
+                yield self.create_text_message(f"Error: The local index is {state}; run index_content first.")
+                return
+            
+            # The index is empty or stale: fall back to the search endpoint
+            search_results = client.search_all(query, max_results=max_results)
+            
+            # Return results
+            output = {
+                "results": search_results["results"],
+                "count": len(search_results["results"]),
+                "source": "search",
+                "index_age_seconds": round(status["age"], 1) if status["age"] is not None else None,
+                "total_rows": search_results["total_rows"]
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(
+                f"Found {len(search_results['results'])} results for query '{query}' "
+                f"(local index stale, searched SharePoint)"
+            )
+            
+        except Exception as e:
+            yield self.create_text_message(f"Error searching local index: {str(e)}")
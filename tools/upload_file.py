@@ -1,27 +1,37 @@
 from collections.abc import Generator
 from typing import Any
 
+import requests
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from utils.sharepoint_client import SharePointClient
+from utils.sharepoint_client import UPLOAD_CHUNK_SIZE, ChunkedUploadError, SharePointClient
 
+# Number of times a failed chunked upload is resumed within one invocation
+MAX_RESUME_ATTEMPTS = 3
 
-class GetListItemsTool(Tool):
+
+class UploadFileTool(Tool):
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
         try:
             # Get required parameters
-            list_title = tool_parameters.get("list_title", "")
+            file = tool_parameters.get("file")
+            folder_path = tool_parameters.get("folder_path", "")
             
             # Validate required parameters
-            if not list_title:
-                yield self.create_text_message("Error: List title is required.")
+            if not file:
+                yield self.create_text_message("Error: File is required.")
+                return
+            if not folder_path:
+                yield self.create_text_message("Error: Folder path is required.")
                 return
             
             # Get optional parameters
-            select_fields = tool_parameters.get("select_fields")
-            filter_query = tool_parameters.get("filter_query")
-            top = tool_parameters.get("top")
+            file_name = tool_parameters.get("file_name") or file.filename
+            if not file_name:
+                yield self.create_text_message("Error: File name is required.")
+                return
+            include_stats = bool(tool_parameters.get("include_stats"))
             
             # Get credentials from runtime
             site_url = self.runtime.credentials["site_url"]
@@ -30,20 +40,60 @@ class GetListItemsTool(Tool):
             # Create SharePoint client
             client = SharePointClient(site_url, access_token)
             
-            # Get list items
-            items = client.get_list_items(
-                list_title=list_title,
-                select_fields=select_fields,
-                filter_query=filter_query,
-                top=top
-            )
+            # Stream the source file straight into the upload session, resuming
+            # from the last acknowledged offset if a chunk fails
+            upload_id = None
+            offset = 0
+            attempt = 0
+            while True:
+                source = self._open_source(file.url, offset)
+                try:
+                    result = client.upload_file_chunked(
+                        folder_path,
+                        file_name,
+                        source.raw,
+                        chunk_size=UPLOAD_CHUNK_SIZE,
+                        upload_id=upload_id,
+                        offset=offset
+                    )
+                    break
+                except ChunkedUploadError as e:
+                    attempt += 1
+                    if attempt > MAX_RESUME_ATTEMPTS:
+                        raise
+                    upload_id, offset = e.upload_id, e.offset
+                finally:
+                    source.close()
             
             # Return results
-            yield self.create_json_message({
-                "items": items,
-                "count": len(items)
-            })
-            yield self.create_text_message(f"Retrieved {len(items)} items from list '{list_title}'")
+            output = {
+                "success": True,
+                "file_info": result
+            }
+            if include_stats:
+                output["_stats"] = client.stats.snapshot()
+            yield self.create_json_message(output)
+            yield self.create_text_message(f"Successfully uploaded '{file_name}' to '{folder_path}'")
             
         except Exception as e:
-            yield self.create_text_message(f"Error retrieving list items: {str(e)}")
+            yield self.create_text_message(f"Error uploading file: {str(e)}")
+            yield self.create_json_message({"success": False, "error": str(e)})
+    
+    @staticmethod
+    def _open_source(url: str, offset: int) -> requests.Response:
+        """Open a streaming response for the source file positioned at offset"""
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = requests.get(url, headers=headers, stream=True, timeout=(10, 120))
+        response.raise_for_status()
+        response.raw.decode_content = True
+        
+        # Skip ahead manually if the file server ignored the Range header
+        if offset and response.status_code != 206:
+            remaining = offset
+            while remaining > 0:
+                skipped = response.raw.read(min(remaining, UPLOAD_CHUNK_SIZE))
+                if not skipped:
+                    break
+                remaining -= len(skipped)
+        
+        return response
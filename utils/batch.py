@@ -0,0 +1,278 @@
+import json
+import re
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote
+
+from utils.odata import get_entity, get_results
+
+# SharePoint Online rejects $batch requests with more than 100 operations
+MAX_BATCH_SIZE = 100
+
+READ_METHODS = {"GET"}
+WRITE_METHODS = {"POST", "PUT", "PATCH", "MERGE", "DELETE"}
+SUPPORTED_METHODS = READ_METHODS | WRITE_METHODS
+
+# Methods that update or remove an existing entity and therefore need If-Match
+_CONDITIONAL_METHODS = {"PUT", "PATCH", "MERGE", "DELETE"}
+
+_STATUS_LINE = re.compile(r"^HTTP/1\.[01] (\d{3})(?: ([^\r\n]*))?\r?$", re.MULTILINE)
+
+CRLF = "\r\n"
+
+# Characters left as is when encoding request lines, in the path and in query
+# names and values; anything else, '%' included, is percent-encoded
+_PATH_SAFE = "/:@!$&'()*+,;=~"
+_QUERY_SAFE = "/:@!$'()*+,;?~"
+
+
+def resolve_url(base_api_url: str, url: str) -> str:
+    """Turn an endpoint relative to the API root into an absolute URL"""
+    if url.lower().startswith(("http://", "https://")):
+        return url
+    return f"{base_api_url}/{url.lstrip('/')}"
+
+
+def encode_url(url: str) -> str:
+    """
+    Percent-encode a URL for an embedded request line
+
+    Request lines are split on spaces, so a space in a list title or filter
+    would break the operation. The path and each query name and value are
+    encoded separately, so literal '%', '#' or '=' characters in titles and
+    values reach the service as written; URLs must not be pre-encoded, and
+    '&' in a value still separates parameters.
+    """
+    path, separator, query = url.partition("?")
+    encoded = quote(path, safe=_PATH_SAFE)
+    if separator:
+        params = []
+        for param in query.split("&"):
+            name, equals, value = param.partition("=")
+            params.append(f"{quote(name, safe=_QUERY_SAFE)}{equals}{quote(value, safe=_QUERY_SAFE)}")
+        encoded = f"{encoded}?{'&'.join(params)}"
+    return encoded
+
+
+def _build_operation(request: Dict[str, Any], base_api_url: str, accept: str) -> List[str]:
+    """Build the MIME lines for a single embedded HTTP request"""
+    method = request["method"].upper()
+    url = encode_url(resolve_url(base_api_url, request["url"]))
+    data = request.get("data")
+
+    lines = [
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        f"{method} {url} HTTP/1.1",
+        f"Accept: {accept}"
+    ]
+
+    extra_headers = dict(request.get("headers") or {})
+    if method in _CONDITIONAL_METHODS:
+        extra_headers.setdefault("If-Match", "*")
+    if data is not None:
+        extra_headers.setdefault("Content-Type", "application/json;odata=verbose")
+    for name, value in extra_headers.items():
+        lines.append(f"{name}: {value}")
+
+    lines.append("")
+    if data is not None:
+        lines.append(json.dumps(data))
+    lines.append("")
+    return lines
+
+
+def operation_groups(requests_batch: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Split the operations of a batch into its top-level parts
+
+    Each read is a part of its own; each run of consecutive writes forms one
+    changeset, as required by the OData batch format. The service answers
+    every part with one top-level response part.
+    """
+    groups: List[List[Dict[str, Any]]] = []
+    for request in requests_batch:
+        is_write = request["method"].upper() in WRITE_METHODS
+        if is_write and groups and groups[-1][-1]["method"].upper() in WRITE_METHODS:
+            groups[-1].append(request)
+        else:
+            groups.append([request])
+    return groups
+
+
+def build_batch_body(requests_batch: List[Dict[str, Any]], base_api_url: str,
+                     accept: str = "application/json;odata=verbose") -> Tuple[str, str]:
+    """
+    Build a multipart/mixed $batch body
+
+    Reads are sent as top-level parts; runs of consecutive writes are wrapped
+    in a single changeset (see operation_groups).
+
+    Args:
+        requests_batch: List of request dictionaries with 'method', 'url', optional 'data' and 'headers'
+        base_api_url: Absolute URL of the site's _api root
+        accept: Accept header sent with every embedded request
+
+    Returns:
+        Tuple of (batch boundary, request body)
+    """
+    batch_boundary = f"batch_{uuid.uuid4()}"
+    lines: List[str] = []
+
+    for group in operation_groups(requests_batch):
+        lines.append(f"--{batch_boundary}")
+        if group[0]["method"].upper() in READ_METHODS:
+            lines.extend(_build_operation(group[0], base_api_url, accept))
+            continue
+
+        changeset_boundary = f"changeset_{uuid.uuid4()}"
+        lines.append(f"Content-Type: multipart/mixed; boundary={changeset_boundary}")
+        lines.append("")
+        for request in group:
+            lines.append(f"--{changeset_boundary}")
+            lines.extend(_build_operation(request, base_api_url, accept))
+        lines.append(f"--{changeset_boundary}--")
+
+    lines.append(f"--{batch_boundary}--")
+    lines.append("")
+    return batch_boundary, CRLF.join(lines)
+
+
+def parse_batch_response(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse a multipart/mixed $batch response into per-operation results
+
+    Embedded responses are returned in the order the service emitted them,
+    which matches the order of the operations in the request.
+
+    Returns:
+        List of dictionaries with 'status', 'reason', 'headers' and 'body'
+    """
+    matches = list(_STATUS_LINE.finditer(text))
+    results = []
+
+    for position, match in enumerate(matches):
+        end = matches[position + 1].start() if position + 1 < len(matches) else len(text)
+        segment = text[match.end():end].replace("\r\n", "\n").lstrip("\n")
+
+        head, _, body = segment.partition("\n\n")
+
+        headers = {}
+        for line in head.split("\n"):
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip()] = value.strip()
+
+        # The body runs until the next boundary delimiter
+        body_lines = []
+        for line in body.split("\n"):
+            if line.startswith("--"):
+                break
+            body_lines.append(line)
+        raw_body = "\n".join(body_lines).strip()
+
+        parsed_body: Optional[Any] = None
+        if raw_body:
+            try:
+                parsed_body = json.loads(raw_body)
+            except ValueError:
+                parsed_body = raw_body
+
+        results.append({
+            "status": int(match.group(1)),
+            "reason": (match.group(2) or "").strip(),
+            "headers": headers,
+            "body": parsed_body
+        })
+
+    return results
+
+
+def parse_batch_groups(text: str) -> List[List[Dict[str, Any]]]:
+    """
+    Parse a multipart/mixed $batch response into its top-level parts
+
+    Returns:
+        One list per top-level part, in order: a single response for a read,
+        the responses of every operation for a changeset that succeeded, or a
+        single error response for a changeset that failed
+    """
+    delimiter = next((line.strip() for line in text.splitlines() if line.startswith("--")), None)
+    if delimiter is None:
+        return []
+    boundary = delimiter[2:]
+    if boundary.endswith("--"):
+        boundary = boundary[:-2]
+
+    segments = re.split(rf"^--{re.escape(boundary)}(?:--)?[ \t]*\r?$", text, flags=re.MULTILINE)
+    groups = [parse_batch_response(segment) for segment in segments[1:]]
+    return [parts for parts in groups if parts]
+
+
+def match_batch_results(group_sizes: List[int], groups: List[List[Dict[str, Any]]],
+                        status: int, text: str) -> List[Dict[str, Any]]:
+    """
+    Map the top-level response parts of a $batch call back to its operations
+
+    Responses are matched part by part, so a failed changeset, answered with
+    a single error, does not shift the results of the parts that follow: its
+    error is reported for every operation of the changeset.
+
+    Args:
+        group_sizes: Number of operations in each top-level request part (see operation_groups)
+        groups: Top-level response parts (see parse_batch_groups)
+        status: HTTP status of the $batch response
+        text: Response body, quoted in the error of operations left without a response
+
+    Returns:
+        One result per operation, in request order (see to_operation_result)
+    """
+    detail = " ".join(text.split())[:200] or "empty response"
+    missing = {"error": f"{status} No response returned for batch operation: {detail}", "status": status}
+
+    results: List[Dict[str, Any]] = []
+    for index, size in enumerate(group_sizes):
+        parts = groups[index] if index < len(groups) else []
+        if len(parts) == 1 and size > 1 and parts[0]["status"] >= 400:
+            failure = to_operation_result(parts[0])
+            results.extend(dict(failure) for _ in range(size))
+            continue
+        results.extend(to_operation_result(parts[position]) if position < len(parts) else dict(missing)
+                       for position in range(size))
+    return results
+
+
+def to_operation_result(part: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a parsed batch part into the result shape returned by execute_batch
+
+    Entities are returned normalized as get_entity would, collections as
+    {"results": [...]} normalized as get_results would, and failures as
+    {"error": ..., "status": ...}.
+    """
+    status = part["status"]
+    body = part["body"]
+
+    if status >= 400:
+        message = part["reason"] or "Request failed"
+        if isinstance(body, dict):
+            error = body.get("error") or body.get("odata.error") or {}
+            error_message = error.get("message") if isinstance(error, dict) else None
+            if isinstance(error_message, dict):
+                error_message = error_message.get("value")
+            if error_message:
+                message = error_message
+        elif isinstance(body, str) and body:
+            message = body
+        return {"error": f"{status} {message}", "status": status}
+
+    if body is None:
+        return {"success": True, "status": status}
+    if isinstance(body, dict):
+        # Normalized like top-level responses, so every metadata mode yields the same shape
+        data = body.get("d", body)
+        if isinstance(data, dict) and (isinstance(data.get("results"), list) or isinstance(data.get("value"), list)):
+            return {"results": get_results(body)}
+        return get_entity(body) or {"success": True, "status": status}
+    return {"success": True, "status": status, "content": body}
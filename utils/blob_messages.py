@@ -0,0 +1,44 @@
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator
+
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+# Size of the blob chunks streamed back to Dify, the size the plugin SDK splits blob messages into
+BLOB_CHUNK_SIZE = 8192
+
+
+def blob_chunk_messages(file: BinaryIO, size: int, meta: Dict[str, Any],
+                        chunk_size: int = BLOB_CHUNK_SIZE) -> Iterator[ToolInvokeMessage]:
+    """
+    Stream a file back as blob chunk messages
+
+    create_blob_message needs the whole file in memory, and the SDK copies it
+    again while splitting it; sending the chunks directly only ever holds one.
+
+    Args:
+        file: Binary file object positioned at the start of the content
+        size: Total size of the content in bytes
+        meta: Message metadata, such as 'mime_type' and 'filename'
+        chunk_size: Bytes per chunk
+    """
+    blob_id = uuid.uuid4().hex
+    sequence = 0
+    while chunk := file.read(chunk_size):
+        yield _blob_chunk_message(blob_id, sequence, size, chunk, False, meta)
+        sequence += 1
+    yield _blob_chunk_message(blob_id, sequence, size, b"", True, meta)
+
+
+def _blob_chunk_message(blob_id: str, sequence: int, total_length: int, chunk: bytes, end: bool,
+                        meta: Dict[str, Any]) -> ToolInvokeMessage:
+    return ToolInvokeMessage(
+        type=ToolInvokeMessage.MessageType.BLOB_CHUNK,
+        message=ToolInvokeMessage.BlobChunkMessage(
+            id=blob_id,
+            sequence=sequence,
+            total_length=total_length,
+            blob=chunk,
+            end=end
+        ),
+        meta=meta
+    )
@@ -0,0 +1,49 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def is_item_id(value: Any) -> bool:
+    """Check whether a value is a valid list item ID: a positive integer (booleans excluded)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def is_object(value: Any) -> bool:
+    """Check whether a value is a JSON object"""
+    return isinstance(value, dict)
+
+
+def parse_bulk_entries(value: str, label: str, is_valid: Callable[[Any], bool],
+                       expected: str) -> Tuple[Optional[List[Any]], Optional[str]]:
+    """
+    Parse the JSON array parameter of a bulk tool
+
+    Args:
+        value: Raw parameter value
+        label: Name of the parameter in error messages (e.g., "Items")
+        is_valid: Check applied to every entry
+        expected: Description of a valid array in error messages (e.g., "a JSON array of objects")
+
+    Returns:
+        Tuple of (entries, None), or (None, error message) when the value is missing or invalid
+    """
+    if not value:
+        return None, f"{label} are required."
+    try:
+        entries = json.loads(value)
+    except json.JSONDecodeError:
+        return None, f"{label} must be valid JSON."
+    if not isinstance(entries, list) or not all(is_valid(entry) for entry in entries):
+        return None, f"{label} must be {expected}."
+    return entries, None
+
+
+def bulk_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the output of a bulk tool from the per-item results"""
+    succeeded = sum(1 for result in results if result["success"])
+    failed = len(results) - succeeded
+    return {
+        "success": failed == 0,
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results
+    }
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live
+
+    Meant to be shared at module level so that cached values survive across
+    tool invocations within the plugin process.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+            ttl: Default time-to-live of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live entry, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one if the cache is full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Thread-safe, size-bounded LRU cache of GET response bodies
+
+    Entries keep the response ETag so that, once their time-to-live has
+    passed, they can be revalidated with If-None-Match instead of being
+    downloaded again.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            max_bytes: Maximum total size of cached response bodies
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def lookup(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Find an entry, fresh or stale
+
+        Returns:
+            Dictionary with 'body', 'etag' and 'fresh', or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return {
+                "body": entry["body"],
+                "etag": entry["etag"],
+                "fresh": entry["expires_at"] > time.monotonic()
+            }
+
+    def store(self, key: Hashable, body: Any, etag: Optional[str], ttl: float, size: int) -> None:
+        """Store a response body, evicting least recently used entries to stay within max_bytes"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous["size"]
+
+            self._entries[key] = {
+                "body": body,
+                "etag": etag,
+                "expires_at": time.monotonic() + ttl,
+                "size": size
+            }
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted["size"]
+
+    def refresh(self, key: Hashable, ttl: float) -> None:
+        """Extend the lifetime of an entry after a successful revalidation"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["expires_at"] = time.monotonic() + ttl
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove the entries whose key matches a predicate; returns the number removed"""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._size -= self._entries.pop(key)["size"]
+            return len(keys)
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: 'hit', 'miss' or 'revalidated'"""
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidations += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size
+            }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.revalidations = 0
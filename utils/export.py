@@ -0,0 +1,150 @@
+import csv
+import json
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+# Export formats: MIME type and file extension
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv")
+}
+
+# Field types whose REST item property is the "<InternalName>Id" foreign key
+_LOOKUP_TYPES = {"Lookup", "LookupMulti", "User", "UserMulti"}
+
+
+def field_properties(field: Dict[str, Any]) -> List[str]:
+    """
+    List the item properties that may carry a field's value
+
+    OData item payloads expose lookup and person fields as "<InternalName>Id"
+    and prefix internal names starting with an underscore with "OData_";
+    RenderListDataAsStream rows use the internal name as is.
+    """
+    name = field["InternalName"]
+    candidates = [name]
+    if name.startswith("_"):
+        candidates.append(f"OData_{name}")
+    if field.get("TypeAsString") in _LOOKUP_TYPES:
+        candidates.extend(f"{candidate}Id" for candidate in list(candidates))
+    return candidates
+
+
+def field_column(field: Dict[str, Any], rendered_rows: bool = False) -> str:
+    """
+    Name of the item property that carries a field's value
+
+    Args:
+        field: List field
+        rendered_rows: Items come from RenderListDataAsStream (threshold_safe scans),
+            which use internal names as is, instead of OData item payloads
+    """
+    candidates = field_properties(field)
+    return candidates[0] if rendered_rows else candidates[-1]
+
+
+def export_columns(fields: List[Dict[str, Any]], item: Dict[str, Any], rendered_rows: bool = False) -> List[str]:
+    """
+    Gather the CSV columns of an export from the list's fields and its first item
+
+    Every field gets a column, whether or not the first item carries it: rows
+    may omit empty fields (RenderListDataAsStream does), so the header cannot
+    be taken from the first item alone.
+
+    Args:
+        fields: List fields in schema order (see SharePointClient.get_list_fields)
+        item: First exported item
+        rendered_rows: Items come from RenderListDataAsStream rather than OData payloads
+
+    Returns:
+        One column per field in field order, named as in the first item when it
+        carries the field, followed by the item's remaining properties in payload order
+    """
+    columns: List[str] = []
+    for field in fields:
+        present = [name for name in field_properties(field) if name in item and name not in columns]
+        if present:
+            columns.extend(present)
+        elif field_column(field, rendered_rows) not in columns:
+            columns.append(field_column(field, rendered_rows))
+    columns.extend(name for name in item if name not in columns)
+    return columns
+
+
+def csv_value(value: Any) -> Any:
+    """Render a property value as a CSV cell; nested values are written as JSON"""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class ListExportWriter:
+    """
+    Incremental NDJSON or CSV writer of list items
+
+    CSV columns are fixed before the first row is written, from the list's
+    fields and the first item (see export_columns). A property that is not a
+    field and first appears in a later item has no column; its name is recorded
+    in dropped_columns. NDJSON records always carry every property. Only the
+    current page is held in memory, everything else goes straight to the
+    output stream.
+    """
+
+    def __init__(self, stream: TextIO, export_format: str, fields: List[Dict[str, Any]],
+                 rendered_rows: bool = False):
+        """
+        Initialize writer
+
+        Args:
+            stream: Text stream to write to; open it with newline="" for CSV
+            export_format: "ndjson" or "csv"
+            fields: List fields in schema order, used to order the columns
+            rendered_rows: Items come from RenderListDataAsStream rather than OData
+                payloads; names the header columns of an empty export the same way
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        self.stream = stream
+        self.export_format = export_format
+        self.fields = fields
+        self.rendered_rows = rendered_rows
+        self.columns: Optional[List[str]] = None
+        self.rows = 0
+        self.dropped_columns: List[str] = []
+        self._csv = csv.writer(stream) if export_format == "csv" else None
+        self._column_set: Set[str] = set()
+        self._header_written = False
+
+    def write_page(self, items: List[Dict[str, Any]]) -> None:
+        """Write a page of items"""
+        for item in items:
+            if self.columns is None:
+                self.columns = export_columns(self.fields, item, self.rendered_rows)
+            if self._csv is not None:
+                self._write_header()
+                for name in item.keys() - self._column_set:
+                    if name not in self.dropped_columns:
+                        self.dropped_columns.append(name)
+                self._csv.writerow([csv_value(item.get(column)) for column in self.columns])
+            else:
+                record = {column: item.get(column) for column in self.columns}
+                record.update((name, value) for name, value in item.items() if name not in record)
+                self.stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                self.stream.write("\n")
+            self.rows += 1
+
+    def close(self) -> None:
+        """Finish the export; an empty CSV export still gets its header row"""
+        if self._csv is not None:
+            if self.columns is None:
+                self.columns = [field_column(field, self.rendered_rows) for field in self.fields]
+            self._write_header()
+        self.stream.flush()
+
+    def _write_header(self) -> None:
+        if not self._header_written:
+            self._csv.writerow(self.columns)
+            self._column_set = set(self.columns)
+            self._header_written = True
@@ -0,0 +1,389 @@
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from utils.retry import SharePointAPIError
+from utils.text_extraction import extract_text, is_extractable
+
+# Directory holding the index databases, one per site and credential; override with SHAREPOINT_INDEX_DIR
+DEFAULT_INDEX_DIR = os.path.join(tempfile.gettempdir(), "sharepoint-index")
+
+# Largest file downloaded for text extraction; bigger files are indexed by name only
+MAX_INDEXED_FILE_BYTES = 20 * 1024 * 1024
+
+# Files downloaded concurrently while indexing a folder
+INDEX_WORKERS = 4
+
+# Page size of full list scans
+INDEX_PAGE_SIZE = 1000
+
+# Item properties that carry no searchable text
+_SKIPPED_FIELDS = {"GUID", "ContentTypeId", "ServerRedirectedEmbedUri", "ServerRedirectedEmbedUrl",
+                   "ComplianceAssetId", "FileSystemObjectType"}
+
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+# Databases whose schema was created by this process
+_initialized: Set[str] = set()
+_initialized_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT,
+    path TEXT,
+    item_id INTEGER,
+    modified TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_source ON documents (source);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2');
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    change_token TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def index_path(site_url: str, access_token: str, index_dir: Optional[str] = None) -> str:
+    """
+    Build the path of the index database of a site and credential
+
+    Indexed content is whatever the indexing credential could read, so the
+    key includes a hash of the token, as the response cache does: another
+    credential on the same site never searches it.
+    """
+    directory = index_dir or os.environ.get("SHAREPOINT_INDEX_DIR") or DEFAULT_INDEX_DIR
+    identity = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+    digest = hashlib.sha256(f"{site_url.rstrip('/').lower()}\n{identity}".encode("utf-8")).hexdigest()[:32]
+    return os.path.join(directory, f"{digest}.db")
+
+
+def _create_private(path: str) -> None:
+    """Create the index directory (0o700) and database file (0o600), readable by this user only"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    # The default directory is under the shared temp dir, where another user could have created it first
+    if hasattr(os, "getuid") and os.stat(directory).st_uid != os.getuid():
+        raise PermissionError(f"Index directory {directory} is owned by another user")
+    os.chmod(directory, 0o700)
+    os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+    os.chmod(path, 0o600)
+
+
+def match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query matching documents containing every word
+
+    Words are quoted so that FTS5 operators and punctuation in user input are
+    taken literally; the last word also matches as a prefix.
+    """
+    words = _WORDS.findall(query)
+    if not words:
+        return ""
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    """Concatenate the text values of a list item"""
+    return "\n".join(
+        value for name, value in item.items()
+        if isinstance(value, str) and value and name not in _SKIPPED_FIELDS
+    )
+
+
+class LocalIndex:
+    """
+    On-disk SQLite FTS5 index of a site's list items and document text
+
+    Each indexed list or folder is a source with its own sync state, so
+    sources are refreshed incrementally and independently. The database uses
+    WAL mode: searches are not blocked while an index run writes.
+    """
+
+    def __init__(self, site_url: str, access_token: str, index_dir: Optional[str] = None):
+        """
+        Initialize index
+
+        Args:
+            site_url: SharePoint site URL
+            access_token: Bearer token the index is built and searched with
+            index_dir: Directory of the index databases (default: SHAREPOINT_INDEX_DIR or DEFAULT_INDEX_DIR)
+        """
+        self.site_url = site_url.rstrip('/')
+        self.path = index_path(site_url, access_token, index_dir)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the database, creating it on first use; commits on success and always closes"""
+        with _initialized_lock:
+            if self.path not in _initialized:
+                _create_private(self.path)
+                setup = sqlite3.connect(self.path, timeout=30)
+                try:
+                    # WAL is a persistent property of the database file
+                    setup.execute("PRAGMA journal_mode=WAL")
+                    setup.executescript(_SCHEMA)
+                finally:
+                    setup.close()
+                _initialized.add(self.path)
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # ====================
+    # WRITES
+    # ====================
+
+    def upsert(self, connection: sqlite3.Connection, key: str, source: str, kind: str, title: Optional[str],
+               body: str, path: Optional[str] = None, item_id: Optional[int] = None,
+               modified: Optional[str] = None) -> None:
+        """Add or replace a document"""
+        row = connection.execute("SELECT id FROM documents WHERE key = ?", (key,)).fetchone()
+        values = (source, kind, title, path, item_id, modified, time.time())
+        if row is None:
+            cursor = connection.execute(
+                "INSERT INTO documents (key, source, kind, title, path, item_id, modified, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key,) + values
+            )
+            doc_id = cursor.lastrowid
+        else:
+            doc_id = row["id"]
+            connection.execute(
+                "UPDATE documents SET source = ?, kind = ?, title = ?, path = ?, item_id = ?, modified = ?, "
+                "indexed_at = ? WHERE id = ?",
+                values + (doc_id,)
+            )
+            connection.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+        connection.execute("INSERT INTO documents_fts (rowid, title, body) VALUES (?, ?, ?)",
+                           (doc_id, title or "", body))
+
+    def delete(self, connection: sqlite3.Connection, keys: Iterable[str]) -> int:
+        """Remove documents by key"""
+        removed = 0
+        for key in keys:
+            row = connection.execute("SELECT id FROM documents WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("DELETE FROM documents_fts WHERE rowid = ?", (row["id"],))
+                connection.execute("DELETE FROM documents WHERE id = ?", (row["id"],))
+                removed += 1
+        return removed
+
+    def source_keys(self, connection: sqlite3.Connection, source: str) -> Dict[str, Optional[str]]:
+        """Get the keys of a source's documents with their modified timestamps"""
+        rows = connection.execute("SELECT key, modified FROM documents WHERE source = ?", (source,))
+        return {row["key"]: row["modified"] for row in rows}
+
+    def source_state(self, connection: sqlite3.Connection, source: str) -> Optional[Dict[str, Any]]:
+        """Get the sync state of a source"""
+        row = connection.execute("SELECT * FROM sources WHERE source = ?", (source,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def set_source_state(self, connection: sqlite3.Connection, source: str, kind: str,
+                         change_token: Optional[str] = None) -> None:
+        """Record a completed sync of a source"""
+        connection.execute(
+            "INSERT OR REPLACE INTO sources (source, kind, change_token, synced_at) VALUES (?, ?, ?, ?)",
+            (source, kind, change_token, time.time())
+        )
+
+    # ====================
+    # READS
+    # ====================
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Search the index
+
+        Args:
+            query: Free text; documents must contain every word
+            limit: Maximum number of results
+
+        Returns:
+            Results by relevance with 'title', 'source', 'kind', 'path', 'item_id',
+            'modified', 'snippet' and 'score' (lower is more relevant)
+        """
+        expression = match_query(query)
+        if not expression:
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT d.title, d.source, d.kind, d.path, d.item_id, d.modified, "
+                "snippet(documents_fts, 1, '[', ']', '...', 16) AS snippet, bm25(documents_fts) AS score "
+                "FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+                "WHERE documents_fts MATCH ? ORDER BY score LIMIT ?",
+                (expression, int(limit))
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the index
+
+        Returns:
+            Dictionary with 'documents', 'sources' (name, kind and synced_at of each)
+            and 'age', the seconds since the least recently synced source (None when empty)
+        """
+        with self._connect() as connection:
+            documents = connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            sources = [dict(row) for row in connection.execute("SELECT source, kind, synced_at FROM sources")]
+        oldest = min((source["synced_at"] for source in sources), default=None)
+        return {
+            "documents": documents,
+            "sources": sources,
+            "age": time.time() - oldest if oldest is not None else None
+        }
+
+    # ====================
+    # SYNC
+    # ====================
+
+    def sync_list(self, client: Any, list_title: str) -> Dict[str, Any]:
+        """
+        Index the items of a list, incrementally after the first run
+
+        The first run scans the whole list; later runs apply the changes made
+        since the stored change token, falling back to a full scan when the
+        token has expired.
+
+        Args:
+            client: SharePointClient of the site
+            list_title: List title
+
+        Returns:
+            Dictionary with 'source', 'mode' ("full" or "delta"), 'indexed' and 'deleted' counts
+        """
+        source = f"list:{list_title}"
+        with self._connect() as connection:
+            state = self.source_state(connection, source)
+            if state and state["change_token"]:
+                try:
+                    delta = client.get_list_item_delta(list_title, state["change_token"])
+                except SharePointAPIError as e:
+                    # Expired or invalid tokens are rejected with 400
+                    if e.status_code != 400:
+                        raise
+                else:
+                    for item in delta["added"] + delta["updated"]:
+                        self._upsert_item(connection, source, list_title, item)
+                    deleted = self.delete(connection, (f"{source}:{item_id}" for item_id in delta["deleted"]))
+                    self.set_source_state(connection, source, "list", delta["change_token"])
+                    return {"source": source, "mode": "delta", "indexed": len(delta["added"]) + len(delta["updated"]),
+                            "deleted": deleted}
+
+            stale = set(self.source_keys(connection, source))
+
+        # Take the token before scanning so changes made during the scan are not missed
+        change_token = client.get_list_change_token(list_title)
+        indexed = 0
+        for items in client.iter_list_item_pages(list_title, page_size=INDEX_PAGE_SIZE, streaming=True):
+            # Each page is committed on its own, so a long scan does not hold the write lock throughout
+            with self._connect() as connection:
+                for item in items:
+                    stale.discard(self._upsert_item(connection, source, list_title, item))
+            indexed += len(items)
+
+        # The token is stored last: an interrupted scan is started over on the next run
+        with self._connect() as connection:
+            deleted = self.delete(connection, stale)
+            self.set_source_state(connection, source, "list", change_token)
+        return {"source": source, "mode": "full", "indexed": indexed, "deleted": deleted}
+
+    def _upsert_item(self, connection: sqlite3.Connection, source: str, list_title: str,
+                     item: Dict[str, Any]) -> str:
+        item_id = item.get("Id", item.get("ID"))
+        key = f"{source}:{item_id}"
+        self.upsert(connection, key, source, "list_item", item.get("Title") or f"{list_title} #{item_id}",
+                    item_text(item), item_id=item_id, modified=item.get("Modified"))
+        return key
+
+    def sync_folder(self, client: Any, folder_path: str, max_depth: Optional[int] = None,
+                    max_file_bytes: int = MAX_INDEXED_FILE_BYTES, max_workers: int = INDEX_WORKERS) -> Dict[str, Any]:
+        """
+        Index the documents of a folder tree, downloading only new and modified files
+
+        Text is extracted from plain text and Office Open XML files; other
+        files, and files above max_file_bytes, are indexed by name only.
+
+        Args:
+            client: SharePointClient of the site
+            folder_path: Server relative path of the folder
+            max_depth: Deepest folder level to index (default: no limit)
+            max_file_bytes: Largest file downloaded for text extraction
+            max_workers: Number of files downloaded concurrently
+
+        Returns:
+            Dictionary with 'source', 'indexed', 'unchanged', 'deleted' and 'errors' counts
+        """
+        source = f"folder:{folder_path}"
+        with self._connect() as connection:
+            known = self.source_keys(connection, source)
+
+        changed: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        crawl_errors = 0
+        for entry in client.crawl_folder(folder_path, max_depth=max_depth):
+            if entry["type"] == "error":
+                crawl_errors += 1
+            if entry["type"] != "file":
+                continue
+            key = f"{source}:{entry['path']}"
+            seen.add(key)
+            if key not in known or known[key] != entry["modified"]:
+                changed.append(entry)
+
+        def fetch_text(entry: Dict[str, Any]) -> str:
+            if not is_extractable(entry["name"]) or (entry["size"] or 0) > max_file_bytes:
+                return ""
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buffer:
+                client.download_file_to(entry["path"], buffer, max_bytes=max_file_bytes)
+                buffer.seek(0)
+                return extract_text(entry["name"], buffer)
+
+        indexed = 0
+        errors = crawl_errors
+        batch_size = max(1, int(max_workers)) * 4
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+            for start in range(0, len(changed), batch_size):
+                batch = changed[start:start + batch_size]
+                futures = [executor.submit(fetch_text, entry) for entry in batch]
+                # Writes stay on this thread; each batch is committed on its own
+                with self._connect() as connection:
+                    for entry, future in zip(batch, futures):
+                        try:
+                            text = future.result()
+                        except Exception:
+                            # Not recorded, so the file is retried on the next run
+                            errors += 1
+                            continue
+                        self.upsert(connection, f"{source}:{entry['path']}", source, "file", entry["name"],
+                                    text, path=entry["path"], modified=entry["modified"])
+                        indexed += 1
+
+        with self._connect() as connection:
+            # Unreadable folders would look like deletions, so stale files are only dropped after a clean crawl
+            deleted = self.delete(connection, set(known) - seen) if not crawl_errors else 0
+            self.set_source_state(connection, source, "folder")
+        return {"source": source, "indexed": indexed, "unchanged": len(seen) - len(changed), "deleted": deleted,
+                "errors": errors}
@@ -0,0 +1,187 @@
+import json
+import re
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Statuses counted as throttling events
+THROTTLED_STATUSES = {429, 503}
+
+# Callback invoked with every request event
+RequestHook = Callable[[Dict[str, Any]], None]
+
+_GUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_QUOTED = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_KEY = re.compile(r"\(\d+\)")
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Reduce a request URL to its endpoint template
+
+    The site and query string are dropped and literal keys are replaced with
+    placeholders, so that e.g. items(12) and items(13) of any list are
+    reported under the same template.
+    """
+    path = url.split("?", 1)[0]
+    _, sep, api_path = path.partition("/_api/")
+    if sep:
+        path = api_path
+    path = _QUOTED.sub("'{}'", path)
+    path = _GUID.sub("{guid}", path)
+    return _NUMBER_KEY.sub("({id})", path)
+
+
+def payload_size(kwargs: Dict[str, Any]) -> int:
+    """Estimate the request body size from the keyword arguments of an HTTP call"""
+    data = kwargs.get("data")
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if kwargs.get("json") is not None:
+        return len(json.dumps(kwargs["json"]).encode("utf-8"))
+    # Streamed bodies (file objects) are not measured
+    return 0
+
+
+def request_event(method: str, url: str, status: Optional[int], duration: float, bytes_in: int,
+                  bytes_out: int, attempt: int, retried: bool, error: Optional[str] = None) -> Dict[str, Any]:
+    """Build the event passed to request hooks for one HTTP attempt"""
+    return {
+        "method": method.upper(),
+        "url": url,
+        "endpoint": endpoint_template(url),
+        "status": status,
+        "duration": duration,
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_out,
+        "attempt": attempt,
+        "retried": retried,
+        "throttled": status in THROTTLED_STATUSES,
+        "error": error
+    }
+
+
+class RequestStats:
+    """
+    Thread-safe running totals of the HTTP traffic of one client or tool invocation
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Add a request event to the totals"""
+        with self._lock:
+            self.requests += 1
+            self.retries += 1 if event["attempt"] else 0
+            self.throttled += 1 if event["throttled"] else 0
+            self.errors += 1 if event["error"] or (event["status"] or 0) >= 400 else 0
+            self.bytes_in += event["bytes_in"]
+            self.bytes_out += event["bytes_out"]
+            self.duration += event["duration"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current totals"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "request_time": round(self.duration, 3)
+            }
+
+    def reset(self) -> None:
+        """Set every total back to zero"""
+        with self._lock:
+            self.requests = self.retries = self.throttled = self.errors = 0
+            self.bytes_in = self.bytes_out = 0
+            self.duration = 0.0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe in-process registry of request metrics per endpoint template
+
+    Keeps a latency histogram, status counts and traffic totals for every
+    (method, endpoint template) pair seen by the plugin process.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize registry
+
+        Args:
+            buckets: Upper bounds, in seconds, of the latency histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Add a request event to the metrics of its endpoint"""
+        key = (event["method"], event["endpoint"])
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = {
+                    "count": 0,
+                    "latency_buckets": [0] * (len(self.buckets) + 1),
+                    "latency_sum": 0.0,
+                    "statuses": {},
+                    "throttled": 0,
+                    "retries": 0,
+                    "network_errors": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0
+                }
+
+            metrics["count"] += 1
+            metrics["latency_buckets"][bisect_left(self.buckets, event["duration"])] += 1
+            metrics["latency_sum"] += event["duration"]
+            if event["status"] is None:
+                metrics["network_errors"] += 1
+            else:
+                metrics["statuses"][event["status"]] = metrics["statuses"].get(event["status"], 0) + 1
+            metrics["throttled"] += 1 if event["throttled"] else 0
+            metrics["retries"] += 1 if event["attempt"] else 0
+            metrics["bytes_in"] += event["bytes_in"]
+            metrics["bytes_out"] += event["bytes_out"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the metrics of every endpoint seen so far
+
+        Returns:
+            Dictionary keyed by "METHOD endpoint" with counts, a latency histogram
+            keyed by bucket upper bound ("+Inf" for the overflow bucket), status
+            counts and traffic totals
+        """
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        with self._lock:
+            return {
+                f"{method} {endpoint}": {
+                    **{name: value for name, value in metrics.items() if name != "latency_buckets"},
+                    "statuses": dict(metrics["statuses"]),
+                    "latency_histogram": dict(zip(bounds, metrics["latency_buckets"])),
+                    "latency_avg": metrics["latency_sum"] / metrics["count"]
+                }
+                for (method, endpoint), metrics in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Remove every recorded metric"""
+        with self._lock:
+            self._endpoints.clear()
+
+
+# Shared by every client in the plugin process
+metrics = MetricsRegistry()
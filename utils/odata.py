@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional
+
+# Accept header variants understood by SharePoint, from largest to leanest payload
+ODATA_METADATA_MODES = ("verbose", "minimalmetadata", "nometadata")
+
+# minimalmetadata is the leanest mode that still returns entity types and etags
+DEFAULT_ODATA_METADATA = "minimalmetadata"
+
+# Bookkeeping keys emitted by the various modes that carry no field data
+_VERBOSE_KEYS = {"__metadata", "__next", "__count"}
+
+
+def accept_header(mode: str) -> str:
+    """Build the Accept header for a metadata mode"""
+    if mode not in ODATA_METADATA_MODES:
+        raise ValueError(f"Unsupported OData metadata mode: {mode}")
+    return f"application/json;odata={mode}"
+
+
+def _is_metadata_key(key: str) -> bool:
+    return key in _VERBOSE_KEYS or key.startswith("odata.") or "@odata." in key
+
+
+def normalize(value: Any) -> Any:
+    """
+    Strip OData bookkeeping so every metadata mode yields the same shape
+
+    Verbose collections wrapped as {"results": [...]} become plain lists,
+    deferred navigation properties are dropped, and __metadata / odata.*
+    annotations are removed.
+    """
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "results" in value and isinstance(value["results"], list) \
+            and all(key == "results" or _is_metadata_key(key) for key in value):
+        return [normalize(item) for item in value["results"]]
+
+    normalized = {}
+    for key, item in value.items():
+        if _is_metadata_key(key):
+            continue
+        if isinstance(item, dict) and "__deferred" in item and len(item) == 1:
+            continue
+        normalized[key] = normalize(item)
+    return normalized
+
+
+def _unwrap(payload: Dict[str, Any]) -> Any:
+    """Return the verbose "d" envelope content, or the payload itself for lean modes"""
+    if isinstance(payload, dict) and "d" in payload:
+        return payload["d"]
+    return payload
+
+
+def get_results(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract a normalized collection from a response in any metadata mode"""
+    data = _unwrap(payload)
+    if isinstance(data, list):
+        return normalize(data)
+    if isinstance(data, dict):
+        if isinstance(data.get("results"), list):
+            return normalize(data["results"])
+        if isinstance(data.get("value"), list):
+            return normalize(data["value"])
+    return []
+
+
+def get_entity(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract a normalized single entity from a response in any metadata mode"""
+    data = _unwrap(payload)
+    return normalize(data) if isinstance(data, dict) else {}
+
+
+def get_value(payload: Dict[str, Any], name: str) -> Any:
+    """Extract a scalar function result (e.g., StartUpload) from a response in any metadata mode"""
+    data = _unwrap(payload)
+    if isinstance(data, dict):
+        if name in data:
+            return data[name]
+        return data.get("value")
+    return data
+
+
+def get_next_link(payload: Dict[str, Any]) -> Optional[str]:
+    """Extract the link to the next page of a collection, if any"""
+    data = _unwrap(payload)
+    if isinstance(data, dict):
+        return data.get("__next") or data.get("odata.nextLink")
+    return None
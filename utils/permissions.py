@@ -0,0 +1,111 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+# SP.PermissionKind: right name -> 1-based bit position in the 64-bit BasePermissions mask
+PERMISSION_KINDS = {
+    "ViewListItems": 1,
+    "AddListItems": 2,
+    "EditListItems": 3,
+    "DeleteListItems": 4,
+    "ApproveItems": 5,
+    "OpenItems": 6,
+    "ViewVersions": 7,
+    "DeleteVersions": 8,
+    "CancelCheckout": 9,
+    "ManagePersonalViews": 10,
+    "ManageLists": 12,
+    "ViewFormPages": 13,
+    "AnonymousSearchAccessList": 14,
+    "Open": 17,
+    "ViewPages": 18,
+    "AddAndCustomizePages": 19,
+    "ApplyThemeAndBorder": 20,
+    "ApplyStyleSheets": 21,
+    "ViewUsageData": 22,
+    "CreateSSCSite": 23,
+    "ManageSubwebs": 24,
+    "CreateGroups": 25,
+    "ManagePermissions": 26,
+    "BrowseDirectories": 27,
+    "BrowseUserInfo": 28,
+    "AddDelPrivateWebParts": 29,
+    "UpdatePersonalWebParts": 30,
+    "ManageWeb": 31,
+    "AnonymousSearchAccessWebLists": 32,
+    "UseClientIntegration": 37,
+    "UseRemoteAPIs": 38,
+    "ManageAlerts": 39,
+    "CreateAlerts": 40,
+    "EditMyUserInfo": 41,
+    "EnumeratePermissions": 63
+}
+
+# Single-bit masks of every right, in PermissionKind order
+_RIGHT_MASKS: Tuple[Tuple[str, int], ...] = tuple(
+    (name, 1 << (bit - 1)) for name, bit in sorted(PERMISSION_KINDS.items(), key=lambda kind: kind[1])
+)
+
+# Every right defined by SharePoint; FullMask grants all of them
+FULL_MASK = (1 << 63) - 1
+
+
+def to_mask(base_permissions: Dict[str, Any]) -> int:
+    """Combine the High/Low halves of a BasePermissions value into one 64-bit integer"""
+    high = int(base_permissions.get("High") or 0)
+    low = int(base_permissions.get("Low") or 0)
+    return (high << 32) | low
+
+
+@lru_cache(maxsize=1024)
+def _decode_mask(mask: int) -> Tuple[str, ...]:
+    # Users usually share a handful of distinct masks, so decoding is memoized per mask
+    if mask & FULL_MASK == FULL_MASK:
+        return ("FullMask",)
+    return tuple(name for name, bit in _RIGHT_MASKS if mask & bit)
+
+
+def decode_mask(mask: int) -> List[str]:
+    """Decode a 64-bit permission mask into named rights (see decode_permissions)"""
+    return list(_decode_mask(mask))
+
+
+def decode_permissions(base_permissions: Dict[str, Any]) -> List[str]:
+    """
+    Decode a BasePermissions value into named rights
+
+    Args:
+        base_permissions: Dictionary with 'High' and 'Low' (numbers or numeric strings)
+
+    Returns:
+        Right names in PermissionKind order, or ["FullMask"] when every right is granted
+    """
+    return decode_mask(to_mask(base_permissions))
+
+
+def has_permission(base_permissions: Dict[str, Any], right: str) -> bool:
+    """Check whether a BasePermissions value grants a right"""
+    mask = to_mask(base_permissions)
+    if right == "FullMask":
+        return mask & FULL_MASK == FULL_MASK
+    return bool(mask & (1 << (PERMISSION_KINDS[right] - 1)))
+
+
+def role_masks(role_definitions: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Map role definition (permission level) names to their permission masks"""
+    return {
+        role["Name"]: to_mask(role.get("BasePermissions") or {})
+        for role in role_definitions
+        if role.get("Name")
+    }
+
+
+def matching_roles(mask: int, roles: Dict[str, int]) -> List[str]:
+    """
+    Find the permission levels whose rights are all included in a mask
+
+    Levels are returned from the broadest to the narrowest; levels granting
+    no rights are skipped.
+    """
+    matches = [(name, role_mask) for name, role_mask in roles.items() if role_mask and role_mask & mask == role_mask]
+    matches.sort(key=lambda match: bin(match[1]).count("1"), reverse=True)
+    return [name for name, _ in matches]
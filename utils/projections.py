@@ -0,0 +1,42 @@
+from typing import Dict, Optional
+
+# Projection profiles: "lean" selects the fields below, "full" requests whole entities
+PROJECTION_PROFILES = ("lean", "full")
+
+DEFAULT_PROJECTION = "lean"
+
+# Lean $select field sets of the list-style endpoints, by collection name
+LEAN_FIELDS = {
+    "lists": "Id,Title,Description,BaseTemplate,ItemCount,Hidden,Created,LastItemModifiedDate,EntityTypeName",
+    "site_users": "Id,Title,Email,LoginName,UserPrincipalName,IsSiteAdmin,PrincipalType",
+    "content_types": "Id,Name,Description,Group,Hidden",
+    "folders": "Name,ServerRelativeUrl,UniqueId,ItemCount,TimeCreated,TimeLastModified",
+    "list_views": "Id,Title,DefaultView,Hidden,PersonalView,RowLimit,ServerRelativeUrl,ViewQuery"
+}
+
+
+def projection_params(collection: str, projection: str = DEFAULT_PROJECTION, select: Optional[str] = None,
+                      expand: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    Build the $select/$expand query parameters of a list-style endpoint
+
+    Args:
+        collection: Collection name, a key of LEAN_FIELDS
+        projection: Projection profile: "lean" (default field set) or "full" (whole entities)
+        select: Comma-separated fields overriding the profile's field set
+        expand: Navigation properties to expand, e.g. "Author" when selecting "Author/Title"
+
+    Returns:
+        Query parameters, or None when whole entities are requested
+    """
+    if projection not in PROJECTION_PROFILES:
+        raise ValueError(f"Unsupported projection: {projection}")
+
+    params = {}
+    if select:
+        params["$select"] = select
+    elif projection == "lean":
+        params["$select"] = LEAN_FIELDS[collection]
+    if expand:
+        params["$expand"] = expand
+    return params or None
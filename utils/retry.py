@@ -0,0 +1,117 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+
+# Methods that can be replayed without changing the outcome
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "MERGE", "PATCH"}
+
+# Statuses SharePoint uses to reject a request before processing it (throttling)
+THROTTLE_STATUSES = {429, 503}
+
+
+class SharePointAPIError(Exception):
+    """
+    Error raised when a SharePoint API call fails
+
+    Carries the HTTP status code (None for network failures) so callers can
+    react to specific failures instead of parsing the message.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 response: Optional[requests.Response] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = response
+
+
+class RetryPolicy:
+    """
+    Retry policy for SharePoint HTTP calls
+
+    Throttled responses (429/503) are retried for every method, since the
+    service rejected them without doing any work, and their Retry-After
+    header is honored. Transient server and network errors are only retried
+    for idempotent requests, so a POST that creates an item is never replayed
+    after it may already have been applied.
+    """
+
+    def __init__(self, max_retries: int = 5, backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0, max_retry_after: float = 120.0,
+                 retry_statuses: tuple = (429, 500, 502, 503, 504)):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff_factor: Base delay in seconds for exponential backoff
+            max_backoff: Upper bound for a computed backoff delay
+            max_retry_after: Upper bound for a server-provided Retry-After delay
+            retry_statuses: HTTP statuses that may be retried
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = set(retry_statuses)
+
+    @staticmethod
+    def is_idempotent(method: str, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Check whether a request can be safely replayed, honoring X-HTTP-Method overrides"""
+        effective_method = (headers or {}).get("X-HTTP-Method") or method
+        return effective_method.upper() in IDEMPOTENT_METHODS
+
+    def should_retry_status(self, status_code: int, idempotent: bool) -> bool:
+        """Check whether a response status should be retried"""
+        if status_code in THROTTLE_STATUSES:
+            return True
+        return idempotent and status_code in self.retry_statuses
+
+    def should_retry_exception(self, error: requests.RequestException, idempotent: bool) -> bool:
+        """Check whether a network error should be retried"""
+        if isinstance(error, requests.ConnectTimeout):
+            # The request never reached the server
+            return True
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return idempotent
+        return False
+
+    def get_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Compute the delay before the next attempt
+
+        Args:
+            attempt: Zero-based retry attempt number
+            response: Response that triggered the retry, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if response is not None:
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        # Exponential backoff with full jitter
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given either in seconds or as an HTTP date"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    Process-wide pool of HTTP sessions keyed by (site_url, access_token)
+
+    Tools build a fresh SharePointClient per invocation; drawing the session
+    from this pool lets consecutive invocations reuse warm keep-alive
+    connections instead of paying a new TCP+TLS handshake on every call.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_sessions: int = 32,
+                 pool_connections: int = 4, pool_maxsize: int = 16):
+        """
+        Initialize session pool
+
+        Args:
+            idle_timeout: Seconds a session may sit unused before it is closed and evicted
+            max_sessions: Maximum number of sessions kept alive at once
+            pool_connections: Number of per-host connection pools kept by each session
+            pool_maxsize: Maximum number of keep-alive connections per host
+        """
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[Tuple[str, str], Tuple[requests.Session, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(site_url: str, access_token: str) -> Tuple[str, str]:
+        """Build the pool key without keeping the raw token around"""
+        token_hash = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        return site_url.rstrip('/').lower(), token_hash
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with tuned keep-alive adapters"""
+        session = requests.Session()
+
+        # Authentication is bearer-token only, so refuse cookies; this keeps the
+        # session stateless and safe to share between worker threads
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _evict_idle(self, now: float) -> None:
+        """Close sessions that have not been used within the idle timeout (lock held)"""
+        expired = [key for key, (_, last_used) in self._sessions.items()
+                   if now - last_used > self.idle_timeout]
+        for key in expired:
+            session, _ = self._sessions.pop(key)
+            session.close()
+
+    def get_session(self, site_url: str, access_token: str) -> requests.Session:
+        """
+        Get the pooled session for a site and token, creating it if needed
+
+        Args:
+            site_url: SharePoint site URL
+            access_token: Bearer token for authentication
+
+        Returns:
+            Shared requests.Session
+        """
+        key = self._make_key(site_url, access_token)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+
+            entry = self._sessions.get(key)
+            if entry is not None:
+                session = entry[0]
+            else:
+                if len(self._sessions) >= self.max_sessions:
+                    # Drop the least recently used session to stay within bounds
+                    oldest_key = min(self._sessions, key=lambda k: self._sessions[k][1])
+                    self._sessions.pop(oldest_key)[0].close()
+                session = self._create_session()
+
+            self._sessions[key] = (session, now)
+            return session
+
+    def close_all(self) -> None:
+        """Close and forget every pooled session"""
+        with self._lock:
+            for session, _ in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+# Shared by every client created in this plugin process
+_default_pool = SessionPool()
+
+
+def get_session(site_url: str, access_token: str) -> requests.Session:
+    """Get a pooled session from the process-wide pool"""
+    return _default_pool.get_session(site_url, access_token)
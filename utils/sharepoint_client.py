@@ -1,6 +1,170 @@
 import requests
-from typing import Dict, Any, Optional, List
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, BinaryIO, Callable, Deque, Tuple
+import hashlib
+import io
 import json
+import threading
+import time
+import uuid
+from urllib.parse import parse_qsl, quote
+from xml.sax.saxutils import quoteattr
+
+from utils.batch import (
+    MAX_BATCH_SIZE,
+    SUPPORTED_METHODS,
+    WRITE_METHODS,
+    build_batch_body,
+    match_batch_results,
+    operation_groups,
+    parse_batch_groups,
+    resolve_url,
+)
+from utils.bulk import is_item_id
+from utils.cache import ResponseCache, TTLCache
+from utils.metrics import RequestHook, RequestStats, metrics, payload_size, request_event
+from utils.permissions import decode_mask, matching_roles, role_masks, to_mask
+from utils.odata import (
+    DEFAULT_ODATA_METADATA,
+    accept_header,
+    get_entity,
+    get_next_link,
+    get_results,
+    get_value,
+)
+from utils.projections import DEFAULT_PROJECTION, projection_params
+from utils.retry import DEFAULT_RETRY_POLICY, RetryPolicy, SharePointAPIError
+from utils.session_pool import get_session
+from utils.streaming import (
+    COLLECTION_ITEMS,
+    NEXT_LINKS,
+    SEARCH_ROWS,
+    SEARCH_TOTAL_ROWS,
+    JsonStream,
+    streaming_available,
+)
+
+# Timeout in seconds of ordinary REST calls, as a single value or (connect, read)
+DEFAULT_REQUEST_TIMEOUT = 30
+
+# Default number of list items requested per page
+DEFAULT_PAGE_SIZE = 100
+
+# SharePoint caps $top at 5000 items per page
+MAX_PAGE_SIZE = 5000
+
+# Bytes read from the socket at a time when streaming file content
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files smaller than this are always downloaded as a single stream
+SEGMENTED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+
+# Size of each chunk sent through an upload session
+UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+
+# List properties kept in the list metadata cache
+LIST_METADATA_FIELDS = "Id,ItemCount,ListItemEntityTypeFullName"
+
+# Write failures that suggest the cached list metadata is stale
+SCHEMA_ERROR_STATUSES = {400, 404}
+
+# Maximum number of change records requested per GetChanges call
+CHANGE_FETCH_LIMIT = 1000
+
+# SP.ChangeType values relevant to list items
+CHANGE_TYPES = {1: "added", 2: "updated", 3: "deleted", 7: "added"}
+
+# Item IDs combined into one $filter when fetching changed items
+DELTA_ID_CHUNK_SIZE = 50
+
+# Largest rowlimit accepted by the search service
+SEARCH_PAGE_SIZE = 500
+
+# Default number of search pages fetched concurrently
+SEARCH_WORKERS = 4
+
+# Default number of folders fetched concurrently while crawling
+CRAWL_WORKERS = 4
+
+# Properties fetched for a folder level and its expanded children
+CRAWL_SELECT = ",".join([
+    "Name", "ServerRelativeUrl", "ItemCount", "TimeLastModified",
+    "Folders/Name", "Folders/ServerRelativeUrl", "Folders/ItemCount", "Folders/TimeLastModified",
+    "Files/Name", "Files/ServerRelativeUrl", "Files/Length", "Files/TimeLastModified"
+])
+
+# Default number of ID-range partitions fetched concurrently in a parallel scan
+SCAN_WORKERS = 4
+
+# List scan strategies: OData paging, CAML paging in ID order, or concurrent ID ranges
+SCAN_MODES = ("standard", "threshold_safe", "parallel")
+
+# Field properties read to order exported columns
+LIST_FIELD_SELECT = "InternalName,Title,TypeAsString,Hidden"
+
+# Shared by every client in the plugin process
+list_metadata_cache = TTLCache(max_entries=512, ttl=600.0)
+
+# Mostly-static endpoints eligible for response caching, with their TTLs in seconds
+CACHEABLE_ENDPOINTS = {
+    "web/lists": 300,
+    "web/contenttypes": 900,
+    "web/fields": 900,
+    "web/siteusers": 300,
+    "web/roledefinitions": 3600,
+    "web/regionalsettings": 3600
+}
+
+# Shared by every client that opts into response caching
+response_cache = ResponseCache()
+
+# Successful credential validations, keyed by site and token hash
+credential_cache = TTLCache(max_entries=256, ttl=300.0)
+
+# Credential validation fails fast: a single short retry, capped Retry-After waits and short timeouts
+VALIDATION_RETRY_POLICY = RetryPolicy(max_retries=1, backoff_factor=0.5, max_backoff=2.0, max_retry_after=5.0)
+VALIDATION_TIMEOUT = (5, 10)
+
+
+def flatten_search_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a search result row's Cells key/value array into a plain dictionary"""
+    return {cell.get("Key"): cell.get("Value") for cell in row.get("Cells", [])}
+
+
+def escape_literal(value: str) -> str:
+    """Escape a value embedded in a single-quoted OData string literal"""
+    return value.replace("'", "''")
+
+
+def list_metadata_key(site_url: str, list_title: str) -> Tuple[str, str]:
+    """Build the list metadata cache key"""
+    return site_url.rstrip('/').lower(), list_title.lower()
+
+
+def parse_list_metadata(list_title: str, entity: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the cached list metadata from a list entity"""
+    return {
+        "id": entity.get("Id"),
+        # Fall back to the conventional name if the property is unavailable
+        "entity_type": entity.get("ListItemEntityTypeFullName") or f"SP.Data.{list_title}ListItem",
+        "item_count": entity.get("ItemCount")
+    }
+
+
+class ChunkedUploadError(SharePointAPIError):
+    """
+    Error raised when a chunked upload fails part way through
+
+    upload_id and offset identify the last acknowledged position so the
+    upload can be resumed with SharePointClient.upload_file_chunked.
+    """
+
+    def __init__(self, message: str, upload_id: str, offset: int, status_code: Optional[int] = None):
+        super().__init__(message, status_code=status_code)
+        self.upload_id = upload_id
+        self.offset = offset
 
 
 class SharePointClient:
@@ -8,26 +172,150 @@ class SharePointClient:
     SharePoint REST API client for handling common operations
     """
     
-    def __init__(self, site_url: str, access_token: str):
+    def __init__(self, site_url: str, access_token: str, session: Optional[requests.Session] = None,
+                 retry_policy: Optional[RetryPolicy] = None, odata_metadata: str = DEFAULT_ODATA_METADATA,
+                 cache_responses: bool = False, hooks: Optional[List[RequestHook]] = None,
+                 stats: Optional[RequestStats] = None, request_timeout: Any = DEFAULT_REQUEST_TIMEOUT):
         """
         Initialize SharePoint client
         
         Args:
             site_url: SharePoint site URL (e.g., https://company.sharepoint.com/sites/sitename)
             access_token: Bearer token for authentication
+            session: HTTP session to use (default: pooled session shared per site and token,
+                drawn on the first request)
+            retry_policy: Retry policy for throttled and failed calls (default: DEFAULT_RETRY_POLICY)
+            odata_metadata: Response metadata mode: "verbose", "minimalmetadata" or "nometadata";
+                results are normalized to the same shape whichever mode is used
+            cache_responses: Serve mostly-static endpoints (CACHEABLE_ENDPOINTS) from the shared
+                response cache, revalidating expired entries with If-None-Match
+            hooks: Callbacks invoked with an event dictionary after every HTTP attempt
+            stats: Traffic totals to update (default: a new RequestStats for this client)
+            request_timeout: Timeout of ordinary REST calls, in seconds or as (connect, read);
+                uploads, downloads and $batch calls keep their own longer timeouts
         """
         self.site_url = site_url.rstrip('/')
         self.access_token = access_token
         self.base_api_url = f"{self.site_url}/_api"
+        self._session = session
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.accept = accept_header(odata_metadata)
+        self.odata_metadata = odata_metadata
+        self.cache_responses = cache_responses
+        self._identity = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        self.hooks: List[RequestHook] = list(hooks or [])
+        self.stats = stats or RequestStats()
+        self.request_timeout = request_timeout
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, drawn from the session pool on first use"""
+        if self._session is None:
+            self._session = get_session(self.site_url, self.access_token)
+        return self._session
+        
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register a callback invoked after every HTTP attempt
+        
+        The callback receives a dictionary with 'method', 'url', 'endpoint'
+        (URL template), 'status', 'duration', 'bytes_in', 'bytes_out',
+        'attempt', 'retried', 'throttled' and 'error'.
+        """
+        self.hooks.append(hook)
+    
+    def _emit(self, event: Dict[str, Any]) -> None:
+        """Record a request event in the metrics registry, the client stats and the hooks"""
+        metrics.record(event)
+        self.stats.record(event)
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                # Instrumentation must never break the request it observes
+                pass
+    
+    def _get_headers(self, content_type: str = "application/json;odata=verbose") -> Dict[str, str]:
+        """
+        Get standard headers for API requests
         
-    def _get_headers(self, content_type: str = "application/json") -> Dict[str, str]:
-        """Get standard headers for API requests"""
+        Request bodies keep the verbose format (they carry __metadata types),
+        while responses use the client's metadata mode.
+        """
         return {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": content_type,
-            "Accept": "application/json;odata=verbose"
+            "Accept": self.accept
         }
     
+    def _send(self, method: str, url: str, error_prefix: str = "SharePoint API call failed",
+              idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """
+        Send an HTTP request, retrying throttled and transient failures
+        
+        Every HTTP call made by the client goes through this method so the retry
+        policy applies uniformly.
+        
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            error_prefix: Prefix for the error message raised on failure
+            idempotent: Whether the request may be replayed (default: derived from the method)
+            **kwargs: Extra arguments passed to requests.Session.request
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            SharePointAPIError: If the call fails after all retries
+        """
+        policy = self.retry_policy
+        if idempotent is None:
+            idempotent = policy.is_idempotent(method, kwargs.get("headers"))
+        
+        bytes_out = payload_size(kwargs)
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            except requests.RequestException as e:
+                retry = attempt < policy.max_retries and policy.should_retry_exception(e, idempotent)
+                self._emit(request_event(method, url, None, time.monotonic() - started, 0,
+                                         bytes_out, attempt, retry, str(e)))
+                if retry:
+                    time.sleep(policy.get_delay(attempt))
+                    attempt += 1
+                    continue
+                raise SharePointAPIError(f"{error_prefix}: {str(e)}") from e
+            
+            retry = (response.status_code >= 400 and attempt < policy.max_retries
+                     and policy.should_retry_status(response.status_code, idempotent))
+            # Streamed bodies are not read here, so their size comes from Content-Length
+            if kwargs.get("stream"):
+                bytes_in = int(response.headers.get("Content-Length") or 0)
+            else:
+                bytes_in = len(response.content)
+            self._emit(request_event(method, url, response.status_code, time.monotonic() - started,
+                                     bytes_in, bytes_out, attempt, retry))
+            
+            if retry:
+                delay = policy.get_delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+            
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                raise SharePointAPIError(
+                    f"{error_prefix}: {str(e)}",
+                    status_code=response.status_code,
+                    response=response
+                ) from e
+            return response
+    
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
                      params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -35,7 +323,7 @@ class SharePointClient:
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
-            endpoint: API endpoint relative to base API URL
+            endpoint: API endpoint relative to base API URL, or an absolute URL (e.g., a __next link)
             data: Request body data
             params: Query parameters
             
@@ -43,43 +331,146 @@ class SharePointClient:
             JSON response data
             
         Raises:
-            Exception: If API call fails
+            SharePointAPIError: If API call fails
         """
-        url = f"{self.base_api_url}/{endpoint.lstrip('/')}"
+        url = resolve_url(self.base_api_url, endpoint)
+        
+        cache_ttl = CACHEABLE_ENDPOINTS.get(endpoint.strip('/').lower())
+        if self.cache_responses and method.upper() == "GET" and cache_ttl is not None:
+            return self._cached_get(url, params, cache_ttl)
+        
         headers = self._get_headers()
         
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
+        response = self._send(
+            method,
+            url,
+            headers=headers,
+            json=data,
+            params=params,
+            timeout=self.request_timeout
+        )
+        
+        if response.content:
+            return response.json()
+        else:
+            return {"success": True}
+    
+    def _stream_request(self, method: str, endpoint: str, item_paths: Tuple[str, ...],
+                        value_paths: Tuple[str, ...] = (), data: Optional[Dict] = None,
+                        params: Optional[Dict] = None) -> JsonStream:
+        """
+        Make HTTP request to SharePoint API and parse the response as it is read
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint relative to base API URL, or an absolute URL (e.g., a __next link)
+            item_paths: Paths of the objects to yield, in ijson prefix notation (see utils.streaming)
+            value_paths: Paths of scalar values to collect, e.g. the next link
+            data: Request body data
+            params: Query parameters
             
-            if response.content:
-                return response.json()
-            else:
-                return {"success": True}
-                
-        except requests.RequestException as e:
-            raise Exception(f"SharePoint API call failed: {str(e)}")
+        Returns:
+            JsonStream yielding the objects one by one; the values are set once it is exhausted
+            
+        Raises:
+            SharePointAPIError: If API call fails
+        """
+        url = resolve_url(self.base_api_url, endpoint)
+        response = self._send(
+            method,
+            url,
+            headers=self._get_headers(),
+            json=data,
+            params=params,
+            timeout=self.request_timeout,
+            stream=True
+        )
+        return JsonStream(response, item_paths, value_paths)
+    
+    def _iter_collection(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a collection item by item, following next links
+        
+        Each page is parsed while it is read, so only the current item is held
+        in memory; stopping early closes the connection of the current page.
+        """
+        next_url: Optional[str] = endpoint
+        while next_url:
+            stream = self._stream_request("GET", next_url, COLLECTION_ITEMS, NEXT_LINKS, params=params)
+            # Next links already carry the full query string
+            params = None
+            yield from stream
+            next_url = stream.value(NEXT_LINKS)
+    
+    def _cached_get(self, url: str, params: Optional[Dict], ttl: float) -> Dict[str, Any]:
+        """
+        GET through the shared response cache
+        
+        Fresh entries are returned without a request; expired entries are
+        revalidated with If-None-Match and reused on 304 Not Modified.
+        """
+        key = (
+            self._identity,
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            self.accept
+        )
+        entry = response_cache.lookup(key)
+        if entry is not None and entry["fresh"]:
+            response_cache.record("hit")
+            return entry["body"]
+        
+        headers = self._get_headers()
+        if entry is not None and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        
+        response = self._send("GET", url, headers=headers, params=params, timeout=self.request_timeout)
+        
+        if response.status_code == 304 and entry is not None:
+            response_cache.refresh(key, ttl)
+            response_cache.record("revalidated")
+            return entry["body"]
+        
+        body = response.json() if response.content else {"success": True}
+        response_cache.store(key, body, response.headers.get("ETag"), ttl, len(response.content))
+        response_cache.record("miss")
+        return body
+    
+    def _invalidate_cached(self, *endpoints: str) -> None:
+        """Drop this client's cached responses of endpoints its own writes have changed"""
+        urls = {resolve_url(self.base_api_url, endpoint) for endpoint in endpoints}
+        response_cache.invalidate(lambda key: key[0] == self._identity and key[1] in urls)
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters of the shared response cache"""
+        return response_cache.stats()
     
     def get_site_info(self) -> Dict[str, Any]:
         """Get site information"""
-        return self._make_request("GET", "web")
+        return get_entity(self._make_request("GET", "web"))
     
-    def get_lists(self) -> List[Dict[str, Any]]:
-        """Get all lists in the site"""
-        response = self._make_request("GET", "web/lists")
-        return response.get("d", {}).get("results", [])
+    def get_site_id(self) -> str:
+        """Get the site's ID; the cheapest call that proves the site is reachable with the token"""
+        return get_entity(self._make_request("GET", "web", params={"$select": "Id"})).get("Id")
+    
+    def get_lists(self, projection: str = DEFAULT_PROJECTION, select: Optional[str] = None,
+                  expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all lists in the site
+        
+        Args:
+            projection: "lean" (default field set) or "full" (whole entities)
+            select: Comma-separated fields overriding the projection's field set
+            expand: Navigation properties to expand
+        """
+        params = projection_params("lists", projection, select, expand)
+        response = self._make_request("GET", "web/lists", params=params)
+        return get_results(response)
     
     def get_list_by_title(self, list_title: str) -> Dict[str, Any]:
         """Get list by title"""
         endpoint = f"web/lists/getbytitle('{list_title}')"
-        return self._make_request("GET", endpoint)
+        return get_entity(self._make_request("GET", endpoint))
     
     def create_list(self, title: str, description: str = "", template_type: int = 100) -> Dict[str, Any]:
         """
@@ -96,7 +487,9 @@ class SharePointClient:
             "Description": description,
             "BaseTemplate": template_type
         }
-        return self._make_request("POST", "web/lists", data)
+        created = get_entity(self._make_request("POST", "web/lists", data))
+        self._invalidate_cached("web/lists")
+        return created
     
     def update_list(self, list_title: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update list properties"""
@@ -112,58 +505,506 @@ class SharePointClient:
         
         url = f"{self.base_api_url}/{endpoint}"
         
-        try:
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=updates,
-                timeout=30
-            )
-            response.raise_for_status()
-            return {"success": True, "message": "List updated successfully"}
-        except requests.RequestException as e:
-            raise Exception(f"Failed to update list: {str(e)}")
+        self._send(
+            "POST",
+            url,
+            error_prefix="Failed to update list",
+            headers=headers,
+            json=updates,
+            timeout=self.request_timeout
+        )
+        self._invalidate_cached("web/lists")
+        return {"success": True, "message": "List updated successfully"}
     
     def get_list_items(self, list_title: str, select_fields: Optional[str] = None, 
-                      filter_query: Optional[str] = None, top: Optional[int] = None) -> List[Dict[str, Any]]:
+                      filter_query: Optional[str] = None, top: Optional[int] = None,
+                      page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
         """
-        Get items from a list
+        Get items from a list, following server paging
         
         Args:
             list_title: List title
             select_fields: OData $select parameter (comma-separated field names)
             filter_query: OData $filter parameter
-            top: OData $top parameter (limit results)
+            top: Maximum number of items to return (default: all items)
+            page_size: Number of items requested per page
         """
+        return list(self.iter_list_items(
+            list_title,
+            select_fields=select_fields,
+            filter_query=filter_query,
+            page_size=page_size,
+            max_items=top
+        ))
+    
+    def iter_list_item_pages(self, list_title: str, select_fields: Optional[str] = None,
+                             filter_query: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                             max_items: Optional[int] = None,
+                             streaming: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the items of a list page by page, following __next links
+        
+        Only one page is held in memory at a time.
+        
+        Args:
+            list_title: List title
+            select_fields: OData $select parameter (comma-separated field names)
+            filter_query: OData $filter parameter
+            page_size: Number of items requested per page (capped at 5000)
+            max_items: Stop after this many items (default: no limit)
+            streaming: Parse responses incrementally, so that the raw body and its
+                decoded text are never buffered next to the page (see utils.streaming);
+                without ijson installed, pages are read whole as if it were off
+            
+        Yields:
+            Lists of items, one per server page
+        """
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        remaining = int(max_items) if max_items else None
+        if remaining is not None:
+            page_size = min(page_size, remaining)
+        
+        if streaming and streaming_available():
+            items_stream = self._stream_list_items(list_title, select_fields, filter_query, page_size, remaining)
+            while True:
+                page = list(islice(items_stream, page_size))
+                if not page:
+                    return
+                yield page
+        
         endpoint = f"web/lists/getbytitle('{list_title}')/items"
         
-        params = {}
+        params = {"$top": page_size}
         if select_fields:
             params["$select"] = select_fields
         if filter_query:
             params["$filter"] = filter_query
-        if top:
-            params["$top"] = top
+        
+        next_url: Optional[str] = endpoint
+        while next_url:
+            response = self._make_request("GET", next_url, params=params)
+            # Next links already carry the full query string
+            params = None
             
-        response = self._make_request("GET", endpoint, params=params)
-        return response.get("d", {}).get("results", [])
+            items = get_results(response)
+            
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            
+            if items:
+                yield items
+            
+            if remaining is not None and remaining <= 0:
+                break
+            next_url = get_next_link(response)
+    
+    def iter_list_items(self, list_title: str, select_fields: Optional[str] = None,
+                        filter_query: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                        max_items: Optional[int] = None, streaming: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a list one by one (see iter_list_item_pages)
+        
+        With streaming, items are yielded as they are parsed from the response,
+        so memory use is bounded by a single item rather than a page; without
+        ijson installed, items are read page by page instead.
+        """
+        if streaming and streaming_available():
+            page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+            yield from self._stream_list_items(list_title, select_fields, filter_query, page_size,
+                                               int(max_items) if max_items else None)
+            return
+        
+        for page in self.iter_list_item_pages(list_title, select_fields, filter_query,
+                                              page_size, max_items):
+            yield from page
+    
+    def _stream_list_items(self, list_title: str, select_fields: Optional[str], filter_query: Optional[str],
+                           page_size: int, max_items: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Iterate over the items of a list as they are parsed from the responses"""
+        params = {"$top": page_size}
+        if select_fields:
+            params["$select"] = select_fields
+        if filter_query:
+            params["$filter"] = filter_query
+        
+        items = self._iter_collection(f"web/lists/getbytitle('{list_title}')/items", params)
+        return islice(items, max_items) if max_items is not None else items
+    
+    def iter_list_item_pages_parallel(self, list_title: str, select_fields: Optional[str] = None,
+                                      filter_query: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                                      max_items: Optional[int] = None, max_workers: int = SCAN_WORKERS,
+                                      partition_size: int = MAX_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the items of a list page by page, reading ID ranges concurrently
+        
+        The ID range of the list is split into partitions of at most
+        partition_size IDs, each read with an "ID ge x and ID lt y" filter so
+        that it stays under the list view threshold. Partitions are fetched on
+        a worker pool but yielded in ID order, with at most twice max_workers
+        partitions held in memory.
+        
+        Args:
+            list_title: List title
+            select_fields: OData $select parameter (comma-separated field names)
+            filter_query: OData $filter parameter, combined with each partition's ID range
+            page_size: Number of items per yielded page and per request (capped at 5000)
+            max_items: Stop after this many items (default: no limit)
+            max_workers: Number of partitions fetched concurrently
+            partition_size: Number of IDs covered by one partition (capped at 5000)
+            
+        Yields:
+            Lists of items in ID order
+        """
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        partition_size = max(1, min(int(partition_size), MAX_PAGE_SIZE))
+        remaining = int(max_items) if max_items else None
+        
+        bounds = self._get_item_id_bounds(list_title)
+        if bounds is None:
+            return
+        first_id, last_id = bounds
+        
+        def fetch_partition(start: int) -> List[Dict[str, Any]]:
+            id_filter = f"ID ge {start} and ID lt {start + partition_size}"
+            if filter_query:
+                id_filter = f"{id_filter} and ({filter_query})"
+            return list(self.iter_list_items(list_title, select_fields, id_filter, page_size))
+        
+        starts = iter(range(first_id, last_id + 1, partition_size))
+        window = max(1, int(max_workers)) * 2
+        
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+            pending = deque(executor.submit(fetch_partition, start) for start in islice(starts, window))
+            while pending:
+                items = pending.popleft().result()
+                
+                next_start = next(starts, None)
+                if next_start is not None:
+                    pending.append(executor.submit(fetch_partition, next_start))
+                
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                
+                for offset in range(0, len(items), page_size):
+                    yield items[offset:offset + page_size]
+                
+                if remaining is not None and remaining <= 0:
+                    for future in pending:
+                        future.cancel()
+                    return
+    
+    def _get_item_id_bounds(self, list_title: str) -> Optional[Tuple[int, int]]:
+        """Get the lowest and highest item ID of a list, or None if the list is empty"""
+        endpoint = f"web/lists/getbytitle('{list_title}')/items"
+        
+        bounds = []
+        for direction in ("asc", "desc"):
+            params = {"$select": "ID", "$orderby": f"ID {direction}", "$top": 1}
+            items = get_results(self._make_request("GET", endpoint, params=params))
+            if not items:
+                return None
+            bounds.append(int(items[0].get("ID", items[0].get("Id"))))
+        return bounds[0], bounds[1]
+    
+    def iter_list_data_pages(self, list_title: str, view_fields: Optional[str] = None,
+                             caml_where: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                             max_items: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the items of a list page by page with RenderListDataAsStream
+        
+        Items are read in ID order with CAML RowLimit paging, which stays under
+        the list view threshold on lists of any size, where a $filter on a
+        non-indexed column fails once the list exceeds 5000 items. Row values
+        are returned as rendered by the list view, keyed by field internal name.
+        
+        Args:
+            list_title: List title
+            view_fields: Comma-separated internal names of the fields to return (default: the default view's fields)
+            caml_where: Inner XML of a CAML <Where> element; filter on indexed columns to stay under the threshold
+            page_size: Number of items requested per page (capped at 5000)
+            max_items: Stop after this many items (default: no limit)
+            
+        Yields:
+            Lists of items, one per server page
+        """
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        remaining = int(max_items) if max_items else None
+        if remaining is not None:
+            page_size = min(page_size, remaining)
+        
+        endpoint = f"web/lists/getbytitle('{list_title}')/RenderListDataAsStream"
+        
+        view_xml = "<View Scope='RecursiveAll'><Query>"
+        if caml_where:
+            view_xml += f"<Where>{caml_where}</Where>"
+        view_xml += "<OrderBy Override='TRUE'><FieldRef Name='ID' Ascending='TRUE'/></OrderBy></Query>"
+        if view_fields:
+            view_xml += "<ViewFields>" + "".join(
+                f"<FieldRef Name={quoteattr(name.strip())}/>" for name in view_fields.split(",") if name.strip()
+            ) + "</ViewFields>"
+        view_xml += f"<RowLimit Paged='TRUE'>{page_size}</RowLimit></View>"
+        
+        data = {
+            "parameters": {
+                "__metadata": {"type": "SP.RenderListDataParameters"},
+                "ViewXml": view_xml,
+                # RenderOptions.ListData: rows and paging information only
+                "RenderOptions": 2
+            }
+        }
+        
+        params: Optional[Dict[str, str]] = None
+        while True:
+            response = get_entity(self._make_request("POST", endpoint, data, params=params))
+            items = response.get("Row", [])
+            
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            
+            if items:
+                yield items
+            
+            if remaining is not None and remaining <= 0:
+                break
+            
+            # NextHref carries the paging token, e.g. "?Paged=TRUE&p_ID=100&PageFirstRow=101"
+            next_href = response.get("NextHref")
+            if not next_href:
+                break
+            params = dict(parse_qsl(next_href.lstrip("?")))
+    
+    def scan_list_item_pages(self, list_title: str, scan_mode: str = "standard", select_fields: Optional[str] = None,
+                             filter_query: Optional[str] = None, caml_where: Optional[str] = None,
+                             page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None,
+                             max_workers: int = SCAN_WORKERS,
+                             streaming: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the items of a list page by page with one of the scan strategies
+        
+        Args:
+            list_title: List title
+            scan_mode: "standard" (iter_list_item_pages), "threshold_safe" (iter_list_data_pages)
+                or "parallel" (iter_list_item_pages_parallel)
+            select_fields: Comma-separated field names to return
+            filter_query: OData $filter parameter (standard and parallel modes)
+            caml_where: Inner XML of a CAML <Where> element (threshold_safe mode)
+            page_size: Number of items per page
+            max_items: Stop after this many items (default: no limit)
+            max_workers: Number of partitions fetched concurrently (parallel mode)
+            streaming: Parse responses incrementally (standard mode, see iter_list_item_pages)
+            
+        Raises:
+            ValueError: If scan_mode is not one of SCAN_MODES
+        """
+        if scan_mode not in SCAN_MODES:
+            raise ValueError(f"Unsupported scan mode: {scan_mode}")
+        if scan_mode == "threshold_safe":
+            return self.iter_list_data_pages(
+                list_title,
+                view_fields=select_fields,
+                caml_where=caml_where,
+                page_size=page_size,
+                max_items=max_items
+            )
+        if scan_mode == "parallel":
+            return self.iter_list_item_pages_parallel(
+                list_title,
+                select_fields=select_fields,
+                filter_query=filter_query,
+                page_size=page_size,
+                max_items=max_items,
+                max_workers=max_workers
+            )
+        return self.iter_list_item_pages(
+            list_title,
+            select_fields=select_fields,
+            filter_query=filter_query,
+            page_size=page_size,
+            max_items=max_items,
+            streaming=streaming
+        )
+    
+    def get_list_change_token(self, list_title: str) -> str:
+        """Get the list's current change token, the starting point for delta queries"""
+        endpoint = f"web/lists/getbytitle('{list_title}')"
+        entity = get_entity(self._make_request("GET", endpoint, params={"$select": "CurrentChangeToken"}))
+        return entity["CurrentChangeToken"]["StringValue"]
+    
+    def get_list_changes(self, list_title: str, change_token: str) -> List[Dict[str, Any]]:
+        """
+        Get item changes recorded on a list since a change token
+        
+        Args:
+            list_title: List title
+            change_token: Change token to start after
+            
+        Returns:
+            Change records in chronological order, each with 'ChangeType', 'ItemId' and 'ChangeToken'
+        """
+        endpoint = f"web/lists/getbytitle('{list_title}')/GetChanges"
+        
+        changes: List[Dict[str, Any]] = []
+        while True:
+            query = {
+                "query": {
+                    "__metadata": {"type": "SP.ChangeQuery"},
+                    "Item": True,
+                    "Add": True,
+                    "Update": True,
+                    "DeleteObject": True,
+                    "Restore": True,
+                    "FetchLimit": CHANGE_FETCH_LIMIT,
+                    "ChangeTokenStart": {
+                        "__metadata": {"type": "SP.ChangeToken"},
+                        "StringValue": change_token
+                    }
+                }
+            }
+            page = get_results(self._make_request("POST", endpoint, query))
+            changes.extend(page)
+            
+            if len(page) < CHANGE_FETCH_LIMIT:
+                return changes
+            change_token = page[-1]["ChangeToken"]["StringValue"]
+    
+    def get_list_item_delta(self, list_title: str, change_token: str, select_fields: Optional[str] = None,
+                            filter_query: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the items added, updated and deleted since a change token
+        
+        Changes are collapsed per item, then the current version of every added
+        or updated item is fetched by ID, so only changed items are downloaded.
+        
+        Args:
+            list_title: List title
+            change_token: Change token from a previous call or get_list_change_token
+            select_fields: OData $select parameter for the fetched items
+            filter_query: OData $filter applied to added and updated items
+            
+        Returns:
+            Dictionary with 'added' and 'updated' items, 'deleted' item IDs and
+            the 'change_token' to pass to the next call
+        """
+        changes = self.get_list_changes(list_title, change_token)
+        
+        # Collapse the change log to the net effect per item
+        states: Dict[int, str] = {}
+        for change in changes:
+            item_id = change.get("ItemId")
+            change_type = CHANGE_TYPES.get(int(change.get("ChangeType", 0)))
+            if item_id is None or change_type is None:
+                continue
+            previous = states.get(item_id)
+            if change_type == "deleted":
+                states[item_id] = "deleted"
+            elif previous == "added" or (previous == "deleted" and change_type == "added"):
+                states[item_id] = "added" if previous == "added" else "updated"
+            else:
+                states[item_id] = change_type
+        
+        if changes:
+            change_token = changes[-1]["ChangeToken"]["StringValue"]
+        
+        changed_ids = [item_id for item_id, state in states.items() if state != "deleted"]
+        items: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(changed_ids), DELTA_ID_CHUNK_SIZE):
+            chunk = changed_ids[start:start + DELTA_ID_CHUNK_SIZE]
+            id_filter = " or ".join(f"ID eq {item_id}" for item_id in chunk)
+            if filter_query:
+                id_filter = f"({id_filter}) and ({filter_query})"
+            fields = select_fields
+            if fields and "ID" not in [field.strip() for field in fields.split(",")]:
+                fields = f"ID,{fields}"
+            for item in self.iter_list_items(list_title, select_fields=fields, filter_query=id_filter,
+                                             page_size=len(chunk)):
+                items[item.get("ID", item.get("Id"))] = item
+        
+        return {
+            "added": [items[i] for i in changed_ids if states[i] == "added" and i in items],
+            "updated": [items[i] for i in changed_ids if states[i] == "updated" and i in items],
+            "deleted": [item_id for item_id, state in states.items() if state == "deleted"],
+            "change_token": change_token
+        }
+    
+    def get_list_fields(self, list_title: str, include_hidden: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the fields of a list in their schema order
+        
+        Args:
+            list_title: List title
+            include_hidden: Include hidden system fields
+            
+        Returns:
+            Fields with 'InternalName', 'Title', 'TypeAsString' and 'Hidden'
+        """
+        endpoint = f"web/lists/getbytitle('{list_title}')/fields"
+        params = {"$select": LIST_FIELD_SELECT}
+        if not include_hidden:
+            params["$filter"] = "Hidden eq false"
+        return get_results(self._make_request("GET", endpoint, params=params))
+    
+    def get_list_metadata(self, list_title: str) -> Dict[str, Any]:
+        """
+        Get cached metadata for a list
+        
+        The entity type name, GUID and item count are fetched once and shared
+        across clients and tool invocations until they expire or are invalidated.
+        
+        Args:
+            list_title: List title
+            
+        Returns:
+            Dictionary with 'id', 'entity_type' and 'item_count'
+        """
+        key = list_metadata_key(self.site_url, list_title)
+        metadata = list_metadata_cache.get(key)
+        if metadata is None:
+            endpoint = f"web/lists/getbytitle('{escape_literal(list_title)}')"
+            entity = get_entity(self._make_request("GET", endpoint, params={"$select": LIST_METADATA_FIELDS}))
+            metadata = parse_list_metadata(list_title, entity)
+            list_metadata_cache.set(key, metadata)
+        return metadata
+    
+    def invalidate_list_metadata(self, list_title: str) -> None:
+        """Drop cached metadata for a list"""
+        list_metadata_cache.pop(list_metadata_key(self.site_url, list_title))
+    
+    def _write_list_item(self, list_title: str, payload: Dict[str, Any], operation: Callable[[], Any]) -> Any:
+        """
+        Stamp a list item payload with its entity type and run the write
+        
+        Schema errors invalidate the cached list metadata; a 400 caused by a
+        stale cached entity type is retried once with fresh metadata.
+        """
+        while True:
+            from_cache = list_metadata_cache.get(list_metadata_key(self.site_url, list_title)) is not None
+            payload["__metadata"] = {"type": self.get_list_metadata(list_title)["entity_type"]}
+            try:
+                return operation()
+            except SharePointAPIError as e:
+                if e.status_code not in SCHEMA_ERROR_STATUSES:
+                    raise
+                self.invalidate_list_metadata(list_title)
+                if not (from_cache and e.status_code == 400):
+                    raise
     
     def create_list_item(self, list_title: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new list item"""
         endpoint = f"web/lists/getbytitle('{list_title}')/items"
         
-        # Add required metadata
-        item_data["__metadata"] = {"type": f"SP.Data.{list_title}ListItem"}
-        
-        return self._make_request("POST", endpoint, item_data)
+        return self._write_list_item(
+            list_title,
+            item_data,
+            lambda: get_entity(self._make_request("POST", endpoint, item_data))
+        )
     
     def update_list_item(self, list_title: str, item_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update a list item"""
         endpoint = f"web/lists/getbytitle('{list_title}')/items({item_id})"
         
-        # Add metadata for update
-        updates["__metadata"] = {"type": f"SP.Data.{list_title}ListItem"}
-        
         # Need to use MERGE method for updates
         headers = self._get_headers()
         headers["X-HTTP-Method"] = "MERGE"
@@ -171,17 +1012,19 @@ class SharePointClient:
         
         url = f"{self.base_api_url}/{endpoint}"
         
-        try:
-            response = requests.post(
-                url=url,
+        self._write_list_item(
+            list_title,
+            updates,
+            lambda: self._send(
+                "POST",
+                url,
+                error_prefix="Failed to update item",
                 headers=headers,
                 json=updates,
-                timeout=30
+                timeout=self.request_timeout
             )
-            response.raise_for_status()
-            return {"success": True, "message": "Item updated successfully"}
-        except requests.RequestException as e:
-            raise Exception(f"Failed to update item: {str(e)}")
+        )
+        return {"success": True, "message": "Item updated successfully"}
     
     def delete_list_item(self, list_title: str, item_id: int) -> Dict[str, Any]:
         """Delete a list item"""
@@ -193,16 +1036,14 @@ class SharePointClient:
         
         url = f"{self.base_api_url}/{endpoint}"
         
-        try:
-            response = requests.post(
-                url=url,
-                headers=headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            return {"success": True, "message": "Item deleted successfully"}
-        except requests.RequestException as e:
-            raise Exception(f"Failed to delete item: {str(e)}")
+        self._send(
+            "POST",
+            url,
+            error_prefix="Failed to delete item",
+            headers=headers,
+            timeout=self.request_timeout
+        )
+        return {"success": True, "message": "Item deleted successfully"}
     
     def upload_file(self, folder_path: str, file_name: str, file_content: bytes) -> Dict[str, Any]:
         """
@@ -215,29 +1056,109 @@ class SharePointClient:
         """
         endpoint = f"web/GetFolderByServerRelativeUrl('{folder_path}')/Files/add(url='{file_name}',overwrite=true)"
         
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/octet-stream"
-        }
+        headers = self._get_headers("application/octet-stream")
         
         url = f"{self.base_api_url}/{endpoint}"
         
+        # Files/add with overwrite=true yields the same file when replayed
+        response = self._send(
+            "POST",
+            url,
+            error_prefix="Failed to upload file",
+            idempotent=True,
+            headers=headers,
+            data=file_content,
+            timeout=60
+        )
+        return get_entity(response.json())
+    
+    def upload_file_chunked(self, folder_path: str, file_name: str, file_obj: BinaryIO,
+                            chunk_size: int = UPLOAD_CHUNK_SIZE, upload_id: Optional[str] = None,
+                            offset: int = 0) -> Dict[str, Any]:
+        """
+        Upload a file in fixed-size chunks using an upload session
+        
+        Uses the StartUpload/ContinueUpload/FinishUpload API so only two chunks
+        are held in memory at a time. Files that fit in a single chunk are sent
+        with a plain Files/add call instead.
+        
+        Args:
+            folder_path: Target folder path (e.g., "Shared Documents")
+            file_name: Name for the uploaded file
+            file_obj: Binary file object to read the content from
+            chunk_size: Size of each uploaded chunk in bytes
+            upload_id: Upload session ID to resume (from a previous ChunkedUploadError)
+            offset: Last acknowledged offset of the resumed session; file_obj must
+                already be positioned at this offset
+            
+        Returns:
+            Information about the uploaded file
+            
+        Raises:
+            ChunkedUploadError: If a chunk fails; carries upload_id and offset for resuming
+        """
+        chunk = file_obj.read(chunk_size)
+        next_chunk = file_obj.read(chunk_size) if chunk else b""
+        
+        if upload_id is None:
+            if not next_chunk:
+                return self.upload_file(folder_path, file_name, chunk)
+            
+            upload_id = str(uuid.uuid4())
+            offset = 0
+            # The upload session needs an existing (empty) file to write into
+            self.upload_file(folder_path, file_name, b"")
+        
+        file_endpoint = f"web/GetFolderByServerRelativeUrl('{folder_path}')/Files('{file_name}')"
+        
         try:
-            response = requests.post(
-                url=url,
-                headers=headers,
-                data=file_content,
-                timeout=60
+            # Nothing acknowledged yet means the session was never started
+            if offset == 0:
+                offset = self._upload_chunk(
+                    f"{file_endpoint}/StartUpload(uploadId=guid'{upload_id}')", chunk, "StartUpload"
+                )
+                chunk, next_chunk = next_chunk, file_obj.read(chunk_size)
+            
+            while next_chunk:
+                offset = self._upload_chunk(
+                    f"{file_endpoint}/ContinueUpload(uploadId=guid'{upload_id}',fileOffset={offset})",
+                    chunk,
+                    "ContinueUpload"
+                )
+                chunk, next_chunk = next_chunk, file_obj.read(chunk_size)
+            
+            response = self._send(
+                "POST",
+                f"{self.base_api_url}/{file_endpoint}/FinishUpload(uploadId=guid'{upload_id}',fileOffset={offset})",
+                error_prefix="Failed to upload file",
+                idempotent=True,
+                headers=self._get_headers("application/octet-stream"),
+                data=chunk,
+                timeout=(10, 120)
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise Exception(f"Failed to upload file: {str(e)}")
+            return get_entity(response.json())
+        except SharePointAPIError as e:
+            raise ChunkedUploadError(str(e), upload_id, offset, status_code=e.status_code) from e
+    
+    def _upload_chunk(self, endpoint: str, chunk: bytes, result_key: str) -> int:
+        """Send one upload session chunk and return the new acknowledged offset"""
+        # Replaying a chunk at the same offset either succeeds or is rejected,
+        # it can never duplicate data
+        response = self._send(
+            "POST",
+            f"{self.base_api_url}/{endpoint}",
+            error_prefix="Failed to upload file",
+            idempotent=True,
+            headers=self._get_headers("application/octet-stream"),
+            data=chunk,
+            timeout=(10, 120)
+        )
+        return int(get_value(response.json(), result_key))
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get file information"""
         endpoint = f"web/GetFileByServerRelativeUrl('{file_path}')"
-        return self._make_request("GET", endpoint)
+        return get_entity(self._make_request("GET", endpoint))
     
     def download_file(self, file_path: str) -> bytes:
         """
@@ -249,51 +1170,179 @@ class SharePointClient:
         Returns:
             File content as bytes
         """
+        buffer = io.BytesIO()
+        self.download_file_to(file_path, buffer)
+        return buffer.getvalue()
+    
+    def download_file_to(self, file_path: str, destination: BinaryIO, chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+                         max_bytes: Optional[int] = None, parallel_segments: int = 1,
+                         segment_threshold: int = SEGMENTED_DOWNLOAD_THRESHOLD) -> int:
+        """
+        Stream a file from SharePoint into a writable file object
+        
+        The body is read in chunks, so memory use is bounded by the chunk size
+        rather than the file size. Large files can be fetched as several HTTP
+        Range segments in parallel.
+        
+        Args:
+            file_path: Server relative path to the file
+            destination: Seekable binary file object to write into
+            chunk_size: Number of bytes read from the socket at a time
+            max_bytes: Refuse files larger than this many bytes (default: no limit)
+            parallel_segments: Number of Range segments fetched concurrently for large files
+            segment_threshold: Minimum file size in bytes before segmented download is used
+            
+        Returns:
+            Number of bytes written
+        """
+        size = None
+        if max_bytes is not None or parallel_segments > 1:
+            info = self._make_request(
+                "GET",
+                f"web/GetFileByServerRelativeUrl('{file_path}')",
+                params={"$select": "Length"}
+            )
+            size = int(get_entity(info).get("Length") or 0)
+            if max_bytes is not None and size > max_bytes:
+                raise SharePointAPIError(
+                    f"Failed to download file: {file_path} is {size} bytes, above the {max_bytes} byte limit"
+                )
+        
+        if parallel_segments > 1 and size and size >= segment_threshold:
+            if self._download_segments(file_path, destination, size, chunk_size, parallel_segments):
+                return size
+            # The server ignored the Range header; start over with a plain stream
+            destination.seek(0)
+            destination.truncate()
+        
+        return self._download_range(file_path, destination, chunk_size, max_bytes=max_bytes)
+    
+    def _download_range(self, file_path: str, destination: BinaryIO, chunk_size: int,
+                        start: Optional[int] = None, end: Optional[int] = None,
+                        max_bytes: Optional[int] = None, lock: Optional[threading.Lock] = None) -> int:
+        """
+        Stream a file, or an inclusive byte range of it, into destination
+        
+        Returns:
+            Number of bytes written, or -1 if a range was requested but not honored
+        """
         endpoint = f"web/GetFileByServerRelativeUrl('{file_path}')/$value"
         url = f"{self.base_api_url}/{endpoint}"
         
         headers = {
             "Authorization": f"Bearer {self.access_token}"
         }
+        if start is not None:
+            headers["Range"] = f"bytes={start}-{end}"
+        
+        response = self._send(
+            "GET",
+            url,
+            error_prefix="Failed to download file",
+            headers=headers,
+            stream=True,
+            timeout=(10, 60)
+        )
         
         try:
-            response = requests.get(
-                url=url,
-                headers=headers,
-                timeout=60
-            )
-            response.raise_for_status()
-            return response.content
-        except requests.RequestException as e:
-            raise Exception(f"Failed to download file: {str(e)}")
+            if start is not None and response.status_code != 206:
+                return -1
+            
+            written = 0
+            position = start or 0
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                written += len(chunk)
+                if max_bytes is not None and written > max_bytes:
+                    raise SharePointAPIError(
+                        f"Failed to download file: {file_path} exceeds the {max_bytes} byte limit"
+                    )
+                if lock is None:
+                    destination.write(chunk)
+                else:
+                    with lock:
+                        destination.seek(position)
+                        destination.write(chunk)
+                position += len(chunk)
+            return written
+        finally:
+            response.close()
+    
+    def _download_segments(self, file_path: str, destination: BinaryIO, size: int,
+                           chunk_size: int, segments: int) -> bool:
+        """
+        Download a file as parallel Range segments written at their offsets
+        
+        Returns:
+            False if the server does not support Range requests
+        """
+        segment_size = -(-size // segments)
+        ranges = [(start, min(start + segment_size, size) - 1)
+                  for start in range(0, size, segment_size)]
+        lock = threading.Lock()
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(self._download_range, file_path, destination, chunk_size,
+                                start, end, None, lock)
+                for start, end in ranges
+            ]
+            written = [future.result() for future in futures]
+        
+        if any(count < 0 for count in written):
+            return False
+        
+        destination.seek(size)
+        return True
 
     # ====================
     # USER MANAGEMENT
     # ====================
     
-    def get_site_users(self) -> List[Dict[str, Any]]:
-        """Get all users in the site"""
-        response = self._make_request("GET", "web/siteusers")
-        return response.get("d", {}).get("results", [])
+    def get_site_users(self, projection: str = DEFAULT_PROJECTION, select: Optional[str] = None,
+                       expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all users in the site
+        
+        Args:
+            projection: "lean" (default field set) or "full" (whole entities)
+            select: Comma-separated fields overriding the projection's field set
+            expand: Navigation properties to expand
+        """
+        params = projection_params("site_users", projection, select, expand)
+        response = self._make_request("GET", "web/siteusers", params=params)
+        return get_results(response)
     
     def get_site_groups(self) -> List[Dict[str, Any]]:
         """Get all site groups"""
         response = self._make_request("GET", "web/sitegroups")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
     
     def get_current_user(self) -> Dict[str, Any]:
         """Get current user information"""
-        return self._make_request("GET", "web/currentuser")
+        return get_entity(self._make_request("GET", "web/currentuser"))
     
     def get_user_by_email(self, email: str) -> Dict[str, Any]:
         """Get user by email address"""
-        endpoint = f"web/siteusers/getbyemail('{email}')"
-        return self._make_request("GET", endpoint)
+        endpoint = f"web/siteusers/getbyemail('{escape_literal(email)}')"
+        return get_entity(self._make_request("GET", endpoint))
     
-    def get_user_effective_permissions(self, user_email: str) -> Dict[str, Any]:
-        """Get effective permissions for a user"""
-        endpoint = f"web/getusereffectivepermissions(@user)?@user='{user_email}'"
-        return self._make_request("GET", endpoint)
+    def get_user_effective_permissions(self, login_name: str) -> Dict[str, Any]:
+        """
+        Get effective permissions for a user
+        
+        Args:
+            login_name: Claims login name of the user (LoginName, as returned by get_user_by_email);
+                the service does not resolve plain email addresses here
+                
+        Returns:
+            Permission mask with 'High' and 'Low'
+        """
+        alias = quote(f"'{escape_literal(login_name)}'", safe="'")
+        endpoint = f"web/getusereffectivepermissions(@user)?@user={alias}"
+        result = get_entity(self._make_request("GET", endpoint))
+        return result.get("GetUserEffectivePermissions", result)
 
     # ====================
     # PERMISSIONS & ROLES
@@ -302,31 +1351,112 @@ class SharePointClient:
     def get_role_assignments(self) -> List[Dict[str, Any]]:
         """Get role assignments for the site"""
         response = self._make_request("GET", "web/roleassignments")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
     
     def get_role_definitions(self) -> List[Dict[str, Any]]:
         """Get role definitions (permission levels)"""
         response = self._make_request("GET", "web/roledefinitions")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
     
     def break_role_inheritance(self, copy_roles: bool = True) -> Dict[str, Any]:
         """Break role inheritance for the site"""
         endpoint = f"web/breakroleinheritance(copyRoleAssignments={str(copy_roles).lower()})"
-        return self._make_request("POST", endpoint)
+        return get_entity(self._make_request("POST", endpoint))
+    
+    def get_permission_matrix(self, user_emails: List[str], list_titles: Optional[List[str]] = None,
+                              batch_size: int = MAX_BATCH_SIZE, max_workers: int = 4) -> Dict[str, Any]:
+        """
+        Get the effective permissions of many users on the site and, optionally, on lists
+        
+        Users are resolved, then their effective permissions read, through
+        concurrent $batch requests; masks are decoded locally into named rights
+        and matched against the site's permission levels.
+        
+        Args:
+            user_emails: Email addresses of the users
+            list_titles: Titles of lists to report permissions on, in addition to the site
+            batch_size: Number of operations per $batch call
+            max_workers: Number of $batch calls sent concurrently
+            
+        Returns:
+            Dictionary with 'users', one entry per email in order with 'email' and either
+            'user', 'site' and 'lists' ({'rights', 'permission_levels'} per scope) or 'error',
+            and 'permission_levels' mapping each level to its rights
+        """
+        list_titles = list_titles or []
+        roles = role_masks(self.get_role_definitions())
+        
+        # Effective permissions are looked up by login name, which takes a first round trip
+        lookups = self.execute_batch([
+            {
+                "method": "GET",
+                "url": f"web/siteusers/getbyemail('{escape_literal(email)}')"
+                       f"?$select=Id,Title,Email,LoginName,IsSiteAdmin"
+            }
+            for email in user_emails
+        ], batch_size=batch_size, max_workers=max_workers)["results"]
+        
+        users: List[Dict[str, Any]] = []
+        operations = []
+        for email, lookup in zip(user_emails, lookups):
+            if "error" in lookup:
+                users.append({"email": email, "error": lookup["error"]})
+                continue
+            
+            user = get_entity(lookup)
+            users.append({"email": email, "user": user})
+            # Batch request lines are encoded by build_batch_body
+            alias = f"'{escape_literal(user.get('LoginName', email))}'"
+            operations.append({"method": "GET", "url": f"web/getusereffectivepermissions(@user)?@user={alias}"})
+            for title in list_titles:
+                operations.append({
+                    "method": "GET",
+                    "url": f"web/lists/getbytitle('{escape_literal(title)}')"
+                           f"/getusereffectivepermissions(@user)?@user={alias}"
+                })
+        
+        results = iter(self.execute_batch(operations, batch_size=batch_size, max_workers=max_workers)["results"])
+        
+        def scope_permissions(result: Dict[str, Any]) -> Dict[str, Any]:
+            if "error" in result:
+                return {"error": result["error"]}
+            entity = get_entity(result)
+            mask = to_mask(entity.get("GetUserEffectivePermissions", entity))
+            return {"rights": decode_mask(mask), "permission_levels": matching_roles(mask, roles)}
+        
+        for entry in users:
+            if "error" in entry:
+                continue
+            entry["site"] = scope_permissions(next(results))
+            entry["lists"] = {title: scope_permissions(next(results)) for title in list_titles}
+        
+        return {
+            "users": users,
+            "permission_levels": {name: decode_mask(mask) for name, mask in roles.items()}
+        }
 
     # ====================
     # CONTENT TYPES
     # ====================
     
-    def get_content_types(self) -> List[Dict[str, Any]]:
-        """Get all content types"""
-        response = self._make_request("GET", "web/contenttypes")
-        return response.get("d", {}).get("results", [])
+    def get_content_types(self, projection: str = DEFAULT_PROJECTION, select: Optional[str] = None,
+                          expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all content types
+        
+        Args:
+            projection: "lean" (default field set) or "full" (whole entities)
+            select: Comma-separated fields overriding the projection's field set
+            expand: Navigation properties to expand
+        """
+        params = projection_params("content_types", projection, select, expand)
+        response = self._make_request("GET", "web/contenttypes", params=params)
+        return get_results(response)
     
     def get_content_type_by_id(self, content_type_id: str) -> Dict[str, Any]:
         """Get content type by ID"""
         endpoint = f"web/contenttypes('{content_type_id}')"
-        return self._make_request("GET", endpoint)
+        return get_entity(self._make_request("GET", endpoint))
     
     def create_content_type(self, name: str, parent_id: str = None, description: str = "") -> Dict[str, Any]:
         """Create a new content type"""
@@ -338,7 +1468,9 @@ class SharePointClient:
         if parent_id:
             data["Id"] = {"StringValue": parent_id}
         
-        return self._make_request("POST", "web/contenttypes", data)
+        created = get_entity(self._make_request("POST", "web/contenttypes", data))
+        self._invalidate_cached("web/contenttypes")
+        return created
 
     # ====================
     # FIELDS
@@ -347,12 +1479,12 @@ class SharePointClient:
     def get_fields(self) -> List[Dict[str, Any]]:
         """Get all site fields"""
         response = self._make_request("GET", "web/fields")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
     
     def get_field_by_title(self, title: str) -> Dict[str, Any]:
         """Get field by title"""
         endpoint = f"web/fields/getbytitle('{title}')"
-        return self._make_request("GET", endpoint)
+        return get_entity(self._make_request("GET", endpoint))
     
     def create_field(self, field_xml: str) -> Dict[str, Any]:
         """Create a field using XML schema"""
@@ -361,17 +1493,29 @@ class SharePointClient:
                 "SchemaXml": field_xml
             }
         }
-        return self._make_request("POST", "web/fields/createfieldasxml", data)
+        created = get_entity(self._make_request("POST", "web/fields/createfieldasxml", data))
+        self._invalidate_cached("web/fields")
+        return created
 
     # ====================
     # VIEWS
     # ====================
     
-    def get_list_views(self, list_title: str) -> List[Dict[str, Any]]:
-        """Get views for a list"""
+    def get_list_views(self, list_title: str, projection: str = DEFAULT_PROJECTION,
+                       select: Optional[str] = None, expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get views for a list
+        
+        Args:
+            list_title: List title
+            projection: "lean" (default field set) or "full" (whole entities)
+            select: Comma-separated fields overriding the projection's field set
+            expand: Navigation properties to expand
+        """
         endpoint = f"web/lists/getbytitle('{list_title}')/views"
-        response = self._make_request("GET", endpoint)
-        return response.get("d", {}).get("results", [])
+        params = projection_params("list_views", projection, select, expand)
+        response = self._make_request("GET", endpoint, params=params)
+        return get_results(response)
     
     def create_list_view(self, list_title: str, view_title: str, view_query: str = "", 
                         view_fields: List[str] = None) -> Dict[str, Any]:
@@ -385,7 +1529,7 @@ class SharePointClient:
             data["ViewFields"] = {"results": view_fields}
         
         endpoint = f"web/lists/getbytitle('{list_title}')/views"
-        return self._make_request("POST", endpoint, data)
+        return get_entity(self._make_request("POST", endpoint, data))
 
     # ====================
     # SEARCH
@@ -402,27 +1546,174 @@ class SharePointClient:
             start_row: Start row for paging
             row_limit: Maximum number of results
         """
+        params = self._search_params(query, select_properties, start_row, row_limit)
+        response = self._make_request("GET", "search/query", params=params)
+        result = get_entity(response)
+        return result.get("query", result)
+    
+    def search_all(self, query: str, select_properties: List[str] = None, max_results: int = 1000,
+                   page_size: int = SEARCH_PAGE_SIZE, max_workers: int = SEARCH_WORKERS) -> Dict[str, Any]:
+        """
+        Search SharePoint content and collect results across pages
+        
+        The first page reveals the total number of hits; the remaining pages,
+        up to max_results, are then fetched concurrently. Responses are parsed
+        as they are read and only the flattened rows are kept.
+        
+        Args:
+            query: Search query
+            select_properties: Properties to return in results
+            max_results: Maximum number of results to collect
+            page_size: Number of results requested per page (capped at 500)
+            max_workers: Number of pages fetched concurrently
+            
+        Returns:
+            Dictionary with 'results' (rows flattened into plain dictionaries and
+            de-duplicated by DocId or Path) and 'total_rows' as reported by the service
+        """
+        max_results = max(1, int(max_results))
+        page_size = max(1, min(int(page_size), SEARCH_PAGE_SIZE, max_results))
+        
+        def fetch_page(start_row: int) -> List[Dict[str, Any]]:
+            return self._search_page(query, select_properties, start_row, page_size)[0]
+        
+        first_page, total_rows = self._search_page(query, select_properties, 0, page_size)
+        
+        pages = [first_page]
+        start_rows = list(range(len(first_page), min(total_rows, max_results), page_size)) if first_page else []
+        if start_rows:
+            with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(start_rows)))) as executor:
+                pages.extend(executor.map(fetch_page, start_rows))
+        
+        results = []
+        seen = set()
+        for page in pages:
+            for flattened in page:
+                key = flattened.get("DocId") or flattened.get("Path")
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                results.append(flattened)
+                if len(results) >= max_results:
+                    return {"results": results, "total_rows": total_rows}
+        
+        return {"results": results, "total_rows": total_rows}
+    
+    def _search_page(self, query: str, select_properties: Optional[List[str]], start_row: int,
+                     row_limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one page of flattened search results and the total hit count, parsing rows as they are read"""
+        params = self._search_params(query, select_properties, start_row, row_limit)
+        stream = self._stream_request("GET", "search/query", SEARCH_ROWS, SEARCH_TOTAL_ROWS, params=params)
+        rows = [flatten_search_row(row) for row in stream]
+        return rows, int(stream.value(SEARCH_TOTAL_ROWS) or 0)
+    
+    @staticmethod
+    def _search_params(query: str, select_properties: Optional[List[str]], start_row: int,
+                       row_limit: int) -> Dict[str, Any]:
+        """Build the query string of a search/query request"""
         params = {
             "querytext": f"'{query}'",
             "startrow": start_row,
             "rowlimit": row_limit
         }
-        
         if select_properties:
             params["selectproperties"] = ",".join(select_properties)
-        
-        response = self._make_request("GET", "search/query", params=params)
-        return response.get("d", {}).get("query", {})
+        return params
 
     # ====================
     # FOLDERS
     # ====================
     
-    def get_folders(self, folder_path: str = "Shared Documents") -> List[Dict[str, Any]]:
-        """Get folders in a library"""
+    def get_folders(self, folder_path: str = "Shared Documents", projection: str = DEFAULT_PROJECTION,
+                    select: Optional[str] = None, expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get folders in a library
+        
+        Args:
+            folder_path: Server relative path of the parent folder
+            projection: "lean" (default field set) or "full" (whole entities)
+            select: Comma-separated fields overriding the projection's field set
+            expand: Navigation properties to expand
+        """
         endpoint = f"web/GetFolderByServerRelativeUrl('{folder_path}')/folders"
-        response = self._make_request("GET", endpoint)
-        return response.get("d", {}).get("results", [])
+        params = projection_params("folders", projection, select, expand)
+        response = self._make_request("GET", endpoint, params=params)
+        return get_results(response)
+    
+    def crawl_folder(self, folder_path: str = "Shared Documents", max_depth: Optional[int] = None,
+                     max_items: Optional[int] = None, include_files: bool = True,
+                     max_workers: int = CRAWL_WORKERS) -> Iterator[Dict[str, Any]]:
+        """
+        Walk a folder tree breadth-first and yield a flat listing
+        
+        Each folder level, with its subfolders and files, is fetched in one
+        request; sibling folders are fetched concurrently.
+        
+        Args:
+            folder_path: Server relative path of the folder to start from
+            max_depth: Deepest level to descend to, the start folder's children being depth 1 (default: no limit)
+            max_items: Stop after this many entries (default: no limit)
+            include_files: Whether files are listed, or folders only
+            max_workers: Number of folders fetched concurrently
+            
+        Yields:
+            Entries with 'type' ("folder" or "file"), 'name', 'path', 'depth', 'size'
+            (bytes for files, item count for folders) and 'modified'; a folder that could
+            not be read yields an entry with type "error"
+        """
+        remaining = int(max_items) if max_items else None
+        
+        # The start folder is read first so that a bad path raises instead of yielding an error entry
+        root = self._fetch_folder_level(folder_path)
+        
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+            pending: Deque[Tuple[int, str, Any]] = deque([(1, folder_path, root)])
+            while pending:
+                depth, path, level = pending.popleft()
+                if not isinstance(level, dict):
+                    try:
+                        level = level.result()
+                    except SharePointAPIError as e:
+                        yield {"type": "error", "path": path, "depth": depth, "error": str(e)}
+                        continue
+                
+                entries = [self._crawl_entry("folder", folder, depth) for folder in level.get("Folders", [])]
+                if include_files:
+                    entries.extend(self._crawl_entry("file", file, depth) for file in level.get("Files", []))
+                
+                for entry in entries:
+                    yield entry
+                    
+                    if remaining is not None:
+                        remaining -= 1
+                        if remaining <= 0:
+                            for _, _, future in pending:
+                                future.cancel()
+                            return
+                    
+                    if entry["type"] == "folder" and (max_depth is None or depth < int(max_depth)):
+                        future = executor.submit(self._fetch_folder_level, entry["path"])
+                        pending.append((depth + 1, entry["path"], future))
+    
+    def _fetch_folder_level(self, folder_path: str) -> Dict[str, Any]:
+        """Fetch a folder with its direct subfolders and files expanded"""
+        endpoint = f"web/GetFolderByServerRelativeUrl('{folder_path}')"
+        params = {"$expand": "Folders,Files", "$select": CRAWL_SELECT}
+        return get_entity(self._make_request("GET", endpoint, params=params))
+    
+    @staticmethod
+    def _crawl_entry(entry_type: str, data: Dict[str, Any], depth: int) -> Dict[str, Any]:
+        """Build a flat crawl listing entry from a folder or file"""
+        size = data.get("Length") if entry_type == "file" else data.get("ItemCount")
+        return {
+            "type": entry_type,
+            "name": data.get("Name"),
+            "path": data.get("ServerRelativeUrl"),
+            "depth": depth,
+            "size": int(size) if size is not None else None,
+            "modified": data.get("TimeLastModified")
+        }
     
     def create_folder(self, folder_path: str, folder_name: str) -> Dict[str, Any]:
         """Create a folder"""
@@ -431,12 +1722,12 @@ class SharePointClient:
             "ServerRelativeUrl": f"{folder_path}/{folder_name}"
         }
         endpoint = f"web/folders"
-        return self._make_request("POST", endpoint, data)
+        return get_entity(self._make_request("POST", endpoint, data))
     
     def delete_folder(self, folder_path: str) -> Dict[str, Any]:
         """Delete a folder"""
         endpoint = f"web/GetFolderByServerRelativeUrl('{folder_path}')"
-        return self._make_request("DELETE", endpoint)
+        return get_entity(self._make_request("DELETE", endpoint))
 
     # ====================
     # SITE COLLECTION
@@ -444,16 +1735,16 @@ class SharePointClient:
     
     def get_site_collection_info(self) -> Dict[str, Any]:
         """Get site collection information"""
-        return self._make_request("GET", "site")
+        return get_entity(self._make_request("GET", "site"))
     
     def get_regional_settings(self) -> Dict[str, Any]:
         """Get regional settings"""
-        return self._make_request("GET", "web/regionalsettings")
+        return get_entity(self._make_request("GET", "web/regionalsettings"))
     
     def get_features(self) -> List[Dict[str, Any]]:
         """Get activated features"""
         response = self._make_request("GET", "web/features")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
 
     # ====================
     # WORKFLOW
@@ -463,7 +1754,7 @@ class SharePointClient:
         """Get workflows (if available)"""
         try:
             response = self._make_request("GET", "web/workflowtemplates")
-            return response.get("d", {}).get("results", [])
+            return get_results(response)
         except:
             return []
     
@@ -471,7 +1762,7 @@ class SharePointClient:
         """Get workflow associations"""
         try:
             response = self._make_request("GET", "web/workflowassociations")
-            return response.get("d", {}).get("results", [])
+            return get_results(response)
         except:
             return []
 
@@ -488,7 +1779,7 @@ class SharePointClient:
         """
         endpoint = f"web/navigation/{navigation_type.lower()}"
         response = self._make_request("GET", endpoint)
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
 
     # ====================
     # RECYCLE BIN
@@ -497,46 +1788,232 @@ class SharePointClient:
     def get_recycle_bin_items(self) -> List[Dict[str, Any]]:
         """Get items in recycle bin"""
         response = self._make_request("GET", "web/recyclebin")
-        return response.get("d", {}).get("results", [])
+        return get_results(response)
     
     def restore_recycle_bin_item(self, item_id: str) -> Dict[str, Any]:
         """Restore item from recycle bin"""
         endpoint = f"web/recyclebin('{item_id}')/restore"
-        return self._make_request("POST", endpoint)
+        return get_entity(self._make_request("POST", endpoint))
 
     # ====================
     # BATCH OPERATIONS
     # ====================
     
-    def execute_batch(self, requests_batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def execute_batch(self, requests_batch: List[Dict[str, Any]],
+                      batch_size: int = MAX_BATCH_SIZE, max_workers: int = 1) -> Dict[str, Any]:
         """
-        Execute multiple requests in a batch
+        Execute multiple requests through the OData $batch endpoint
+        
+        Writes are grouped into changesets and the batch is split into several
+        $batch calls when it exceeds the service's per-batch operation limit.
         
         Args:
             requests_batch: List of request dictionaries with 'method', 'url', and optional 'data'
+                and 'headers'; supported methods are GET, POST, PUT, PATCH, MERGE and DELETE
+            batch_size: Maximum number of operations per $batch call (capped at the service limit)
+            max_workers: Number of $batch calls sent concurrently
+            
+        Returns:
+            Dictionary with 'results', one entry per request in the caller's order: the
+            normalized entity, {"results": [...]} for collections, or {"error": ..., "status": ...}
         """
-        # This is a simplified batch implementation
-        # In a full implementation, you'd use $batch endpoints
+        batch_size = max(1, min(int(batch_size), MAX_BATCH_SIZE))
+        chunks = [requests_batch[start:start + batch_size]
+                  for start in range(0, len(requests_batch), batch_size)]
+        
         results = []
-        for request in requests_batch:
-            try:
-                if request["method"].upper() == "GET":
-                    result = self._make_request("GET", request["url"])
-                elif request["method"].upper() == "POST":
-                    result = self._make_request("POST", request["url"], request.get("data"))
-                else:
-                    result = {"error": f"Unsupported method: {request['method']}"}
-                results.append(result)
-            except Exception as e:
-                results.append({"error": str(e)})
+        if max_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(int(max_workers), len(chunks))) as executor:
+                for chunk_results in executor.map(self._send_batch, chunks):
+                    results.extend(chunk_results)
+        else:
+            for chunk in chunks:
+                results.extend(self._send_batch(chunk))
         
         return {"results": results}
+    
+    def _send_batch(self, requests_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send a single $batch request and map the embedded responses back to their requests"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests_batch)
+        
+        # Unsupported methods are rejected locally and never reach the service
+        positions = []
+        for position, request in enumerate(requests_batch):
+            if request["method"].upper() in SUPPORTED_METHODS:
+                positions.append(position)
+            else:
+                results[position] = {"error": f"Unsupported method: {request['method']}"}
+        
+        operations = [requests_batch[position] for position in positions]
+        if operations:
+            headers = self._get_headers()
+            boundary, body = build_batch_body(operations, self.base_api_url, headers["Accept"])
+            headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+            
+            # A batch made only of reads can be replayed; one carrying writes cannot
+            idempotent = all(op["method"].upper() not in WRITE_METHODS for op in operations)
+            
+            try:
+                response = self._send(
+                    "POST",
+                    f"{self.base_api_url}/$batch",
+                    error_prefix="Batch request failed",
+                    idempotent=idempotent,
+                    headers=headers,
+                    data=body.encode("utf-8"),
+                    timeout=120
+                )
+            except SharePointAPIError as e:
+                operation_results = [{"error": str(e), "status": e.status_code} for _ in operations]
+            else:
+                text = response.content.decode("utf-8", errors="replace")
+                operation_results = match_batch_results(
+                    [len(group) for group in operation_groups(operations)],
+                    parse_batch_groups(text),
+                    response.status_code,
+                    text
+                )
+            
+            for position, result in zip(positions, operation_results):
+                results[position] = result
+        
+        return results
+    
+    # ====================
+    # BULK LIST ITEM OPERATIONS
+    # ====================
+    
+    def bulk_create_list_items(self, list_title: str, items: List[Dict[str, Any]],
+                               batch_size: int = MAX_BATCH_SIZE, max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Create many list items through batched requests
+        
+        Args:
+            list_title: List title
+            items: Field values of the items to create
+            batch_size: Number of items per $batch call
+            max_workers: Number of $batch calls sent concurrently
+            
+        Returns:
+            One result per item, in order, with 'index', 'success' and 'id' or 'error'
+        """
+        endpoint = f"web/lists/getbytitle('{escape_literal(list_title)}')/items"
+        entity_type = self.get_list_metadata(list_title)["entity_type"]
+        
+        operations = [
+            {"method": "POST", "url": endpoint, "data": {**item, "__metadata": {"type": entity_type}}}
+            for item in items
+        ]
+        return self._run_bulk(list_title, operations, batch_size, max_workers)
+    
+    def bulk_update_list_items(self, list_title: str, updates: List[Dict[str, Any]],
+                               batch_size: int = MAX_BATCH_SIZE, max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Update many list items through batched requests
+        
+        Args:
+            list_title: List title
+            updates: Field values to change; each entry must carry the item ID, a positive
+                integer, as 'Id' or 'ID'
+            batch_size: Number of items per $batch call
+            max_workers: Number of $batch calls sent concurrently
+            
+        Returns:
+            One result per item, in order, with 'index', 'success' and 'id' or 'error'
+        """
+        entity_type = self.get_list_metadata(list_title)["entity_type"]
+        
+        operations = []
+        for update in updates:
+            fields = dict(update)
+            item_id = fields.pop("Id", None)
+            item_id = fields.pop("ID", item_id)
+            operations.append({
+                "method": "MERGE",
+                "url": f"web/lists/getbytitle('{escape_literal(list_title)}')/items({item_id})",
+                "data": {**fields, "__metadata": {"type": entity_type}},
+                "item_id": item_id
+            })
+        return self._run_bulk(list_title, operations, batch_size, max_workers)
+    
+    def bulk_delete_list_items(self, list_title: str, item_ids: List[int],
+                               batch_size: int = MAX_BATCH_SIZE, max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Delete many list items through batched requests
+        
+        Args:
+            list_title: List title
+            item_ids: IDs of the items to delete; anything but a positive integer is
+                reported as a failed item and never sent
+            batch_size: Number of items per $batch call
+            max_workers: Number of $batch calls sent concurrently
+            
+        Returns:
+            One result per item, in order, with 'index', 'success' and 'id' or 'error'
+        """
+        operations = [
+            {
+                "method": "DELETE",
+                "url": f"web/lists/getbytitle('{escape_literal(list_title)}')/items({item_id})",
+                "item_id": item_id
+            }
+            for item_id in item_ids
+        ]
+        return self._run_bulk(list_title, operations, batch_size, max_workers)
+    
+    def _run_bulk(self, list_title: str, operations: List[Dict[str, Any]],
+                  batch_size: int, max_workers: int) -> List[Dict[str, Any]]:
+        """Run bulk item operations and report a result per item"""
+        # Updates and deletes without a valid item ID are rejected locally and never sent
+        valid = [operation["method"] == "POST" or is_item_id(operation.get("item_id")) for operation in operations]
+        batch_results = iter(self.execute_batch(
+            [operation for operation, is_valid in zip(operations, valid) if is_valid],
+            batch_size=batch_size,
+            max_workers=max_workers
+        )["results"])
+        
+        results = []
+        schema_error = False
+        for index, (operation, is_valid) in enumerate(zip(operations, valid)):
+            entry: Dict[str, Any] = {"index": index}
+            if not is_valid:
+                item_id = operation.get("item_id")
+                entry["success"] = False
+                entry["error"] = ("Item ID is required" if item_id is None
+                                  else f"Item ID must be a positive integer, got {item_id!r}")
+                results.append(entry)
+                continue
+            
+            result = next(batch_results)
+            if "error" in result:
+                entry["success"] = False
+                entry["error"] = result["error"]
+                schema_error = schema_error or result.get("status") in SCHEMA_ERROR_STATUSES
+            else:
+                entry["success"] = True
+            
+            item_id = operation.get("item_id")
+            if item_id is None and entry["success"]:
+                created = get_entity(result)
+                item_id = created.get("Id", created.get("ID"))
+            if item_id is not None:
+                entry["id"] = item_id
+            results.append(entry)
+        
+        if schema_error:
+            self.invalidate_list_metadata(list_title)
+        return results
 
 
 def validate_sharepoint_credentials(site_url: str, access_token: str) -> bool:
     """
     Validate SharePoint credentials by attempting to connect
     
+    Successful validations are cached for a few minutes per site and token,
+    so repeated validations of the same credentials skip the round trip. The
+    check retries at most once with short timeouts, so a throttled or failing
+    tenant cannot hold up validation for minutes.
+    
     Args:
         site_url: SharePoint site URL
         access_token: Bearer token
@@ -544,9 +2021,16 @@ def validate_sharepoint_credentials(site_url: str, access_token: str) -> bool:
     Returns:
         True if credentials are valid, False otherwise
     """
-    try:
-        client = SharePointClient(site_url, access_token)
-        client.get_site_info()
+    key = (site_url.rstrip('/').lower(), hashlib.sha256(access_token.encode("utf-8")).hexdigest())
+    if credential_cache.get(key):
         return True
+    
+    try:
+        client = SharePointClient(site_url, access_token, retry_policy=VALIDATION_RETRY_POLICY,
+                                  request_timeout=VALIDATION_TIMEOUT)
+        client.get_site_id()
     except Exception:
-        return False
\ No newline at end of file
+        return False
+    
+    credential_cache.set(key, True)
+    return True
\ No newline at end of file
@@ -0,0 +1,136 @@
+from typing import Any, Dict, Iterator, Tuple
+
+from utils.odata import normalize
+
+# Item paths of collection responses, in ijson prefix notation, for every metadata mode
+COLLECTION_ITEMS = ("d.results.item", "value.item")
+
+# Paths of the link to the next page of a collection
+NEXT_LINKS = ("d.__next", "odata.nextLink", "@odata.nextLink")
+
+# Result row paths of search/query responses
+SEARCH_ROWS = (
+    "d.query.PrimaryQueryResult.RelevantResults.Table.Rows.results.item",
+    "PrimaryQueryResult.RelevantResults.Table.Rows.item"
+)
+
+# Paths of the total hit count of search/query responses
+SEARCH_TOTAL_ROWS = (
+    "d.query.PrimaryQueryResult.RelevantResults.TotalRows",
+    "PrimaryQueryResult.RelevantResults.TotalRows"
+)
+
+# ijson events carrying a scalar value
+_SCALAR_EVENTS = {"string", "number", "boolean", "null"}
+
+_ijson: Any = None
+
+
+def load_ijson() -> Any:
+    """Import ijson on first use; None when it is not installed"""
+    global _ijson
+    if _ijson is None:
+        try:
+            import ijson
+        except ImportError:
+            ijson = False
+        _ijson = ijson
+    return _ijson or None
+
+
+def streaming_available() -> bool:
+    """
+    Check whether responses can be parsed incrementally (ijson is installed)
+
+    Callers switch to their buffered paging path when it is not: parsing a
+    whole body through JsonStream's fallback would only add overhead.
+    """
+    return load_ijson() is not None
+
+
+def _find(value: Any, path: str) -> Iterator[Any]:
+    """Yield the values at an ijson prefix path in a parsed document"""
+    if not path:
+        yield value
+    elif isinstance(value, list):
+        if path == "item" or path.startswith("item."):
+            for element in value:
+                yield from _find(element, path[len("item."):])
+    elif isinstance(value, dict):
+        # Keys may contain dots themselves (odata.nextLink)
+        for key in value:
+            if path == key or path.startswith(f"{key}."):
+                yield from _find(value[key], path[len(key) + 1:])
+
+
+class JsonStream:
+    """
+    Incremental parser of a JSON response body
+
+    Iterating yields the objects found at the item paths one by one, each
+    normalized as get_results would, while they are read from the socket;
+    only the object being built is held in memory. Scalars found at the
+    value paths, such as next links or totals, are collected in 'values'
+    along the way, and are complete once iteration has finished.
+
+    Without ijson the body is parsed in one go and walked instead, so
+    callers behave the same either way, only with a higher peak memory.
+    """
+
+    def __init__(self, response: Any, item_paths: Tuple[str, ...], value_paths: Tuple[str, ...] = ()):
+        """
+        Initialize stream
+
+        Args:
+            response: Streamed requests response (sent with stream=True)
+            item_paths: Paths of the objects to yield, in ijson prefix notation
+            value_paths: Paths of scalar values to collect
+        """
+        self.response = response
+        self.item_paths = set(item_paths)
+        self.value_paths = set(value_paths)
+        self.values: Dict[str, Any] = {}
+
+    def value(self, paths: Tuple[str, ...]) -> Any:
+        """Get the first collected value found at one of the paths"""
+        for path in paths:
+            if self.values.get(path) is not None:
+                return self.values[path]
+        return None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            ijson = load_ijson()
+            if ijson is None:
+                yield from self._iter_parsed()
+            else:
+                yield from self._iter_events(ijson)
+        finally:
+            # Returns the connection to the pool, or drops it if the body was not read to the end
+            self.response.close()
+
+    def _iter_events(self, ijson: Any) -> Iterator[Dict[str, Any]]:
+        self.response.raw.decode_content = True
+        builder = None
+        item_path = None
+        for prefix, event, value in ijson.parse(self.response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_path and event in ("end_map", "end_array"):
+                    yield normalize(builder.value)
+                    builder = None
+            elif prefix in self.item_paths and event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                item_path = prefix
+            elif prefix in self.value_paths and event in _SCALAR_EVENTS:
+                self.values[prefix] = value
+
+    def _iter_parsed(self) -> Iterator[Dict[str, Any]]:
+        payload = self.response.json() if self.response.content else {}
+        for path in self.value_paths:
+            for value in _find(payload, path):
+                self.values[path] = value
+        for path in self.item_paths:
+            for item in _find(payload, path):
+                yield normalize(item)
@@ -0,0 +1,74 @@
+import posixpath
+import re
+import zipfile
+from typing import BinaryIO, List
+from xml.etree import ElementTree
+
+# Plain text formats indexed as is
+TEXT_EXTENSIONS = {".txt", ".md", ".csv", ".tsv", ".json", ".xml", ".yaml", ".yml", ".log", ".html", ".htm"}
+
+# Office Open XML formats: archive parts holding the document text
+OOXML_PARTS = {
+    ".docx": re.compile(r"^word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$"),
+    ".pptx": re.compile(r"^ppt/(slides/slide|notesSlides/notesSlide)\d+\.xml$"),
+    ".xlsx": re.compile(r"^xl/sharedStrings\.xml$")
+}
+
+# Longest text kept per document
+MAX_TEXT_CHARS = 1_000_000
+
+_TAGS = re.compile(r"<[^>]+>")
+_SCRIPTS = re.compile(r"<(script|style)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+
+
+def is_extractable(file_name: str) -> bool:
+    """Check whether text can be extracted from a file, based on its extension"""
+    extension = posixpath.splitext(file_name)[1].lower()
+    return extension in TEXT_EXTENSIONS or extension in OOXML_PARTS
+
+
+def extract_text(file_name: str, content: BinaryIO, max_chars: int = MAX_TEXT_CHARS) -> str:
+    """
+    Extract the text of a document
+
+    Args:
+        file_name: File name, used to pick the format
+        content: Seekable binary file object positioned at the start of the file
+        max_chars: Truncate the text to this many characters
+
+    Returns:
+        Extracted text; empty for unsupported formats
+    """
+    extension = posixpath.splitext(file_name)[1].lower()
+
+    if extension in OOXML_PARTS:
+        return _extract_ooxml(content, OOXML_PARTS[extension], max_chars)
+
+    if extension in TEXT_EXTENSIONS:
+        text = content.read(max_chars * 4).decode("utf-8", errors="replace")
+        if extension in (".html", ".htm", ".xml"):
+            text = _TAGS.sub(" ", _SCRIPTS.sub(" ", text))
+        return text[:max_chars]
+
+    return ""
+
+
+def _extract_ooxml(content: BinaryIO, parts: "re.Pattern[str]", max_chars: int) -> str:
+    """Collect the text runs of the matching parts of an Office Open XML archive"""
+    chunks: List[str] = []
+    length = 0
+    with zipfile.ZipFile(content) as archive:
+        for name in sorted(name for name in archive.namelist() if parts.match(name)):
+            with archive.open(name) as part:
+                for _, element in ElementTree.iterparse(part):
+                    # Text runs are <w:t> (Word), <a:t> (PowerPoint) and <t> (Excel shared strings)
+                    tag = element.tag.rsplit("}", 1)[-1]
+                    if tag == "t" and element.text:
+                        chunks.append(element.text)
+                        length += len(element.text)
+                    elif tag in ("p", "si"):
+                        chunks.append("\n")
+                    element.clear()
+                    if length >= max_chars:
+                        return "".join(chunks)[:max_chars]
+    return "".join(chunks)